@@ -49,6 +49,17 @@ setup(
             "sphinx>=5.0.0",
             "sphinx-rtd-theme>=1.0.0",
         ],
+        "parallel": [
+            "dask-geopandas>=0.3.0",
+        ],
+        "speedups": [
+            "numba>=0.57.0",
+            "orjson>=3.9.0",
+            "diskcache>=5.6.0",
+        ],
+        "export": [
+            "kaleido>=0.2.1",
+        ],
         "notebooks": [
             "jupyter>=1.0.0",
             "ipykernel>=6.0.0",
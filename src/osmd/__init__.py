@@ -7,10 +7,18 @@ __version__ = "1.0.0"
 __author__ = "Data Scientist"
 __email__ = "analyst@example.com"
 
-from .data import OSMDataCollector, DataProcessor
-from .analysis import UrbanGrowthAnalyzer
-from .visualization import MapVisualizer, DashboardApp
-from .utils import ConfigManager, Logger
+import importlib
+
+# Public classes and the subpackage providing each; imported lazily by __getattr__
+_LAZY_IMPORTS = {
+    "OSMDataCollector": ".data",
+    "DataProcessor": ".data",
+    "UrbanGrowthAnalyzer": ".analysis",
+    "MapVisualizer": ".visualization",
+    "DashboardApp": ".visualization",
+    "ConfigManager": ".utils",
+    "Logger": ".utils"
+}
 
 __all__ = [
     "OSMDataCollector",
@@ -21,3 +29,10 @@ __all__ = [
     "ConfigManager",
     "Logger"
 ]
+
+
+def __getattr__(name):
+    """Import public classes on first access, so importing the package stays light."""
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -28,7 +28,11 @@ class UrbanGrowthAnalyzer:
         
         # Initialize components
         self.data_collector = OSMDataCollector(self.config)
-        self.data_processor = DataProcessor()
+        processing_config = self.config.get_processing_config()
+        self.data_processor = DataProcessor(
+            n_workers=processing_config.get('parallel_workers'),
+            chunk_size=processing_config.get('chunk_size', 10000)
+        )
         self.growth_metrics = GrowthMetrics()
         self.spatial_analyzer = SpatialAnalyzer()
         
@@ -91,16 +95,20 @@ class UrbanGrowthAnalyzer:
         total_time = time.time() - start_time
         self.logger.log_processing_step("complete urban growth analysis", total_time)
         
+        data_summary = self._generate_data_summary(historical_data)
+        
         # Combine all results
         comprehensive_results = {
             'metadata': {
                 'bbox': bbox.to_tuple(),
                 'years': years,
+                'year_range': (min(years), max(years)),
                 'features': features,
+                'total_features': data_summary['total_features'],
                 'analysis_date': pd.Timestamp.now().isoformat(),
                 'processing_time_seconds': total_time
             },
-            'data_summary': self._generate_data_summary(historical_data),
+            'data_summary': data_summary,
             'quantitative_analysis': analysis_results,
             'spatial_analysis': spatial_results,
             'processed_data': processed_data  # Include for visualization
@@ -307,7 +315,8 @@ class UrbanGrowthAnalyzer:
         """
         summary = {
             'years_analyzed': sorted(historical_data.keys()),
-            'data_by_year': {}
+            'data_by_year': {},
+            'total_features': 0
         }
         
         for year, data in historical_data.items():
@@ -325,6 +334,7 @@ class UrbanGrowthAnalyzer:
                         year_summary['feature_tags'][tag] = tag_counts
             
             summary['data_by_year'][year] = year_summary
+            summary['total_features'] += year_summary['total_features']
         
         return summary
     
@@ -8,7 +8,7 @@ from shapely.geometry import Polygon, Point
 from shapely.ops import unary_union
 import math
 
-from ..utils import calculate_area, calculate_building_density, calculate_road_density
+from ..utils import calculate_areas_bulk, calculate_building_density, calculate_road_density
 
 
 class GrowthMetrics:
@@ -58,7 +58,7 @@ class GrowthMetrics:
                 # Calculate areas if not present
                 if 'area_m2' not in buildings.columns:
                     buildings = buildings.copy()
-                    buildings['area_m2'] = buildings.geometry.apply(calculate_area)
+                    buildings['area_m2'] = calculate_areas_bulk(buildings)
                 
                 metrics['total_area_m2'][year] = buildings['area_m2'].sum()
                 metrics['average_building_size_m2'][year] = buildings['area_m2'].mean()
@@ -147,12 +147,13 @@ class GrowthMetrics:
                 metrics['total_length_km'][year] = total_length_m / 1000
                 
                 # Road type distribution
+                # (categorical columns also report unobserved categories, so drop zeros)
                 if 'highway' in roads.columns:
-                    type_counts = roads['highway'].value_counts().to_dict()
-                    metrics['road_types'][year] = type_counts
+                    type_counts = roads['highway'].value_counts()
+                    metrics['road_types'][year] = type_counts[type_counts > 0].to_dict()
                 elif 'road_class' in roads.columns:
-                    type_counts = roads['road_class'].value_counts().to_dict()
-                    metrics['road_types'][year] = type_counts
+                    type_counts = roads['road_class'].value_counts()
+                    metrics['road_types'][year] = type_counts[type_counts > 0].to_dict()
                 else:
                     metrics['road_types'][year] = {'unknown': len(roads)}
         
@@ -220,13 +221,13 @@ class GrowthMetrics:
                 # Calculate areas if not present
                 if 'area_m2' not in landuse.columns:
                     landuse = landuse.copy()
-                    landuse['area_m2'] = landuse.geometry.apply(calculate_area)
+                    landuse['area_m2'] = calculate_areas_bulk(landuse)
                 
                 # Group by landuse category
                 landuse_col = 'landuse_category' if 'landuse_category' in landuse.columns else 'landuse'
                 
                 if landuse_col in landuse.columns:
-                    area_by_type = landuse.groupby(landuse_col)['area_m2'].sum().to_dict()
+                    area_by_type = landuse.groupby(landuse_col, observed=True)['area_m2'].sum().to_dict()
                     total_area = sum(area_by_type.values())
                     
                     metrics['landuse_areas_m2'][year] = area_by_type
@@ -4,12 +4,54 @@ import os
 import json
 import pickle
 import hashlib
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List
 from datetime import datetime, timedelta
 import geopandas as gpd
 
 
+class LazyGeoDataFrames(Mapping):
+    """
+    Read-only year -> GeoDataFrame mapping that reads cached Parquet files on access.
+    
+    Layers are not kept after they are returned, so results offloaded to disk
+    stay there; callers hold on to the layers they actually use.
+    """
+    
+    def __init__(self, cache: 'CacheManager', results_key: str, 
+                 feature_type: str, layout: Dict[int, bool]):
+        """
+        Initialize lazy mapping.
+        
+        Args:
+            cache: Cache manager holding the results bundle
+            results_key: Unique identifier of the results bundle
+            feature_type: Feature type of the GeoDataFrames
+            layout: Whether a non-empty GeoDataFrame was stored, by year
+        """
+        self._cache = cache
+        self._results_key = results_key
+        self._feature_type = feature_type
+        self._layout = layout
+    
+    def __getitem__(self, year: int) -> gpd.GeoDataFrame:
+        if not self._layout[year]:
+            return gpd.GeoDataFrame()
+        path = self._cache._results_layer_path(self._results_key, self._feature_type, year)
+        return gpd.read_parquet(path)
+    
+    def non_empty_years(self) -> List[int]:
+        """Sorted years with a non-empty GeoDataFrame, without reading any layer."""
+        return sorted(year for year, stored in self._layout.items() if stored)
+    
+    def __iter__(self):
+        return iter(self._layout)
+    
+    def __len__(self) -> int:
+        return len(self._layout)
+
+
 class CacheManager:
     """Manages caching of OSM data and analysis results."""
     
@@ -227,6 +269,73 @@ class CacheManager:
         except Exception as e:
             print(f"Error saving analysis results to cache: {e}")
     
+    def _results_layer_path(self, results_key: str, feature_type: str, year: int) -> Path:
+        """Path of one processed GeoDataFrame of a results bundle."""
+        return self._get_cache_path("analysis_results", f"{results_key}__{feature_type}__{year}", "parquet")
+    
+    def save_results_bundle(self, results: Dict[str, Any], results_key: str) -> None:
+        """
+        Save complete analysis results, including processed data, to cache.
+        
+        Processed GeoDataFrames are written as one Parquet file per feature type
+        and year; everything else is pickled. The pickle is written last, so its
+        presence marks a complete bundle.
+        
+        Args:
+            results: Analysis results dictionary with 'processed_data'
+            results_key: Unique identifier for the analysis parameters
+        """
+        bundle = {k: v for k, v in results.items() if k != 'processed_data'}
+        bundle['processed_layout'] = {}
+        
+        try:
+            for feature_type, feature_data in results.get('processed_data', {}).items():
+                layout = bundle['processed_layout'][feature_type] = {}
+                for year, gdf in feature_data.items():
+                    # Empty frames may lack a geometry column, so they are not written
+                    layout[year] = not gdf.empty
+                    if layout[year]:
+                        gdf.to_parquet(self._results_layer_path(results_key, feature_type, year))
+            
+            with open(self._get_cache_path("analysis_results", results_key, "pkl"), 'wb') as f:
+                pickle.dump(bundle, f)
+        except Exception as e:
+            print(f"Error saving results bundle to cache: {e}")
+    
+    def get_results_bundle(self, results_key: str, 
+                           lazy: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get complete cached analysis results, including processed data.
+        
+        Args:
+            results_key: Unique identifier for the analysis parameters
+            lazy: Read processed GeoDataFrames only when they are first accessed
+            
+        Returns:
+            Results dictionary or None if not found/expired
+        """
+        cache_path = self._get_cache_path("analysis_results", results_key, "pkl")
+        
+        if self._is_cache_valid(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    bundle = pickle.load(f)
+                
+                processed_data = {
+                    feature_type: LazyGeoDataFrames(self, results_key, feature_type, layout)
+                    for feature_type, layout in bundle.pop('processed_layout').items()
+                }
+                if not lazy:
+                    processed_data = {k: dict(v) for k, v in processed_data.items()}
+                
+                bundle['processed_data'] = processed_data
+                return bundle
+            except Exception as e:
+                print(f"Error loading results bundle from cache: {e}")
+                cache_path.unlink(missing_ok=True)
+        
+        return None
+    
     def clear_cache(self, cache_type: Optional[str] = None) -> int:
         """
         Clear cache files.
@@ -1,24 +1,361 @@
 """Data processing module for cleaning and preparing OSM data for analysis."""
 
+import os
+import math
 import pandas as pd
 import geopandas as gpd
-from typing import Dict, List, Optional, Tuple, Any
+import shapely
+from typing import Dict, Optional, Tuple, Any
 from shapely.geometry import Point, LineString, Polygon
 from shapely.ops import unary_union
 import numpy as np
 
 from ..utils import (
-    Logger, normalize_osm_tags, calculate_area, 
-    classify_building_types, create_analysis_grid
+    Logger, classify_building_types, create_analysis_grid
 )
 
+try:
+    import dask
+    import dask_geopandas
+except ImportError:  # Optional dependency, processing falls back to a single core
+    dask_geopandas = None
+
+
+# shapely.get_type_id codes and the geometry type names they stand for
+GEOMETRY_TYPE_POLYGON = 3
+GEOMETRY_TYPE_NAMES = {
+    0: 'Point',
+    1: 'LineString',
+    2: 'LinearRing',
+    3: 'Polygon',
+    4: 'MultiPoint',
+    5: 'MultiLineString',
+    6: 'MultiPolygon',
+    7: 'GeometryCollection'
+}
+
+
+def _to_utm(geometries: gpd.GeoSeries) -> gpd.GeoSeries:
+    """Project geometries to their local UTM zone (unprojected data is assumed WGS84)."""
+    if geometries.crs is None:
+        geometries = geometries.set_crs('EPSG:4326')
+    if geometries.crs.is_projected or geometries.empty:
+        return geometries
+    return geometries.to_crs(geometries.estimate_utm_crs())
+
+
+# Storage dtypes for the derived numeric columns
+NUMERIC_DTYPES = {
+    'area_m2': np.float32,
+    'floor_area_m2': np.float32,
+    'length_m': np.float32,
+    'levels': np.float32
+}
+
+
+def _classify(values: pd.Series, classes: Dict[str, str],
+              dtype: pd.CategoricalDtype, default: str = 'other') -> pd.Categorical:
+    """
+    Map a tag column onto a categorical class dtype.
+    
+    The mapping is resolved once per tag category and applied to the rows as
+    a single gather over the category codes; missing values get the default.
+    """
+    values = values.astype('category')
+    labels = [classes.get(category, default) for category in values.cat.categories]
+    # The trailing default doubles as the target of the -1 (missing) code
+    class_codes = dtype.categories.get_indexer(labels + [default])
+    return pd.Categorical.from_codes(class_codes[values.cat.codes.to_numpy()], dtype=dtype)
+
+
+def _parse_levels(values: pd.Series, default: float = 1.0) -> np.ndarray:
+    """
+    Parse building:levels tags into a float32 array.
+    
+    Level tags are short, highly repeated numerals, so each distinct value is
+    parsed once and gathered back; unparseable or missing values get the default.
+    """
+    def parse(value) -> float:
+        try:
+            level = float(value)
+        except (TypeError, ValueError):
+            return default
+        return level if math.isfinite(level) else default
+    
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    parsed = np.fromiter((parse(value) for value in uniques), dtype=np.float32, count=len(uniques))
+    return parsed[codes]
+
+
+def _downcast(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """Store the derived numeric columns with their compact dtypes (in place)."""
+    for col, dtype in NUMERIC_DTYPES.items():
+        if col in gdf.columns:
+            gdf[col] = gdf[col].astype(dtype)
+    return gdf
+
+
+# Common variations of tag values, applied after lowercasing
+TAG_VALUE_REPLACEMENTS = {
+    'building': {
+        'true': 'yes',
+        '1': 'yes',
+        'nan': None
+    },
+    'highway': {
+        'road': 'unclassified',
+        'street': 'unclassified',
+        'nan': None
+    }
+}
+
+# Low-cardinality key tags stored as categoricals after normalization
+CATEGORICAL_TAG_COLUMNS = ('building', 'highway', 'landuse')
+
+# Road classification by highway tag
+ROAD_CLASSES = {
+    'motorway': 'major',
+    'trunk': 'major', 
+    'primary': 'major',
+    'secondary': 'arterial',
+    'tertiary': 'arterial',
+    'residential': 'local',
+    'service': 'service',
+    'track': 'track',
+    'footway': 'pedestrian',
+    'cycleway': 'bicycle'
+}
+ROAD_CLASS_DTYPE = pd.CategoricalDtype(sorted(set(ROAD_CLASSES.values()) | {'other'}))
+
+# Landuse classification by landuse tag
+LANDUSE_CATEGORIES = {
+    'residential': 'residential',
+    'commercial': 'commercial', 
+    'industrial': 'industrial',
+    'retail': 'commercial',
+    'forest': 'natural',
+    'farmland': 'agricultural',
+    'grass': 'natural',
+    'meadow': 'natural',
+    'park': 'recreational',
+    'playground': 'recreational',
+    'cemetery': 'other',
+    'construction': 'construction'
+}
+LANDUSE_CATEGORY_DTYPE = pd.CategoricalDtype(sorted(set(LANDUSE_CATEGORIES.values()) | {'other'}))
+
 
 class DataProcessor:
     """Processes and cleans OSM data for urban growth analysis."""
     
-    def __init__(self):
-        """Initialize data processor."""
+    def __init__(self, n_workers: Optional[int] = None, chunk_size: int = 10000):
+        """
+        Initialize data processor.
+        
+        Args:
+            n_workers: Number of parallel workers (defaults to CPU count)
+            chunk_size: Minimum number of features per parallel partition
+        """
         self.logger = Logger("DataProcessor")
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+    
+    def _process_partition(self, gdf: gpd.GeoDataFrame,
+                           min_area_m2: Optional[float] = None,
+                           max_area_m2: Optional[float] = None,
+                           min_length_m: Optional[float] = None) -> gpd.GeoDataFrame:
+        """
+        Run the row-local cleaning steps on a single partition.
+        
+        Validity, area and length filters are combined into one mask so the
+        partition is copied once, and tags are normalized on that copy in place.
+        """
+        if gdf.empty:
+            return gdf
+        
+        original_count = len(gdf)
+        geoms, keep, repaired = self._geometry_mask(gdf)
+        
+        if min_area_m2 is not None:
+            candidates = np.flatnonzero(keep)
+            keep[candidates] = self._area_mask(
+                gpd.GeoSeries(geoms[candidates], crs=gdf.crs), min_area_m2, max_area_m2
+            )
+        
+        lengths = None
+        if min_length_m is not None:
+            candidates = np.flatnonzero(keep)
+            lengths = np.zeros(original_count)
+            lengths[candidates] = shapely.length(
+                _to_utm(gpd.GeoSeries(geoms[candidates], crs=gdf.crs)).to_numpy()
+            )
+            keep &= lengths >= min_length_m
+        
+        # take() returns a fresh frame, so no extra defensive copy is needed
+        rows = np.flatnonzero(keep)
+        processed = gdf.take(rows)
+        if repaired:
+            processed[processed.geometry.name] = geoms[rows]
+        if lengths is not None:
+            processed['length_m'] = lengths[rows]
+        
+        self._normalize_tags_inplace(processed)
+        
+        removed_count = original_count - len(processed)
+        if removed_count > 0:
+            self.logger.info(f"Removed {removed_count} invalid or filtered features")
+        
+        return processed
+    
+    def _process_partitioned(self, gdf: gpd.GeoDataFrame,
+                             min_area_m2: Optional[float] = None,
+                             max_area_m2: Optional[float] = None,
+                             min_length_m: Optional[float] = None) -> gpd.GeoDataFrame:
+        """
+        Run the row-local cleaning steps, in parallel when dask-geopandas is available.
+        
+        Steps that need a global view of the data (duplicate removal) must run
+        on the computed result.
+        
+        Args:
+            gdf: Input GeoDataFrame
+            min_area_m2: Optional minimum area filter in square meters
+            max_area_m2: Optional maximum area filter in square meters
+            min_length_m: Optional minimum length filter in meters (adds 'length_m')
+            
+        Returns:
+            Cleaned GeoDataFrame
+        """
+        npartitions = min(self.n_workers, math.ceil(len(gdf) / self.chunk_size))
+        if dask_geopandas is None or npartitions <= 1:
+            return self._process_partition(gdf, min_area_m2, max_area_m2, min_length_m)
+        
+        # Keep object columns as they are; dask would otherwise convert them to
+        # pyarrow strings and the output would depend on which path ran
+        with dask.config.set({'dataframe.convert-string': False}):
+            meta = self._process_partition(gdf.head(1), min_area_m2, max_area_m2, min_length_m).iloc[:0]
+            ddf = dask_geopandas.from_geopandas(gdf, npartitions=npartitions)
+            processed = ddf.map_partitions(
+                self._process_partition, min_area_m2, max_area_m2, min_length_m, meta=meta
+            )
+            return processed.compute(scheduler='threads', num_workers=self.n_workers)
+    
+    def _geometry_mask(self, gdf: gpd.GeoDataFrame) -> Tuple[np.ndarray, np.ndarray, bool]:
+        """
+        Repair invalid geometries and flag the usable ones.
+        
+        Args:
+            gdf: Input GeoDataFrame
+            
+        Returns:
+            Tuple of (geometry array with repairs applied, boolean keep mask,
+            whether any geometry was repaired)
+        """
+        geoms = gdf.geometry.to_numpy()
+        missing = shapely.is_missing(geoms)
+        
+        # Repair only the invalid geometries (most OSM features are already valid)
+        invalid = ~missing & ~shapely.is_valid(geoms)
+        repaired = bool(invalid.any())
+        if repaired:
+            try:
+                geoms = geoms.copy()
+                geoms[invalid] = shapely.make_valid(geoms[invalid])
+            except Exception as e:
+                self.logger.warning(f"Error fixing geometries: {e}")
+        
+        # Drop null, empty and still-invalid geometries in a single pass
+        keep = ~missing & ~shapely.is_empty(geoms) & shapely.is_valid(geoms)
+        
+        return geoms, keep, repaired
+    
+    def _area_mask(self, geometries: gpd.GeoSeries,
+                   min_area_m2: float,
+                   max_area_m2: Optional[float] = None) -> np.ndarray:
+        """
+        Flag features passing the area filter (non-polygon features always pass).
+        
+        Args:
+            geometries: Input geometries
+            min_area_m2: Minimum area in square meters
+            max_area_m2: Optional maximum area in square meters
+            
+        Returns:
+            Boolean keep mask
+        """
+        # Only apply to polygon geometries
+        polygon_mask = shapely.get_type_id(geometries.to_numpy()) == GEOMETRY_TYPE_POLYGON
+        if not polygon_mask.any():
+            return np.ones(len(geometries), dtype=bool)
+        
+        # Calculate areas in a single projected pass
+        areas = np.zeros(len(geometries))
+        areas[polygon_mask] = shapely.area(_to_utm(geometries[polygon_mask]).to_numpy())
+        
+        # Apply filters
+        area_filter = areas >= min_area_m2
+        if max_area_m2:
+            area_filter &= (areas <= max_area_m2)
+        
+        return ~polygon_mask | area_filter
+    
+    def _duplicate_mask(self, gdf: gpd.GeoDataFrame, tolerance_m: float) -> np.ndarray:
+        """
+        Flag the features to keep when removing spatial duplicates.
+        
+        Two features are duplicates when their geometries are near-identical:
+        the Hausdorff distance between them, in the local UTM projection, is
+        within the tolerance. Neighbouring or touching features (adjacent
+        buildings, connected road segments) are not duplicates.
+        
+        Args:
+            gdf: Input GeoDataFrame
+            tolerance_m: Maximum Hausdorff distance between duplicates (meters)
+            
+        Returns:
+            Boolean keep mask
+        """
+        geoms = _to_utm(gdf.geometry).to_numpy()
+        
+        # Candidate pairs lie within the tolerance of each other; each pair once
+        left, right = shapely.STRtree(geoms).query(geoms, predicate='dwithin', distance=tolerance_m)
+        pairs = left < right
+        left, right = left[pairs], right[pairs]
+        
+        duplicates = shapely.hausdorff_distance(geoms[left], geoms[right]) <= tolerance_m
+        left, right = left[duplicates], right[duplicates]
+        
+        # Of each duplicate pair, drop the one with fewer attributes (the later one on ties)
+        scores = gdf.count(axis=1).to_numpy()
+        keep = np.ones(len(gdf), dtype=bool)
+        keep[np.where(scores[left] >= scores[right], right, left)] = False
+        
+        return keep
+    
+    def _normalize_tags_inplace(self, gdf: gpd.GeoDataFrame) -> None:
+        """Normalize OSM tag columns of gdf in place."""
+        # Get all tag columns (exclude geometry and metadata columns)
+        metadata_cols = {'osm_id', 'osm_type', 'geometry', 'length_m'}
+        tag_columns = [col for col in gdf.columns if col not in metadata_cols]
+        
+        # Normalize each tag column. OSM tag values are highly repetitive, so
+        # lower/strip/replace run once per unique value and are gathered back.
+        # Missing values (None, NaN, pd.NA) get code -1 and stay missing
+        for col in tag_columns:
+            codes, uniques = pd.factorize(gdf[col])
+            values = pd.Index(uniques, dtype=object).astype(str).str.lower().str.strip().to_numpy(dtype=object)
+            
+            # Handle common variations
+            replacements = TAG_VALUE_REPLACEMENTS.get(col)
+            if replacements:
+                values = np.array([replacements.get(v, v) for v in values], dtype=object)
+            
+            if col in CATEGORICAL_TAG_COLUMNS:
+                # Store as int codes over the (deduplicated) normalized values
+                value_codes, categories = pd.factorize(values)
+                gdf[col] = pd.Categorical.from_codes(np.append(value_codes, -1)[codes], categories)
+            else:
+                gdf[col] = np.append(values, np.nan)[codes]
     
     def clean_geometries(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         """
@@ -34,21 +371,11 @@ class DataProcessor:
             return gdf
         
         original_count = len(gdf)
+        geoms, keep, repaired = self._geometry_mask(gdf)
         
-        # Remove invalid geometries
-        gdf = gdf[gdf.geometry.is_valid].copy()
-        
-        # Remove empty geometries
-        gdf = gdf[~gdf.geometry.is_empty].copy()
-        
-        # Remove null geometries
-        gdf = gdf[gdf.geometry.notna()].copy()
-        
-        # Fix any remaining geometry issues
-        try:
-            gdf['geometry'] = gdf.geometry.buffer(0)  # Fix self-intersections
-        except Exception as e:
-            self.logger.warning(f"Error fixing geometries: {e}")
+        gdf = gdf.loc[keep].copy()
+        if repaired:
+            gdf[gdf.geometry.name] = geoms[keep]
         
         cleaned_count = len(gdf)
         removed_count = original_count - cleaned_count
@@ -72,29 +399,7 @@ class DataProcessor:
             return gdf
         
         normalized_gdf = gdf.copy()
-        
-        # Get all tag columns (exclude geometry and metadata columns)
-        metadata_cols = {'osm_id', 'osm_type', 'geometry'}
-        tag_columns = [col for col in gdf.columns if col not in metadata_cols]
-        
-        # Normalize each tag column
-        for col in tag_columns:
-            if col in normalized_gdf.columns:
-                normalized_gdf[col] = normalized_gdf[col].astype(str).str.lower().str.strip()
-                
-                # Handle common variations
-                if col == 'building':
-                    normalized_gdf[col] = normalized_gdf[col].replace({
-                        'true': 'yes',
-                        '1': 'yes',
-                        'nan': None
-                    })
-                elif col == 'highway':
-                    normalized_gdf[col] = normalized_gdf[col].replace({
-                        'road': 'unclassified',
-                        'street': 'unclassified',
-                        'nan': None
-                    })
+        self._normalize_tags_inplace(normalized_gdf)
         
         return normalized_gdf
     
@@ -115,38 +420,24 @@ class DataProcessor:
         if gdf.empty:
             return gdf
         
-        # Only apply to polygon geometries
-        polygon_mask = gdf.geometry.type == 'Polygon'
-        if not polygon_mask.any():
-            return gdf
-        
-        # Calculate areas
-        areas = gdf.loc[polygon_mask, 'geometry'].apply(calculate_area)
-        
-        # Apply filters
-        area_filter = areas >= min_area_m2
-        if max_area_m2:
-            area_filter &= (areas <= max_area_m2)
+        keep = self._area_mask(gdf.geometry, min_area_m2, max_area_m2)
         
-        # Create filtered dataframe
-        filtered_gdf = gdf.copy()
-        filtered_gdf.loc[polygon_mask & ~area_filter, 'geometry'] = None
-        filtered_gdf = filtered_gdf.dropna(subset=['geometry'])
+        removed_count = int((~keep).sum())
+        if removed_count == 0:
+            return gdf
         
-        removed_count = polygon_mask.sum() - len(filtered_gdf[filtered_gdf.geometry.type == 'Polygon'])
-        if removed_count > 0:
-            self.logger.info(f"Filtered out {removed_count} features by area")
+        self.logger.info(f"Filtered out {removed_count} features by area")
         
-        return filtered_gdf
+        return gdf.iloc[keep].copy()
     
     def remove_duplicates(self, gdf: gpd.GeoDataFrame, 
-                         tolerance: float = 0.001) -> gpd.GeoDataFrame:
+                         tolerance_m: float = 1.0) -> gpd.GeoDataFrame:
         """
-        Remove duplicate geometries based on spatial proximity.
+        Remove near-identical duplicate geometries.
         
         Args:
             gdf: Input GeoDataFrame
-            tolerance: Spatial tolerance for duplicate detection (degrees)
+            tolerance_m: Maximum Hausdorff distance between duplicates (meters)
             
         Returns:
             GeoDataFrame with duplicates removed
@@ -154,45 +445,19 @@ class DataProcessor:
         if gdf.empty or len(gdf) <= 1:
             return gdf
         
-        original_count = len(gdf)
-        
-        # Create spatial index for efficient querying
         try:
-            # Simple approach: buffer geometries and check for overlaps
-            buffered = gdf.geometry.buffer(tolerance)
-            
-            # Find overlapping geometries
-            duplicates = set()
-            
-            for i in range(len(gdf)):
-                if i in duplicates:
-                    continue
-                    
-                for j in range(i + 1, len(gdf)):
-                    if j in duplicates:
-                        continue
-                    
-                    if buffered.iloc[i].intersects(buffered.iloc[j]):
-                        # Keep the one with more attributes or the first one
-                        if gdf.iloc[i].count() >= gdf.iloc[j].count():
-                            duplicates.add(j)
-                        else:
-                            duplicates.add(i)
-                            break
-            
-            # Remove duplicates
-            keep_indices = [i for i in range(len(gdf)) if i not in duplicates]
-            deduplicated_gdf = gdf.iloc[keep_indices].copy()
-            
-            removed_count = original_count - len(deduplicated_gdf)
-            if removed_count > 0:
-                self.logger.info(f"Removed {removed_count} duplicate features")
-            
-            return deduplicated_gdf
-            
+            keep = self._duplicate_mask(gdf, tolerance_m)
         except Exception as e:
             self.logger.warning(f"Error removing duplicates: {e}")
             return gdf
+        
+        removed_count = int((~keep).sum())
+        if removed_count == 0:
+            return gdf
+        
+        self.logger.info(f"Removed {removed_count} duplicate features")
+        
+        return gdf.iloc[keep].copy()
     
     def process_buildings(self, buildings_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         """
@@ -209,38 +474,38 @@ class DataProcessor:
         
         self.logger.info(f"Processing {len(buildings_gdf)} buildings")
         
-        # Clean geometries
-        processed = self.clean_geometries(buildings_gdf)
-        
-        # Normalize tags
-        processed = self.normalize_tags(processed)
-        
-        # Filter by minimum area (remove very small buildings, likely errors)
-        processed = self.filter_by_area(processed, min_area_m2=10.0, max_area_m2=1_000_000.0)
+        # Clean geometries, normalize tags and filter by area (remove very
+        # small buildings, likely errors)
+        processed = self._process_partitioned(
+            buildings_gdf, min_area_m2=10.0, max_area_m2=1_000_000.0
+        )
         
         # Remove duplicates
         processed = self.remove_duplicates(processed)
         
-        # Classify building types
-        processed = classify_building_types(processed)
-        
-        # Calculate building areas
-        processed['area_m2'] = processed.geometry.apply(calculate_area)
+        # Classify building types (processed is already our own frame)
+        processed = classify_building_types(processed, copy=False)
         
         # Estimate building levels if not present
         if 'building:levels' not in processed.columns:
             processed['building:levels'] = None
         
-        # Convert levels to numeric, estimate if missing
-        processed['levels'] = pd.to_numeric(processed['building:levels'], errors='coerce')
-        processed['levels'] = processed['levels'].fillna(1)  # Default to 1 level
+        # Derive the numeric columns as plain arrays and bind them back once
+        area_m2 = shapely.area(_to_utm(processed.geometry).to_numpy())
+        
+        # Convert levels to numeric, estimate if missing (default to 1 level)
+        levels = _parse_levels(processed['building:levels'])
         
         # Calculate estimated floor area
-        processed['floor_area_m2'] = processed['area_m2'] * processed['levels']
+        floor_area_m2 = area_m2 * levels
+        
+        processed['area_m2'] = area_m2
+        processed['levels'] = levels
+        processed['floor_area_m2'] = floor_area_m2
         
         self.logger.info(f"Processed buildings: {len(processed)} remaining")
         
-        return processed
+        return _downcast(processed)
     
     def process_roads(self, roads_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         """
@@ -257,40 +522,22 @@ class DataProcessor:
         
         self.logger.info(f"Processing {len(roads_gdf)} roads")
         
-        # Clean geometries
-        processed = self.clean_geometries(roads_gdf)
-        
-        # Normalize tags
-        processed = self.normalize_tags(processed)
-        
-        # Filter by minimum length (remove very short segments, likely errors)
-        if not processed.empty:
-            processed['length_m'] = processed.geometry.length * 111319.9  # rough conversion to meters
-            processed = processed[processed['length_m'] >= 10.0].copy()
+        # Clean geometries, normalize tags and filter by minimum length
+        # (remove very short segments, likely errors)
+        processed = self._process_partitioned(roads_gdf, min_length_m=10.0)
         
         # Remove duplicates
-        processed = self.remove_duplicates(processed, tolerance=0.0001)
+        processed = self.remove_duplicates(processed)
         
         # Classify road types
         if 'highway' in processed.columns:
-            processed['road_class'] = processed['highway'].map({
-                'motorway': 'major',
-                'trunk': 'major', 
-                'primary': 'major',
-                'secondary': 'arterial',
-                'tertiary': 'arterial',
-                'residential': 'local',
-                'service': 'service',
-                'track': 'track',
-                'footway': 'pedestrian',
-                'cycleway': 'bicycle'
-            }).fillna('other')
+            processed['road_class'] = _classify(processed['highway'], ROAD_CLASSES, ROAD_CLASS_DTYPE)
         else:
             processed['road_class'] = 'other'
         
         self.logger.info(f"Processed roads: {len(processed)} remaining")
         
-        return processed
+        return _downcast(processed)
     
     def process_landuse(self, landuse_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         """
@@ -307,45 +554,26 @@ class DataProcessor:
         
         self.logger.info(f"Processing {len(landuse_gdf)} landuse features")
         
-        # Clean geometries
-        processed = self.clean_geometries(landuse_gdf)
-        
-        # Normalize tags
-        processed = self.normalize_tags(processed)
-        
-        # Filter by minimum area
-        processed = self.filter_by_area(processed, min_area_m2=100.0)
+        # Clean geometries, normalize tags and filter by minimum area
+        processed = self._process_partitioned(landuse_gdf, min_area_m2=100.0)
         
         # Remove duplicates
         processed = self.remove_duplicates(processed)
         
         # Classify landuse types
-        landuse_categories = {
-            'residential': 'residential',
-            'commercial': 'commercial', 
-            'industrial': 'industrial',
-            'retail': 'commercial',
-            'forest': 'natural',
-            'farmland': 'agricultural',
-            'grass': 'natural',
-            'meadow': 'natural',
-            'park': 'recreational',
-            'playground': 'recreational',
-            'cemetery': 'other',
-            'construction': 'construction'
-        }
-        
         if 'landuse' in processed.columns:
-            processed['landuse_category'] = processed['landuse'].map(landuse_categories).fillna('other')
+            processed['landuse_category'] = _classify(
+                processed['landuse'], LANDUSE_CATEGORIES, LANDUSE_CATEGORY_DTYPE
+            )
         else:
             processed['landuse_category'] = 'other'
         
         # Calculate areas
-        processed['area_m2'] = processed.geometry.apply(calculate_area)
+        processed['area_m2'] = shapely.area(_to_utm(processed.geometry).to_numpy())
         
         self.logger.info(f"Processed landuse: {len(processed)} remaining")
         
-        return processed
+        return _downcast(processed)
     
     def create_temporal_comparison(self, 
                                   data_by_year: Dict[int, gpd.GeoDataFrame]) -> Dict[str, Any]:
@@ -370,46 +598,45 @@ class DataProcessor:
             'removed_features': {}
         }
         
-        # Count features by year
+        # Count features and total polygon area once per year, so the pair
+        # loop below only does lookups even when a year appears in two pairs
+        counts = comparison['feature_counts']
+        polygon_areas = {}
         for year in years:
             gdf = data_by_year[year]
-            comparison['feature_counts'][year] = len(gdf) if not gdf.empty else 0
+            counts[year] = len(gdf)
+            if gdf.empty:
+                continue
+            polygon_mask = shapely.get_type_id(gdf.geometry.to_numpy()) == GEOMETRY_TYPE_POLYGON
+            if polygon_mask.any():
+                polygons = _to_utm(gdf.geometry[polygon_mask])
+                polygon_areas[year] = float(shapely.area(polygons.to_numpy()).sum())
         
         # Compare consecutive years
-        for i in range(1, len(years)):
-            prev_year = years[i-1]
-            curr_year = years[i]
+        for prev_year, curr_year in zip(years[:-1], years[1:]):
+            prev_count = counts[prev_year]
+            curr_count = counts[curr_year]
             
-            prev_data = data_by_year[prev_year]
-            curr_data = data_by_year[curr_year]
-            
-            if prev_data.empty and curr_data.empty:
+            if prev_count == 0 and curr_count == 0:
                 continue
             
             # Calculate feature count changes
-            prev_count = len(prev_data) if not prev_data.empty else 0
-            curr_count = len(curr_data) if not curr_data.empty else 0
-            
-            comparison['feature_counts'][f'{prev_year}_to_{curr_year}'] = {
+            counts[f'{prev_year}_to_{curr_year}'] = {
                 'change': curr_count - prev_count,
                 'percent_change': ((curr_count - prev_count) / prev_count * 100) if prev_count > 0 else 0
             }
             
             # Calculate area changes (for polygon features)
-            if not prev_data.empty and not curr_data.empty:
-                prev_polygons = prev_data[prev_data.geometry.type == 'Polygon']
-                curr_polygons = curr_data[curr_data.geometry.type == 'Polygon']
+            if prev_year in polygon_areas and curr_year in polygon_areas:
+                prev_area = polygon_areas[prev_year]
+                curr_area = polygon_areas[curr_year]
                 
-                if not prev_polygons.empty and not curr_polygons.empty:
-                    prev_area = prev_polygons.geometry.apply(calculate_area).sum()
-                    curr_area = curr_polygons.geometry.apply(calculate_area).sum()
-                    
-                    comparison['area_changes'][f'{prev_year}_to_{curr_year}'] = {
-                        'prev_area_m2': prev_area,
-                        'curr_area_m2': curr_area,
-                        'change_m2': curr_area - prev_area,
-                        'percent_change': ((curr_area - prev_area) / prev_area * 100) if prev_area > 0 else 0
-                    }
+                comparison['area_changes'][f'{prev_year}_to_{curr_year}'] = {
+                    'prev_area_m2': prev_area,
+                    'curr_area_m2': curr_area,
+                    'change_m2': curr_area - prev_area,
+                    'percent_change': ((curr_area - prev_area) / prev_area * 100) if prev_area > 0 else 0
+                }
         
         return comparison
     
@@ -433,35 +660,32 @@ class DataProcessor:
         # Create analysis grid
         grid = create_analysis_grid(bbox, grid_size_km)
         
-        # Perform spatial join
-        joined = gpd.sjoin(gdf, grid, how='inner', predicate='intersects')
+        # Spatial join against the (cached) spatial index of the features
+        grid_idx, feature_idx = gdf.sindex.query(grid.geometry, predicate='intersects')
+        
+        if len(grid_idx) == 0:
+            return gpd.GeoDataFrame()
+        
+        joined = pd.DataFrame({'grid_id': grid['grid_id'].to_numpy()[grid_idx]})
+        for col in ('area_m2', 'length_m'):
+            if col in gdf.columns:
+                joined[col] = gdf[col].to_numpy()[feature_idx]
         
         # Aggregate statistics by grid cell
-        aggregated = []
+        aggregations = {'feature_count': ('grid_id', 'size')}
         
-        for grid_id in grid['grid_id'].unique():
-            grid_features = joined[joined['grid_id'] == grid_id]
-            grid_geom = grid[grid['grid_id'] == grid_id]['geometry'].iloc[0]
-            
-            if not grid_features.empty:
-                stats = {
-                    'grid_id': grid_id,
-                    'geometry': grid_geom,
-                    'feature_count': len(grid_features),
-                    'feature_density': len(grid_features) / (grid_size_km ** 2)
-                }
-                
-                # Add geometry-specific stats
-                if 'area_m2' in grid_features.columns:
-                    stats['total_area_m2'] = grid_features['area_m2'].sum()
-                    stats['avg_area_m2'] = grid_features['area_m2'].mean()
-                
-                if 'length_m' in grid_features.columns:
-                    stats['total_length_m'] = grid_features['length_m'].sum()
-                
-                aggregated.append(stats)
+        # Add geometry-specific stats
+        if 'area_m2' in joined.columns:
+            aggregations['total_area_m2'] = ('area_m2', 'sum')
+            aggregations['avg_area_m2'] = ('area_m2', 'mean')
+        
+        if 'length_m' in joined.columns:
+            aggregations['total_length_m'] = ('length_m', 'sum')
         
-        return gpd.GeoDataFrame(aggregated, crs='EPSG:4326') if aggregated else gpd.GeoDataFrame()
+        stats = joined.groupby('grid_id').agg(**aggregations).reset_index()
+        stats['feature_density'] = stats['feature_count'] / (grid_size_km ** 2)
+        
+        return grid.merge(stats, on='grid_id', how='inner')
     
     def get_processing_summary(self, 
                               original_data: gpd.GeoDataFrame,
@@ -487,7 +711,13 @@ class DataProcessor:
         }
         
         if not processed_data.empty:
-            summary['geometry_types'] = processed_data.geometry.type.value_counts().to_dict()
+            type_ids, counts = np.unique(
+                shapely.get_type_id(processed_data.geometry.to_numpy()), return_counts=True
+            )
+            summary['geometry_types'] = {
+                GEOMETRY_TYPE_NAMES[type_id]: int(count)
+                for type_id, count in zip(type_ids, counts) if type_id in GEOMETRY_TYPE_NAMES
+            }
             summary['bbox'] = processed_data.total_bounds.tolist()
         
         return summary
@@ -5,18 +5,25 @@ from .logger import Logger
 from .helpers import (
     bbox_to_overpass_query,
     calculate_area,
+    calculate_areas_bulk,
+    calculate_areas_parallel,
     calculate_distance,
     get_time_periods,
     validate_coordinates,
     normalize_osm_tags,
+    normalize_osm_tags_series,
     calculate_building_density,
     calculate_road_density,
     classify_building_types,
     create_analysis_grid,
     format_large_number,
+    format_large_number_vec,
     get_utm_crs,
     haversine_distance,
+    haversine_distance_vec,
+    haversine_distance_matrix,
     split_large_bbox,
+    split_large_bbox_array,
     estimate_query_complexity,
     optimize_overpass_query
 )
@@ -27,18 +34,25 @@ __all__ = [
     "Logger", 
     "bbox_to_overpass_query",
     "calculate_area",
+    "calculate_areas_bulk",
+    "calculate_areas_parallel",
     "calculate_distance",
     "get_time_periods",
     "validate_coordinates",
     "normalize_osm_tags",
+    "normalize_osm_tags_series",
     "calculate_building_density",
     "calculate_road_density",
     "classify_building_types",
     "create_analysis_grid",
     "format_large_number",
+    "format_large_number_vec",
     "get_utm_crs",
     "haversine_distance",
+    "haversine_distance_vec",
+    "haversine_distance_matrix",
     "split_large_bbox",
+    "split_large_bbox_array",
     "estimate_query_complexity",
     "optimize_overpass_query"
 ]
@@ -1,10 +1,22 @@
 """Configuration management for the OSM Urban Growth Analysis project."""
 
 import os
+import copy
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import cached_property
+
+
+# Parsed configuration files shared across ConfigManager instances, keyed by (path, mtime)
+_CONFIG_CACHE: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
+# libyaml-backed loader when available (much faster than the pure-Python one)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Sentinel for keys missing from the configuration
+_NOT_FOUND = object()
 
 
 @dataclass
@@ -35,6 +47,7 @@ class ConfigManager:
             config_path: Path to configuration file. If None, uses default config.yaml
         """
         self.config_path = config_path or self._get_default_config_path()
+        self._get_cache: Dict[str, Any] = {}
         self._config = self._load_config()
     
     def _get_default_config_path(self) -> str:
@@ -43,14 +56,23 @@ class ConfigManager:
         return str(project_root / "config.yaml")
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file, reusing the parse while the file is unchanged."""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
+            cache_key = (self.config_path, os.path.getmtime(self.config_path))
+            if cache_key not in _CONFIG_CACHE:
+                _CONFIG_CACHE[cache_key] = self._read_config()
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing configuration file: {e}")
+        
+        # Each instance gets its own copy so update() does not leak into others
+        return copy.deepcopy(_CONFIG_CACHE[cache_key])
+    
+    def _read_config(self) -> Dict[str, Any]:
+        """Parse the YAML configuration file."""
+        with open(self.config_path, 'r', encoding='utf-8') as file:
+            return yaml.load(file, Loader=_YAML_LOADER)
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -63,14 +85,22 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
+        try:
+            value = self._get_cache[key]
+        except KeyError:
+            value = self._get_cache[key] = self._resolve(key)
+        
+        return default if value is _NOT_FOUND else value
+    
+    def _resolve(self, key: str) -> Any:
+        """Walk the configuration tree for a dot-notation key."""
         value = self._config
         
-        for k in keys:
+        for k in key.split('.'):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _NOT_FOUND
         
         return value
     
@@ -96,6 +126,11 @@ class ConfigManager:
     
     def get_default_bbox(self) -> BoundingBox:
         """Get default bounding box for analysis."""
+        return self._default_bbox
+    
+    @cached_property
+    def _default_bbox(self) -> BoundingBox:
+        """Default bounding box, built once until the configuration changes."""
         bbox_config = self.get('analysis.default_bbox', {})
         return BoundingBox(
             south=bbox_config.get('south', -23.6821),
@@ -134,6 +169,7 @@ class ConfigManager:
     def reload(self) -> None:
         """Reload configuration from file."""
         self._config = self._load_config()
+        self._invalidate_caches()
     
     def update(self, key: str, value: Any) -> None:
         """
@@ -152,6 +188,12 @@ class ConfigManager:
             config = config[k]
         
         config[keys[-1]] = value
+        self._invalidate_caches()
+    
+    def _invalidate_caches(self) -> None:
+        """Drop memoized lookups after the configuration changed."""
+        self._get_cache.clear()
+        self.__dict__.pop('_default_bbox', None)
     
     def save(self, path: Optional[str] = None) -> None:
         """
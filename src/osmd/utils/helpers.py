@@ -2,14 +2,63 @@
 
 import re
 import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any, Optional
 from datetime import datetime, timedelta
 import geopandas as gpd
-from shapely.geometry import Polygon
+import shapely
+from shapely.geometry import Point
 import numpy as np
+import pandas as pd
 import pyproj
 from pyproj import CRS, Transformer
 
+try:
+    from numba import njit, prange
+except ImportError:  # Optional dependency, distances fall back to Python/numpy
+    njit = None
+
+
+# Prebuilt fixed-point formatters by precision for format_large_number
+_FMT = {precision: f"{{:.{precision}f}}".format for precision in range(6)}
+
+# Canonical values for common (key, value) tag variations
+_VALUE_ALIASES = {
+    ('building', 'yes'): 'yes',
+    ('building', 'true'): 'yes',
+    ('building', '1'): 'yes',
+    ('highway', 'road'): 'unclassified',
+    ('highway', 'street'): 'unclassified',
+}
+_ALIAS_INDEX = pd.MultiIndex.from_tuples(list(_VALUE_ALIASES))
+_ALIAS_VALUES = np.array(list(_VALUE_ALIASES.values()), dtype=object)
+
+# Northern hemisphere UTM zones are EPSG 326xx, southern hemisphere zones 327xx
+UTM_NORTH_EPSG_BASE = 32600
+UTM_SOUTH_EPSG_BASE = 32700
+
+# Below this distance calculate_distance skips the UTM projection
+FLAT_EARTH_MAX_DISTANCE_M = 10_000
+
+# Fraction of a grid cell below which a partial row or column is dropped
+GRID_CELL_TOLERANCE = 1e-9
+
+# Building tag value -> building category
+_BUILDING_TYPE_MAP = {
+    # Residential buildings
+    'house': 'residential', 'apartments': 'residential', 'residential': 'residential',
+    'detached': 'residential', 'terrace': 'residential',
+    # Commercial buildings
+    'commercial': 'commercial', 'retail': 'commercial', 'office': 'commercial', 'shop': 'commercial',
+    # Industrial buildings
+    'industrial': 'industrial', 'warehouse': 'industrial', 'manufacture': 'industrial',
+    # Public/institutional buildings
+    'school': 'public', 'hospital': 'public', 'church': 'public', 'civic': 'public', 'public': 'public',
+    # Generic building
+    'yes': 'generic', 'true': 'generic',
+}
+
 
 def validate_coordinates(south: float, west: float, north: float, east: float) -> bool:
     """
@@ -27,6 +76,10 @@ def validate_coordinates(south: float, west: float, north: float, east: float) -
     Raises:
         ValueError: If coordinates are invalid
     """
+    # Fast path: a single chained comparison covers every valid bbox
+    if -90 <= south < north <= 90 and -180 <= west < east <= 180:
+        return True
+    
     if not (-90 <= south <= 90) or not (-90 <= north <= 90):
         raise ValueError("Latitude values must be between -90 and 90 degrees")
     
@@ -42,6 +95,23 @@ def validate_coordinates(south: float, west: float, north: float, east: float) -
     return True
 
 
+@lru_cache(maxsize=64)
+def _parse_features(features: Tuple[str, ...]) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Parse feature strings into (key, value) pairs; value is None for bare keys."""
+    return tuple(tuple(feature.split("=", 1)) if "=" in feature else (feature, None)
+                 for feature in features)
+
+
+def _emit_selectors(bbox_str: str, parsed_features: Tuple[Tuple[str, Optional[str]], ...]) -> List[str]:
+    """Build way and relation selector lines for parsed features."""
+    parts = []
+    for key, value in parsed_features:
+        selector = f'["{key}"="{value}"]' if value is not None else f'["{key}"]'
+        parts.append(f'  way{selector}{bbox_str};')
+        parts.append(f'  relation{selector}{bbox_str};')
+    return parts
+
+
 def create_temporal_overpass_query(south: float, west: float, north: float, east: float,
                                   features: List[str], date_str: str) -> str:
     """
@@ -64,14 +134,7 @@ def create_temporal_overpass_query(south: float, west: float, north: float, east
     ]
     
     # Add feature queries with temporal context
-    for feature in features:
-        if "=" in feature:
-            key, value = feature.split("=", 1)
-            query_parts.append(f'  way["{key}"="{value}"]{bbox_str};')
-            query_parts.append(f'  relation["{key}"="{value}"]{bbox_str};')
-        else:
-            query_parts.append(f'  way["{feature}"]{bbox_str};')
-            query_parts.append(f'  relation["{feature}"]{bbox_str};')
+    query_parts.extend(_emit_selectors(bbox_str, _parse_features(tuple(features))))
     
     query_parts.extend([");", "out geom;"])
     
@@ -104,20 +167,38 @@ def bbox_to_overpass_query(south: float, west: float, north: float, east: float,
     query_parts.append("(")
     
     # Add feature queries - simplified version
-    for feature in features:
-        if "=" in feature:
-            key, value = feature.split("=", 1)
-            query_parts.append(f'  way["{key}"="{value}"]{bbox_str};')
-            query_parts.append(f'  relation["{key}"="{value}"]{bbox_str};')
-        else:
-            query_parts.append(f'  way["{feature}"]{bbox_str};')
-            query_parts.append(f'  relation["{feature}"]{bbox_str};')
+    query_parts.extend(_emit_selectors(bbox_str, _parse_features(tuple(features))))
     
     query_parts.extend([");", "out geom;"])
     
     return "\n".join(query_parts)
 
 
+def _utm_epsg(longitude: float, latitude: float) -> int:
+    """Get the EPSG code of the UTM zone containing the given coordinates."""
+    # Calculate UTM zone
+    utm_zone = int((longitude + 180) / 6) + 1
+    
+    return (UTM_NORTH_EPSG_BASE if latitude >= 0 else UTM_SOUTH_EPSG_BASE) + utm_zone
+
+
+@lru_cache(maxsize=128)
+def _crs_from_epsg(epsg_code: int) -> CRS:
+    """Build (and cache) a CRS from an EPSG code."""
+    return CRS.from_epsg(epsg_code)
+
+
+@lru_cache(maxsize=256)
+def _get_transformer(source_crs: str, utm_epsg: int) -> Transformer:
+    """
+    Get a cached transformer from source_crs to a UTM zone.
+    
+    Building a Transformer costs far more than using it, and an analysis area
+    usually falls in a single UTM zone, so instances are reused across calls.
+    """
+    return Transformer.from_crs(CRS.from_string(source_crs), _crs_from_epsg(utm_epsg), always_xy=True)
+
+
 def get_utm_crs(longitude: float, latitude: float) -> CRS:
     """
     Get the appropriate UTM CRS for given coordinates.
@@ -129,18 +210,7 @@ def get_utm_crs(longitude: float, latitude: float) -> CRS:
     Returns:
         PyProj CRS object for the appropriate UTM zone
     """
-    # Calculate UTM zone
-    utm_zone = int((longitude + 180) / 6) + 1
-    
-    # Determine hemisphere
-    if latitude >= 0:
-        # Northern hemisphere
-        epsg_code = 32600 + utm_zone
-    else:
-        # Southern hemisphere  
-        epsg_code = 32700 + utm_zone
-    
-    return CRS.from_epsg(epsg_code)
+    return _crs_from_epsg(_utm_epsg(longitude, latitude))
 
 
 def calculate_area(geometry, source_crs: str = "EPSG:4326") -> float:
@@ -167,22 +237,109 @@ def calculate_area(geometry, source_crs: str = "EPSG:4326") -> float:
     # Get centroid for UTM zone calculation
     centroid = geometry.centroid
     
-    # Get appropriate UTM CRS
-    utm_crs = get_utm_crs(centroid.x, centroid.y)
-    
-    # Create transformer
-    transformer = Transformer.from_crs(CRS.from_string(source_crs), utm_crs, always_xy=True)
+    # Get (cached) transformer to the appropriate UTM zone
+    transformer = _get_transformer(source_crs, _utm_epsg(centroid.x, centroid.y))
     
     # Transform geometry to UTM
     try:
-        from shapely.ops import transform
-        utm_geometry = transform(transformer.transform, geometry)
+        utm_geometry = _project_coordinates(geometry, transformer)
         return utm_geometry.area
     except Exception:
         # Fallback to approximation if transformation fails
         return geometry.area * 111319.9 ** 2
 
 
+def _project_coordinates(geometries, transformer: Transformer):
+    """
+    Project geometries with a single batched transformer call.
+    
+    shapely.transform hands over all coordinates of the input as one (N, 2)
+    array, so pyproj projects them in one pass instead of once per vertex.
+    """
+    def project(coords: np.ndarray) -> np.ndarray:
+        xs, ys = transformer.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack([xs, ys])
+    
+    return shapely.transform(geometries, project)
+
+
+def _metric_geometries(gdf) -> np.ndarray:
+    """
+    Get the geometries of a layer as an array in a metric CRS.
+    
+    Projected inputs are returned as-is; geographic inputs are projected to the
+    UTM zone of the layer's center with a single batched transformer call.
+    """
+    geometries = gdf.geometry if isinstance(gdf, gpd.GeoDataFrame) else gdf
+    geometry_array = np.asarray(geometries.values)
+    
+    crs = geometries.crs
+    if len(geometry_array) == 0 or (crs is not None and crs.is_projected):
+        return geometry_array
+    
+    west, south, east, north = geometries.total_bounds
+    source_crs = crs.to_string() if crs is not None else "EPSG:4326"
+    transformer = _get_transformer(source_crs, _utm_epsg((west + east) / 2, (south + north) / 2))
+    
+    return _project_coordinates(geometry_array, transformer)
+
+
+def calculate_areas_bulk(gdf) -> np.ndarray:
+    """
+    Calculate areas of all geometries in square meters in one batch.
+    
+    Geographic inputs are projected to the UTM zone of the layer's center
+    with a single transformer call for every coordinate of every geometry.
+    
+    Args:
+        gdf: GeoDataFrame or GeoSeries (CRS defaults to WGS84 when unset)
+        
+    Returns:
+        Array of areas in square meters (0.0 for missing or empty geometries)
+    """
+    return np.nan_to_num(shapely.area(_metric_geometries(gdf)))
+
+
+def calculate_areas_parallel(gdf, n_workers: Optional[int] = None,
+                             chunk_size: int = 50_000) -> np.ndarray:
+    """
+    Calculate areas of all geometries in square meters using worker threads.
+    
+    Like calculate_areas_bulk, but the projection runs chunk-wise in a thread
+    pool; pyproj releases the GIL while transforming, so chunks project
+    concurrently.
+    
+    Args:
+        gdf: GeoDataFrame or GeoSeries (CRS defaults to WGS84 when unset)
+        n_workers: Number of worker threads (None lets the executor decide)
+        chunk_size: Number of geometries per chunk
+        
+    Returns:
+        Array of areas in square meters (0.0 for missing or empty geometries)
+    """
+    geometries = gdf.geometry if isinstance(gdf, gpd.GeoDataFrame) else gdf
+    crs = geometries.crs
+    
+    # Projected layers and single chunks gain nothing from threading
+    if len(geometries) <= chunk_size or (crs is not None and crs.is_projected):
+        return calculate_areas_bulk(geometries)
+    
+    geometry_array = np.asarray(geometries.values)
+    west, south, east, north = geometries.total_bounds
+    source_crs = crs.to_string() if crs is not None else "EPSG:4326"
+    # pyproj >= 3.4 transformers are thread-safe, so the workers share one
+    transformer = _get_transformer(source_crs, _utm_epsg((west + east) / 2, (south + north) / 2))
+    
+    def area_worker(chunk: np.ndarray) -> np.ndarray:
+        return np.nan_to_num(shapely.area(_project_coordinates(chunk, transformer)))
+    
+    chunks = [geometry_array[i:i + chunk_size] for i in range(0, len(geometry_array), chunk_size)]
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        results = list(executor.map(area_worker, chunks))
+    
+    return np.concatenate(results)
+
+
 def calculate_distance(point1, point2, source_crs: str = "EPSG:4326") -> float:
     """
     Calculate distance between two points in meters using appropriate UTM projection.
@@ -195,8 +352,6 @@ def calculate_distance(point1, point2, source_crs: str = "EPSG:4326") -> float:
     Returns:
         Distance in meters
     """
-    from shapely.geometry import Point
-    
     # Convert to Points if needed
     if not hasattr(point1, 'x'):
         point1 = Point(point1)
@@ -207,15 +362,20 @@ def calculate_distance(point1, point2, source_crs: str = "EPSG:4326") -> float:
     if source_crs != "EPSG:4326":
         return point1.distance(point2)
     
+    # Short distances: local equirectangular approximation (error < 0.1%)
+    mid_lat = math.radians((point1.y + point2.y) * 0.5)
+    dx = (point2.x - point1.x) * 111320 * math.cos(mid_lat)
+    dy = (point2.y - point1.y) * 110574
+    distance = math.sqrt(dx * dx + dy * dy)
+    if distance < FLAT_EARTH_MAX_DISTANCE_M:
+        return distance
+    
     # Get centroid for UTM zone calculation
     center_x = (point1.x + point2.x) / 2
     center_y = (point1.y + point2.y) / 2
     
-    # Get appropriate UTM CRS
-    utm_crs = get_utm_crs(center_x, center_y)
-    
-    # Create transformer
-    transformer = Transformer.from_crs(CRS.from_string(source_crs), utm_crs, always_xy=True)
+    # Get (cached) transformer to the appropriate UTM zone
+    transformer = _get_transformer(source_crs, _utm_epsg(center_x, center_y))
     
     try:
         # Transform points to UTM
@@ -229,6 +389,30 @@ def calculate_distance(point1, point2, source_crs: str = "EPSG:4326") -> float:
         return haversine_distance(point1.y, point1.x, point2.y, point2.x)
 
 
+if njit is not None:
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _haversine_nb(lat1, lon1, lat2, lon2):
+        """Compiled scalar Haversine distance in meters."""
+        lat1 = math.radians(lat1)
+        lat2 = math.radians(lat2)
+        sin_dlat = math.sin((lat2 - lat1) * 0.5)
+        sin_dlon = math.sin(math.radians(lon2 - lon1) * 0.5)
+        a = sin_dlat * sin_dlat + math.cos(lat1) * math.cos(lat2) * sin_dlon * sin_dlon
+        return 2 * 6371000 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    @njit(cache=True, fastmath=True, nogil=True, parallel=True)
+    def _haversine_matrix_nb(a_lat, a_lon, b_lat, b_lon):
+        """Compiled pairwise Haversine distances, rows parallelized across cores."""
+        out = np.empty((a_lat.size, b_lat.size))
+        for i in prange(a_lat.size):
+            for j in range(b_lat.size):
+                out[i, j] = _haversine_nb(a_lat[i], a_lon[i], b_lat[j], b_lon[j])
+        return out
+else:
+    _haversine_nb = None
+    _haversine_matrix_nb = None
+
+
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the great circle distance between two points using Haversine formula.
@@ -240,19 +424,71 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in meters
     """
+    if _haversine_nb is not None:
+        return float(_haversine_nb(lat1, lon1, lat2, lon2))
+    
+    sin, cos, radians = math.sin, math.cos, math.radians
+    
     # Convert to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    lat1, lon1, lat2, lon2 = radians(lat1), radians(lon1), radians(lat2), radians(lon2)
+    
+    # Haversine formula (atan2 form stays well-conditioned near antipodes)
+    sin_dlat = sin((lat2 - lat1) * 0.5)
+    sin_dlon = sin((lon2 - lon1) * 0.5)
+    a = sin_dlat * sin_dlat + cos(lat1) * cos(lat2) * sin_dlon * sin_dlon
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    
+    # Earth radius in meters
+    r = 6371000
+    
+    return c * r
+
+
+def haversine_distance_vec(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Vectorized Haversine distance for arrays of coordinate pairs.
+    
+    Inputs broadcast against each other, so passing column vectors for the
+    first points (e.g. ``lat1[:, None]``) yields a full distance matrix.
+    
+    Args:
+        lat1, lon1: Latitudes and longitudes of first points in decimal degrees
+        lat2, lon2: Latitudes and longitudes of second points in decimal degrees
+        
+    Returns:
+        Array of distances in meters
+    """
+    # Convert to radians
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64))
+                              for v in (lat1, lon1, lat2, lon2))
     
     # Haversine formula
     dlat = lat2 - lat1
     dlon = lon2 - lon1
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-    c = 2 * math.asin(math.sqrt(a))
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
     
     # Earth radius in meters
-    r = 6371000
+    return 2 * 6371000 * np.arcsin(np.sqrt(a))
+
+
+def haversine_distance_matrix(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Pairwise Haversine distances between two sets of points.
     
-    return c * r
+    Args:
+        lat1, lon1: Latitudes and longitudes of the first N points in decimal degrees
+        lat2, lon2: Latitudes and longitudes of the second M points in decimal degrees
+        
+    Returns:
+        (N, M) array of distances in meters
+    """
+    lat1, lon1, lat2, lon2 = (np.ascontiguousarray(v, dtype=np.float64).ravel()
+                              for v in (lat1, lon1, lat2, lon2))
+    
+    if _haversine_matrix_nb is not None:
+        return _haversine_matrix_nb(lat1, lon1, lat2, lon2)
+    
+    return haversine_distance_vec(lat1[:, None], lon1[:, None], lat2[None, :], lon2[None, :])
 
 
 def get_time_periods(years: List[int]) -> List[Tuple[int, str]]:
@@ -288,20 +524,59 @@ def normalize_osm_tags(tags: Dict[str, str]) -> Dict[str, str]:
     
     for key, value in tags.items():
         # Convert to lowercase and strip whitespace
-        clean_key = key.lower().strip()
+        clean_key = key.lower().strip() if isinstance(key, str) else key
         clean_value = value.lower().strip() if isinstance(value, str) else str(value)
         
         # Handle common tag variations
-        if clean_key == "building" and clean_value in ["yes", "true", "1"]:
-            clean_value = "yes"
-        elif clean_key == "highway" and clean_value in ["road", "street"]:
-            clean_value = "unclassified"
-        
-        normalized[clean_key] = clean_value
+        normalized[clean_key] = _VALUE_ALIASES.get((clean_key, clean_value), clean_value)
     
     return normalized
 
 
+def normalize_osm_tags_series(tags_series: pd.Series) -> pd.Series:
+    """
+    Normalize a Series of OSM tag dictionaries in bulk.
+    
+    All (key, value) pairs are flattened into two columns so lowercasing,
+    stripping and alias lookup run as vectorized pandas operations; only the
+    final regrouping into per-row dictionaries is a Python loop.
+    
+    Args:
+        tags_series: Series of OSM tag dictionaries (None/empty allowed)
+        
+    Returns:
+        Series of normalized tag dictionaries with the same index
+    """
+    rows, keys, values = [], [], []
+    for row, tags in enumerate(tags_series):
+        if tags:
+            rows.extend([row] * len(tags))
+            keys.extend(tags.keys())
+            values.extend(tags.values())
+    
+    normalized = [{} for _ in range(len(tags_series))]
+    if not keys:
+        return pd.Series(normalized, index=tags_series.index, dtype=object)
+    
+    keys = pd.Series(keys, dtype=object)
+    values = pd.Series(values, dtype=object)
+    key_is_str = np.fromiter((isinstance(k, str) for k in keys), dtype=bool, count=len(keys))
+    value_is_str = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+    
+    # Convert to lowercase and strip whitespace
+    keys = keys.where(key_is_str, '').str.lower().str.strip().where(key_is_str, keys)
+    values = values.where(value_is_str, '').str.lower().str.strip().where(value_is_str, values.astype(str))
+    
+    # Handle common tag variations
+    alias_positions = _ALIAS_INDEX.get_indexer(pd.MultiIndex.from_arrays([keys, values]))
+    values = np.where(alias_positions >= 0, _ALIAS_VALUES[alias_positions], values.to_numpy())
+    
+    for row, key, value in zip(rows, keys.tolist(), values.tolist()):
+        normalized[row][key] = value
+    
+    return pd.Series(normalized, index=tags_series.index, dtype=object)
+
+
 def calculate_building_density(buildings_gdf: gpd.GeoDataFrame, 
                              area_km2: float) -> Dict[str, float]:
     """
@@ -322,7 +597,7 @@ def calculate_building_density(buildings_gdf: gpd.GeoDataFrame,
         }
     
     building_count = len(buildings_gdf)
-    total_building_area_m2 = buildings_gdf.geometry.area.sum()
+    total_building_area_m2 = float(calculate_areas_bulk(buildings_gdf).sum())
     
     return {
         "buildings_per_km2": building_count / area_km2,
@@ -349,8 +624,8 @@ def calculate_road_density(roads_gdf: gpd.GeoDataFrame,
             "total_road_length_km": 0.0
         }
     
-    # Calculate total road length in kilometers
-    total_length_km = roads_gdf.geometry.length.sum() / 1000  # Convert to km
+    # Calculate total road length in kilometers (projected to UTM if geographic)
+    total_length_km = float(np.nansum(shapely.length(_metric_geometries(roads_gdf)))) / 1000
     
     return {
         "road_length_km_per_km2": total_length_km / area_km2,
@@ -358,45 +633,28 @@ def calculate_road_density(roads_gdf: gpd.GeoDataFrame,
     }
 
 
-def classify_building_types(buildings_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+def classify_building_types(buildings_gdf: gpd.GeoDataFrame, copy: bool = True) -> gpd.GeoDataFrame:
     """
     Classify buildings into categories based on OSM tags.
     
     Args:
         buildings_gdf: GeoDataFrame with building data
+        copy: Whether to work on a copy; pass False to add the column in place
         
     Returns:
         GeoDataFrame with added 'building_type' column
     """
-    def classify_building(row):
-        tags = row.get('tags', {}) if 'tags' in row else {}
-        building_tag = tags.get('building', 'unknown')
-        
-        # Residential buildings
-        if building_tag in ['house', 'apartments', 'residential', 'detached', 'terrace']:
-            return 'residential'
-        
-        # Commercial buildings
-        elif building_tag in ['commercial', 'retail', 'office', 'shop']:
-            return 'commercial'
-        
-        # Industrial buildings
-        elif building_tag in ['industrial', 'warehouse', 'manufacture']:
-            return 'industrial'
-        
-        # Public/institutional buildings
-        elif building_tag in ['school', 'hospital', 'church', 'civic', 'public']:
-            return 'public'
-        
-        # Generic building
-        elif building_tag in ['yes', 'true']:
-            return 'generic'
-        
-        else:
-            return 'other'
+    buildings_copy = buildings_gdf.copy() if copy else buildings_gdf
     
-    buildings_copy = buildings_gdf.copy()
-    buildings_copy['building_type'] = buildings_copy.apply(classify_building, axis=1)
+    # Building tag from a nested 'tags' dict if present, else the flat column
+    if 'tags' in buildings_copy.columns:
+        building_tags = buildings_copy['tags'].map(lambda tags: (tags or {}).get('building', 'unknown'))
+    elif 'building' in buildings_copy.columns:
+        building_tags = buildings_copy['building'].astype(object)
+    else:
+        building_tags = pd.Series('unknown', index=buildings_copy.index)
+    
+    buildings_copy['building_type'] = building_tags.map(_BUILDING_TYPE_MAP).fillna('other')
     
     return buildings_copy
 
@@ -418,25 +676,29 @@ def create_analysis_grid(bbox: Tuple[float, float, float, float],
     # Convert grid size to degrees (rough approximation)
     grid_size_deg = grid_size_km / 111.32  # 1 degree ≈ 111.32 km
     
-    # Create grid coordinates
-    x_coords = np.arange(west, east + grid_size_deg, grid_size_deg)
-    y_coords = np.arange(south, north + grid_size_deg, grid_size_deg)
-    
-    # Create grid polygons
-    polygons = []
-    grid_ids = []
-    
-    for i, x in enumerate(x_coords[:-1]):
-        for j, y in enumerate(y_coords[:-1]):
-            polygon = Polygon([
-                (x, y),
-                (x + grid_size_deg, y),
-                (x + grid_size_deg, y + grid_size_deg),
-                (x, y + grid_size_deg),
-                (x, y)
-            ])
-            polygons.append(polygon)
-            grid_ids.append(f"grid_{i}_{j}")
+    # Cell counts, with a small tolerance so float error in a bbox that divides
+    # evenly into cells cannot add a stray row or column
+    nx = math.ceil((east - west) / grid_size_deg - GRID_CELL_TOLERANCE)
+    ny = math.ceil((north - south) / grid_size_deg - GRID_CELL_TOLERANCE)
+    
+    # Lower-left corners of all cells, x-major to match the grid_id order
+    i_idx, j_idx = (a.ravel() for a in np.meshgrid(np.arange(nx), np.arange(ny), indexing='ij'))
+    x0 = west + i_idx * grid_size_deg
+    y0 = south + j_idx * grid_size_deg
+    x1 = x0 + grid_size_deg
+    y1 = y0 + grid_size_deg
+    
+    # Create all grid polygons at once from a (cells, 5, 2) ring array
+    rings = np.stack([
+        np.column_stack([x0, y0]),
+        np.column_stack([x1, y0]),
+        np.column_stack([x1, y1]),
+        np.column_stack([x0, y1]),
+        np.column_stack([x0, y0])
+    ], axis=1)
+    polygons = shapely.polygons(rings)
+    
+    grid_ids = [f"grid_{i}_{j}" for i, j in zip(i_idx.tolist(), j_idx.tolist())]
     
     return gpd.GeoDataFrame({
         'grid_id': grid_ids,
@@ -444,28 +706,39 @@ def create_analysis_grid(bbox: Tuple[float, float, float, float],
     }, crs='EPSG:4326')
 
 
-def split_large_bbox(bbox: Tuple[float, float, float, float], 
-                     max_area_km2: float = 100.0) -> List[Tuple[float, float, float, float]]:
+def _approx_bbox_km(south: float, west: float, north: float, east: float) -> Tuple[float, float]:
     """
-    Split large bounding boxes into smaller chunks to avoid API timeouts.
+    Approximate bounding box width and height in kilometers.
+    
+    Uses the equirectangular closed form (width shrinks with the cosine of
+    the mid latitude), which is plenty for sizing query chunks.
+    """
+    mid_lat = math.radians((south + north) * 0.5)
+    return 111.32 * math.cos(mid_lat) * (east - west), 110.574 * (north - south)
+
+
+def split_large_bbox_array(bbox: Tuple[float, float, float, float], 
+                           max_area_km2: float = 100.0) -> np.ndarray:
+    """
+    Split large bounding boxes into smaller chunks, as a numpy array.
     
     Args:
         bbox: Bounding box (south, west, north, east)
         max_area_km2: Maximum area per chunk in square kilometers
         
     Returns:
-        List of smaller bounding boxes
+        (n, 4) float64 array of (south, west, north, east) rows, row-major
+        over latitude bands
     """
     south, west, north, east = bbox
     
     # Calculate approximate area in km²
-    width_km = haversine_distance(south, west, south, east) / 1000
-    height_km = haversine_distance(south, west, north, west) / 1000
+    width_km, height_km = _approx_bbox_km(south, west, north, east)
     area_km2 = width_km * height_km
     
     # If area is within limits, return original bbox
     if area_km2 <= max_area_km2:
-        return [bbox]
+        return np.array([bbox], dtype=np.float64)
     
     # Calculate number of divisions needed
     divisions = math.ceil(math.sqrt(area_km2 / max_area_km2))
@@ -474,17 +747,30 @@ def split_large_bbox(bbox: Tuple[float, float, float, float],
     lat_step = (north - south) / divisions
     lon_step = (east - west) / divisions
     
-    bboxes = []
-    for i in range(divisions):
-        for j in range(divisions):
-            sub_south = south + i * lat_step
-            sub_north = south + (i + 1) * lat_step
-            sub_west = west + j * lon_step
-            sub_east = west + (j + 1) * lon_step
-            
-            bboxes.append((sub_south, sub_west, sub_north, sub_east))
+    steps = np.arange(divisions)
+    sub_south, sub_west = np.meshgrid(south + steps * lat_step, west + steps * lon_step, indexing='ij')
+    sub_north, sub_east = np.meshgrid(south + (steps + 1) * lat_step, west + (steps + 1) * lon_step, indexing='ij')
+    
+    return np.stack([sub_south.ravel(), sub_west.ravel(), sub_north.ravel(), sub_east.ravel()], axis=1)
+
+
+def split_large_bbox(bbox: Tuple[float, float, float, float], 
+                     max_area_km2: float = 100.0) -> List[Tuple[float, float, float, float]]:
+    """
+    Split large bounding boxes into smaller chunks to avoid API timeouts.
+    
+    Args:
+        bbox: Bounding box (south, west, north, east)
+        max_area_km2: Maximum area per chunk in square kilometers
+        
+    Returns:
+        List of smaller bounding boxes
+    """
+    bboxes = split_large_bbox_array(bbox, max_area_km2)
+    if len(bboxes) == 1:
+        return [bbox]
     
-    return bboxes
+    return list(map(tuple, bboxes.tolist()))
 
 
 def estimate_query_complexity(bbox: Tuple[float, float, float, float], 
@@ -502,8 +788,7 @@ def estimate_query_complexity(bbox: Tuple[float, float, float, float],
     south, west, north, east = bbox
     
     # Calculate area
-    width_km = haversine_distance(south, west, south, east) / 1000
-    height_km = haversine_distance(south, west, north, west) / 1000
+    width_km, height_km = _approx_bbox_km(south, west, north, east)
     area_km2 = width_km * height_km
     
     # Base complexity from area
@@ -550,39 +835,16 @@ def optimize_overpass_query(south: float, west: float, north: float, east: float
     highway_features = [f for f in features if 'highway' in f.lower()]
     other_features = [f for f in features if f not in building_features + highway_features]
     
-    # Add building queries
-    if building_features:
-        if len(building_features) == 1 and building_features[0] == 'building':
-            query_parts.append(f'  way["building"]{bbox_str};')
-            query_parts.append(f'  relation["building"]{bbox_str};')
-        else:
-            for feature in building_features:
-                if "=" in feature:
-                    key, value = feature.split("=", 1)
-                    query_parts.append(f'  way["{key}"="{value}"]{bbox_str};')
-                    query_parts.append(f'  relation["{key}"="{value}"]{bbox_str};')
-    
-    # Add highway queries
-    if highway_features:
-        if len(highway_features) == 1 and highway_features[0] == 'highway':
-            query_parts.append(f'  way["highway"]{bbox_str};')
-            query_parts.append(f'  relation["highway"]{bbox_str};')
-        else:
-            for feature in highway_features:
-                if "=" in feature:
-                    key, value = feature.split("=", 1)
-                    query_parts.append(f'  way["{key}"="{value}"]{bbox_str};')
-                    query_parts.append(f'  relation["{key}"="{value}"]{bbox_str};')
+    # Add building and highway queries; a lone bare key queries the whole
+    # key, otherwise only key=value selectors are kept
+    for group, bare_key in ((building_features, 'building'), (highway_features, 'highway')):
+        parsed = _parse_features(tuple(group))
+        if group != [bare_key]:
+            parsed = tuple((key, value) for key, value in parsed if value is not None)
+        query_parts.extend(_emit_selectors(bbox_str, parsed))
     
     # Add other features
-    for feature in other_features:
-        if "=" in feature:
-            key, value = feature.split("=", 1)
-            query_parts.append(f'  way["{key}"="{value}"]{bbox_str};')
-            query_parts.append(f'  relation["{key}"="{value}"]{bbox_str};')
-        else:
-            query_parts.append(f'  way["{feature}"]{bbox_str};')
-            query_parts.append(f'  relation["{feature}"]{bbox_str};')
+    query_parts.extend(_emit_selectors(bbox_str, _parse_features(tuple(other_features))))
     
     query_parts.extend([");", "out geom;"])
     
@@ -600,9 +862,31 @@ def format_large_number(number: float, precision: int = 1) -> str:
     Returns:
         Formatted string
     """
+    fmt = _FMT.get(precision) or f"{{:.{precision}f}}".format
+    
     if number >= 1_000_000:
-        return f"{number / 1_000_000:.{precision}f}M"
+        return fmt(number / 1_000_000) + "M"
     elif number >= 1_000:
-        return f"{number / 1_000:.{precision}f}K"
+        return fmt(number / 1_000) + "K"
     else:
-        return f"{number:.{precision}f}"
+        return fmt(number)
+
+
+def format_large_number_vec(numbers, precision: int = 1) -> np.ndarray:
+    """
+    Vectorized format_large_number for arrays of numbers.
+    
+    Args:
+        numbers: Numbers to format
+        precision: Decimal places
+        
+    Returns:
+        Array of formatted strings
+    """
+    values = np.asarray(numbers, dtype=np.float64)
+    
+    # Unit index: 0 (none), 1 (K), 2 (M)
+    unit = (values >= 1_000).astype(np.intp) + (values >= 1_000_000)
+    scaled = values / np.array([1.0, 1_000.0, 1_000_000.0])[unit]
+    
+    return np.char.add(np.char.mod(f"%.{precision}f", scaled), np.array(["", "K", "M"])[unit])
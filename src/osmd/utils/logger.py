@@ -2,15 +2,63 @@
 
 import logging
 import sys
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
+
+
+# All project loggers hang below this logger and share its handlers
+ROOT_LOGGER_NAME = "osm_urban_growth"
+DEFAULT_LOG_FILE = "logs/osm_analysis.log"
+LOG_MAX_BYTES = 10_000_000
+LOG_BACKUP_COUNT = 3
+
+_console_handler: Optional[logging.Handler] = None
+_file_handler: Optional[logging.Handler] = None
+
+
+def _install(log_file: Optional[str] = None) -> None:
+    """
+    Attach the shared handlers to the project root logger, once.
+    
+    The console handler is installed on first use and the rotating file
+    handler on the first request for a log file; later calls are no-ops, so
+    creating many Logger instances never duplicates handlers or reopens files.
+    
+    Args:
+        log_file: Optional log file path
+    """
+    global _console_handler, _file_handler
+    
+    if _console_handler is not None and (_file_handler is not None or not log_file):
+        return
+    
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    
+    # Console handler
+    if _console_handler is None:
+        _console_handler = logging.StreamHandler(sys.stdout)
+        _console_handler.setFormatter(formatter)
+        root.addHandler(_console_handler)
+    
+    # Rotating file handler (optional, opened on first record)
+    if log_file and _file_handler is None:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        _file_handler = RotatingFileHandler(
+            log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, delay=True
+        )
+        _file_handler.setFormatter(formatter)
+        root.addHandler(_file_handler)
 
 
 class Logger:
     """Custom logger for the OSM Urban Growth Analysis project."""
     
-    def __init__(self, name: str = "osm_urban_growth", level: str = "INFO", 
+    def __init__(self, name: str = ROOT_LOGGER_NAME, level: str = "INFO", 
                  log_file: Optional[str] = None):
         """
         Initialize logger.
@@ -20,73 +68,53 @@ class Logger:
             level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             log_file: Optional log file path
         """
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(getattr(logging, level.upper()))
+        _install(log_file)
         
-        # Clear existing handlers
-        self.logger.handlers.clear()
+        if name != ROOT_LOGGER_NAME:
+            name = f"{ROOT_LOGGER_NAME}.{name}"
         
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, level.upper()))
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
-        
-        # File handler (optional)
-        if log_file:
-            log_path = Path(log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(getattr(logging, level.upper()))
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
-    
-    def debug(self, message: str) -> None:
-        """Log debug message."""
-        self.logger.debug(message)
-    
-    def info(self, message: str) -> None:
-        """Log info message."""
-        self.logger.info(message)
-    
-    def warning(self, message: str) -> None:
-        """Log warning message."""
-        self.logger.warning(message)
-    
-    def error(self, message: str) -> None:
-        """Log error message."""
-        self.logger.error(message)
-    
-    def critical(self, message: str) -> None:
-        """Log critical message."""
-        self.logger.critical(message)
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(getattr(logging, level.upper()))
+    
+    def debug(self, message: str, *args) -> None:
+        """Log debug message (%-style args are formatted only if emitted)."""
+        self.logger.debug(message, *args)
+    
+    def info(self, message: str, *args) -> None:
+        """Log info message (%-style args are formatted only if emitted)."""
+        self.logger.info(message, *args)
+    
+    def warning(self, message: str, *args) -> None:
+        """Log warning message (%-style args are formatted only if emitted)."""
+        self.logger.warning(message, *args)
+    
+    def error(self, message: str, *args) -> None:
+        """Log error message (%-style args are formatted only if emitted)."""
+        self.logger.error(message, *args)
+    
+    def critical(self, message: str, *args) -> None:
+        """Log critical message (%-style args are formatted only if emitted)."""
+        self.logger.critical(message, *args)
     
     def log_analysis_start(self, bbox: tuple, years: list) -> None:
         """Log the start of an analysis."""
-        self.info(f"Starting urban growth analysis for bbox: {bbox}, years: {years}")
+        self.logger.info("Starting urban growth analysis for bbox: %s, years: %s", bbox, years)
     
     def log_data_collection(self, year: int, feature_count: int) -> None:
         """Log data collection progress."""
-        self.info(f"Collected {feature_count} features for year {year}")
+        self.logger.info("Collected %d features for year %d", feature_count, year)
     
     def log_processing_step(self, step: str, duration: float) -> None:
         """Log processing step completion."""
-        self.info(f"Completed {step} in {duration:.2f} seconds")
+        self.logger.info("Completed %s in %.2f seconds", step, duration)
     
     def log_error_with_context(self, error: Exception, context: str) -> None:
         """Log error with additional context."""
-        self.error(f"Error in {context}: {str(error)}")
+        self.logger.error("Error in %s: %s", context, error)
     
     def log_memory_usage(self, stage: str, memory_mb: float) -> None:
         """Log memory usage at different stages."""
-        self.debug(f"Memory usage at {stage}: {memory_mb:.2f} MB")
+        self.logger.debug("Memory usage at %s: %.2f MB", stage, memory_mb)
 
 
 def get_default_logger(log_to_file: bool = True) -> Logger:
@@ -99,9 +127,4 @@ def get_default_logger(log_to_file: bool = True) -> Logger:
     Returns:
         Logger instance
     """
-    log_file = None
-    if log_to_file:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = f"logs/osm_analysis_{timestamp}.log"
-    
-    return Logger(log_file=log_file)
+    return Logger(log_file=DEFAULT_LOG_FILE if log_to_file else None)
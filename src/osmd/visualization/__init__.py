@@ -1,11 +1,23 @@
 """Visualization modules for urban growth analysis."""
 
-from .maps import MapVisualizer
-from .charts import ChartGenerator
-from .dashboard import DashboardApp
+import importlib
+
+# Public classes and the module providing each; imported lazily by __getattr__
+_LAZY_IMPORTS = {
+    "MapVisualizer": ".maps",
+    "ChartGenerator": ".charts",
+    "DashboardApp": ".dashboard"
+}
 
 __all__ = [
     "MapVisualizer",
     "ChartGenerator", 
     "DashboardApp"
 ]
+
+
+def __getattr__(name):
+    """Import public classes on first access, so importing the package stays light."""
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
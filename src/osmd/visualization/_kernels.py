@@ -0,0 +1,27 @@
+"""Numeric kernels for chart metric derivations, JIT-compiled when numba is available."""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional dependency, kernels fall back to numpy
+    njit = None
+
+
+def _growth_pct_numpy(values: np.ndarray) -> np.ndarray:
+    """Percent change between consecutive values (0 where the previous value is 0)."""
+    previous = values[:-1]
+    return np.divide(np.diff(values) * 100.0, previous,
+                     out=np.zeros(len(previous)), where=previous > 0)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def growth_pct(values):
+        """Percent change between consecutive values (0 where the previous value is 0)."""
+        out = np.empty(max(values.size - 1, 0))
+        for i in range(values.size - 1):
+            out[i] = (values[i + 1] - values[i]) / values[i] * 100.0 if values[i] > 0 else 0.0
+        return out
+else:
+    growth_pct = _growth_pct_numpy
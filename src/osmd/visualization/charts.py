@@ -1,17 +1,252 @@
 """Chart generation module for urban growth analysis visualization."""
 
+import os
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+from itertools import chain, cycle, islice
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 from ..utils import ConfigManager, Logger, format_large_number
 
 
+# Build traces as plain dicts instead of validated graph objects; set
+# OSMD_PLOTLY_FAST=0 to get go.* trace objects (e.g. for debugging)
+FAST = os.getenv("OSMD_PLOTLY_FAST", "1") == "1"
+
+
+# Line series longer than this are downsampled with LTTB before plotting
+LTTB_MAX_POINTS = 2000
+
+# Line series longer than this are drawn with WebGL (scattergl) instead of SVG
+SCATTERGL_MIN_POINTS = 500
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with Largest-Triangle-Three-Buckets downsampling.
+    
+    Keeps the first and last points and, per bucket, the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    average, which preserves the visual shape of the series.
+    
+    Args:
+        x: Sorted x values
+        y: y values
+        n_out: Number of points to keep
+        
+    Returns:
+        Indices of the selected points
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    every = (n - 2) / (n_out - 2)
+    
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    
+    for i in range(n_out - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+    
+    return selected
+
+
+def _scatter(**kwargs):
+    """
+    Create a scatter trace (plain dict when FAST).
+    
+    Long series are downsampled and rendered with WebGL; short ones stay SVG,
+    which renders small traces faster and does not use up browser WebGL
+    contexts on dashboards with many charts.
+    """
+    x, y = kwargs.get('x'), kwargs.get('y')
+    n_points = len(x) if x is not None else 0
+    
+    if y is not None and n_points > LTTB_MAX_POINTS:
+        keep = _lttb(x, y, LTTB_MAX_POINTS)
+        kwargs['x'], kwargs['y'] = np.asarray(x)[keep], np.asarray(y)[keep]
+    
+    use_gl = n_points > SCATTERGL_MIN_POINTS
+    if FAST:
+        return dict(type='scattergl' if use_gl else 'scatter', **kwargs)
+    return go.Scattergl(**kwargs) if use_gl else go.Scatter(**kwargs)
+
+
+def _bar(**kwargs):
+    """Create a bar trace (plain dict when FAST)."""
+    return dict(type='bar', **kwargs) if FAST else go.Bar(**kwargs)
+
+
+def _series(mapping: Dict[Any, Any], keys, scale: float = 1.0) -> np.ndarray:
+    """
+    Align a per-year (or per-period) metrics dict on keys as a float array.
+    
+    Plotly ships numpy arrays as typed buffers, which is much cheaper to
+    validate and serialize than Python lists.
+    
+    Args:
+        mapping: Metrics dictionary keyed by year/period
+        keys: Years/periods to extract, in plotting order
+        scale: Unit conversion factor applied to the values
+        
+    Returns:
+        Array of values (0 where a key is missing)
+    """
+    aligned = pd.Series(mapping, dtype=np.float64).reindex(keys, fill_value=0)
+    if scale == 1.0:
+        return aligned.to_numpy()
+    
+    # Scale a private copy in place (to_numpy may return a read-only view)
+    array = aligned.to_numpy(copy=True)
+    array *= scale
+    return array
+
+
+def _growth_pct(values: np.ndarray) -> np.ndarray:
+    """
+    Percent change between consecutive values (0 where the previous value is 0).
+    
+    Args:
+        values: Per-year values in chronological order
+        
+    Returns:
+        Array with one growth rate per consecutive pair
+    """
+    from ._kernels import growth_pct
+    
+    return growth_pct(np.ascontiguousarray(values, dtype=np.float64))
+
+
+def _periods(years) -> List[str]:
+    """Period labels ("2020-2022") for consecutive years, as used by the metrics."""
+    years = list(years)
+    return [f"{prev_year}-{curr_year}" for prev_year, curr_year in zip(years[:-1], years[1:])]
+
+
+def _frame(nested: Dict[Any, Dict[str, Any]], keys, fields) -> pd.DataFrame:
+    """
+    Align per-year (or per-period) metric dictionaries on keys as a DataFrame.
+    
+    Args:
+        nested: Dictionary mapping year/period to a dictionary of metrics
+        keys: Years/periods to extract, in plotting order
+        fields: Metric names to extract as columns
+        
+    Returns:
+        Float DataFrame indexed by keys with one column per field (0 where missing)
+    """
+    frame = pd.json_normalize(list(nested.values()))
+    frame.index = list(nested.keys())
+    return frame.reindex(index=keys, columns=list(fields)).astype(np.float64).fillna(0.0)
+
+
+# Most recently built figures, keyed on (chart, fingerprint of its input data)
+FIGURE_CACHE_SIZE = 128
+_figure_cache: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+_figure_cache_lock = threading.Lock()
+
+
+def _freeze(obj: Any) -> Any:
+    """Convert nested metrics (dicts, lists, arrays) into a hashable fingerprint."""
+    if isinstance(obj, dict):
+        return tuple((key, _freeze(value)) for key, value in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(value) for value in obj)
+    if isinstance(obj, np.ndarray):
+        return (obj.dtype.str, obj.shape, obj.tobytes())
+    return obj
+
+
+RENDER_MODES = ('interactive', 'png', 'svg')
+
+
+def _render(fig: go.Figure, render: str):
+    """
+    Return a figure as-is or rasterized to static image bytes.
+    
+    Args:
+        fig: Plotly figure
+        render: 'interactive' for the figure, 'png' or 'svg' for image bytes
+        
+    Returns:
+        The figure, or the encoded image (requires kaleido)
+    """
+    if render == 'interactive':
+        return fig
+    if render not in RENDER_MODES:
+        raise ValueError(f"Unknown render mode '{render}', expected one of {RENDER_MODES}")
+    
+    return fig.to_image(format=render, engine='kaleido')
+
+
+def _cached_figure(key_func=None):
+    """
+    Memoize a chart method on a fingerprint of its input data.
+    
+    Charts are pure functions of their metrics, so a figure is built once,
+    stored as a plain dict and re-wrapped on later calls. Inputs that cannot
+    be fingerprinted (e.g. containing DataFrames) are simply not cached.
+    The wrapped method also accepts a ``render`` keyword (see _render).
+    
+    Args:
+        key_func: Optional function selecting the relevant part of the arguments
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, render: str = 'interactive', **kwargs):
+            # Normalize keyword and positional spellings of the same call
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            args, kwargs = bound.args[1:], bound.kwargs
+            
+            try:
+                key = (method.__name__, _freeze(key_func(*args) if key_func else args),
+                       _freeze(tuple(sorted(kwargs.items()))))
+                hash(key)
+            except TypeError:
+                return _render(method(self, *args, **kwargs), render)
+            
+            with _figure_cache_lock:
+                cached = _figure_cache.get(key)
+                if cached is not None:
+                    _figure_cache.move_to_end(key)
+            
+            if cached is None:
+                cached = method(self, *args, **kwargs).to_dict()
+                with _figure_cache_lock:
+                    _figure_cache[key] = cached
+                    while len(_figure_cache) > FIGURE_CACHE_SIZE:
+                        _figure_cache.popitem(last=False)
+            
+            return _render(go.Figure(cached), render)
+        return wrapper
+    return decorator
+
+
+def _comparison_inputs(analysis_results: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Select the metrics the comparison dashboard is built from."""
+    quant_data = analysis_results.get('quantitative_analysis', {})
+    return quant_data.get('building_metrics', {}), quant_data.get('road_metrics', {})
+
+
 class ChartGenerator:
     """Generates various charts and plots for urban growth analysis."""
     
@@ -24,11 +259,22 @@ class ChartGenerator:
         """
         self.config = config_manager or ConfigManager()
         self.logger = Logger("ChartGenerator")
+    
+    @staticmethod
+    def apply_mpl_style() -> None:
+        """
+        Apply the project's matplotlib/seaborn style.
+        
+        All charts here are plotly figures, so this is opt-in for callers that
+        draw their own matplotlib plots.
+        """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         
-        # Set plotting style
         plt.style.use('seaborn-v0_8')
         sns.set_palette("husl")
     
+    @_cached_figure()
     def create_growth_timeline_chart(self, 
                                    building_metrics: Dict[str, Any],
                                    road_metrics: Dict[str, Any]) -> go.Figure:
@@ -38,82 +284,83 @@ class ChartGenerator:
         Args:
             building_metrics: Building growth metrics
             road_metrics: Road growth metrics
+            render: 'interactive' for a figure, 'png'/'svg' for static image bytes
             
         Returns:
             Plotly figure with growth timeline
         """
-        # Create subplot with secondary y-axis
-        fig = make_subplots(
-            rows=2, cols=1,
-            subplot_titles=('Building Growth Over Time', 'Road Network Growth Over Time'),
-            vertical_spacing=0.1
-        )
+        has_buildings = 'years' in building_metrics and 'building_counts' in building_metrics
+        has_roads = 'years' in road_metrics and 'road_counts' in road_metrics
+        
+        # Nothing to plot: skip building the subplot layout
+        if not (has_buildings or has_roads):
+            return go.Figure()
+        
+        traces, rows = [], []
         
         # Building growth
-        if 'years' in building_metrics and 'building_counts' in building_metrics:
-            years = building_metrics['years']
-            counts = [building_metrics['building_counts'].get(year, 0) for year in years]
-            areas = [building_metrics['total_area_m2'].get(year, 0) / 1_000_000 for year in years]  # Convert to km²
+        if has_buildings:
+            years = np.asarray(building_metrics['years'], dtype=np.int32)
+            counts = _series(building_metrics['building_counts'], years)
+            areas = _series(building_metrics['total_area_m2'], years, scale=1e-6)  # Convert to km²
             
             # Building count
-            fig.add_trace(
-                go.Scatter(
-                    x=years,
-                    y=counts,
-                    mode='lines+markers',
-                    name='Building Count',
-                    line=dict(color='#2E86AB', width=3),
-                    marker=dict(size=8)
-                ),
-                row=1, col=1
-            )
+            traces.append(_scatter(
+                x=years,
+                y=counts,
+                mode='lines+markers',
+                name='Building Count',
+                line=dict(color='#2E86AB', width=3),
+                marker=dict(size=8)
+            ))
             
             # Building area (secondary axis)
-            fig.add_trace(
-                go.Scatter(
-                    x=years,
-                    y=areas,
-                    mode='lines+markers',
-                    name='Total Area (km²)',
-                    line=dict(color='#A23B72', width=3, dash='dash'),
-                    marker=dict(size=8),
-                    yaxis='y2'
-                ),
-                row=1, col=1
-            )
+            traces.append(_scatter(
+                x=years,
+                y=areas,
+                mode='lines+markers',
+                name='Total Area (km²)',
+                line=dict(color='#A23B72', width=3, dash='dash'),
+                marker=dict(size=8),
+                yaxis='y2'
+            ))
+            rows += [1, 1]
         
         # Road growth
-        if 'years' in road_metrics and 'road_counts' in road_metrics:
-            years = road_metrics['years']
-            counts = [road_metrics['road_counts'].get(year, 0) for year in years]
-            lengths = [road_metrics['total_length_km'].get(year, 0) for year in years]
+        if has_roads:
+            years = np.asarray(road_metrics['years'], dtype=np.int32)
+            counts = _series(road_metrics['road_counts'], years)
+            lengths = _series(road_metrics['total_length_km'], years)
             
             # Road count
-            fig.add_trace(
-                go.Scatter(
-                    x=years,
-                    y=counts,
-                    mode='lines+markers',
-                    name='Road Count',
-                    line=dict(color='#1B4332', width=3),
-                    marker=dict(size=8)
-                ),
-                row=2, col=1
-            )
+            traces.append(_scatter(
+                x=years,
+                y=counts,
+                mode='lines+markers',
+                name='Road Count',
+                line=dict(color='#1B4332', width=3),
+                marker=dict(size=8)
+            ))
             
             # Road length (secondary axis)
-            fig.add_trace(
-                go.Scatter(
-                    x=years,
-                    y=lengths,
-                    mode='lines+markers',
-                    name='Total Length (km)',
-                    line=dict(color='#52B788', width=3, dash='dash'),
-                    marker=dict(size=8),
-                    yaxis='y4'
-                ),
-                row=2, col=1
-            )
+            traces.append(_scatter(
+                x=years,
+                y=lengths,
+                mode='lines+markers',
+                name='Total Length (km)',
+                line=dict(color='#52B788', width=3, dash='dash'),
+                marker=dict(size=8),
+                yaxis='y4'
+            ))
+            rows += [2, 2]
+        
+        # Create subplot with secondary y-axis and add all traces in one batch
+        fig = make_subplots(
+            rows=2, cols=1,
+            subplot_titles=('Building Growth Over Time', 'Road Network Growth Over Time'),
+            vertical_spacing=0.1
+        )
+        fig.add_traces(traces, rows=rows, cols=[1] * len(traces))
         
         # Update layout
         fig.update_layout(
@@ -132,49 +379,56 @@ class ChartGenerator:
         
         return fig
     
+    @_cached_figure()
     def create_growth_rate_chart(self, growth_metrics: Dict[str, Any]) -> go.Figure:
         """
         Create a chart showing growth rates between periods.
         
         Args:
             growth_metrics: Growth rate metrics
+            render: 'interactive' for a figure, 'png'/'svg' for static image bytes
             
         Returns:
             Plotly figure with growth rates
         """
-        fig = go.Figure()
-        
         if 'growth_rates' not in growth_metrics:
-            return fig
-        
-        growth_rates = growth_metrics['growth_rates']
-        periods = list(growth_rates.keys())
-        
-        # Extract growth rates
-        count_growth = [growth_rates[period].get('count_growth_percent', 0) for period in periods]
-        area_growth = [growth_rates[period].get('area_growth_percent', 0) for period in periods]
-        
-        # Add traces
-        fig.add_trace(go.Bar(
-            x=periods,
-            y=count_growth,
-            name='Count Growth (%)',
-            marker_color='#2E86AB',
-            text=[f'{rate:+.1f}%' for rate in count_growth],
-            textposition='auto'
-        ))
-        
-        fig.add_trace(go.Bar(
-            x=periods,
-            y=area_growth,
-            name='Area Growth (%)',
-            marker_color='#A23B72',
-            text=[f'{rate:+.1f}%' for rate in area_growth],
-            textposition='auto'
-        ))
+            return go.Figure()
         
-        # Update layout
-        fig.update_layout(
+        if all(key in growth_metrics for key in ('years', 'building_counts', 'total_area_m2')):
+            # Derive growth rates straight from the raw per-year totals
+            years = growth_metrics['years']
+            periods = _periods(years)
+            count_growth = _growth_pct(_series(growth_metrics['building_counts'], years))
+            area_growth = _growth_pct(_series(growth_metrics['total_area_m2'], years))
+        else:
+            growth_rates = growth_metrics['growth_rates']
+            periods = list(growth_rates.keys())
+            
+            # Extract growth rates
+            rates = _frame(growth_rates, periods, ['count_growth_percent', 'area_growth_percent'])
+            count_growth = rates['count_growth_percent'].to_numpy()
+            area_growth = rates['area_growth_percent'].to_numpy()
+        
+        traces = [
+            _bar(
+                x=periods,
+                y=count_growth,
+                name='Count Growth (%)',
+                marker_color='#2E86AB',
+                texttemplate='%{y:+.1f}%',
+                textposition='auto'
+            ),
+            _bar(
+                x=periods,
+                y=area_growth,
+                name='Area Growth (%)',
+                marker_color='#A23B72',
+                texttemplate='%{y:+.1f}%',
+                textposition='auto'
+            )
+        ]
+        
+        layout = dict(
             title='Growth Rates by Period',
             xaxis_title='Period',
             yaxis_title='Growth Rate (%)',
@@ -183,8 +437,9 @@ class ChartGenerator:
             height=500
         )
         
-        return fig
+        return go.Figure(data=traces, layout=layout)
     
+    @_cached_figure()
     def create_building_type_distribution_chart(self, 
                                               building_metrics: Dict[str, Any]) -> go.Figure:
         """
@@ -192,6 +447,7 @@ class ChartGenerator:
         
         Args:
             building_metrics: Building metrics data
+            render: 'interactive' for a figure, 'png'/'svg' for static image bytes
             
         Returns:
             Plotly figure with building type distribution
@@ -199,49 +455,41 @@ class ChartGenerator:
         if 'building_types' not in building_metrics or 'years' not in building_metrics:
             return go.Figure()
         
+        import plotly.express as px
+        
         building_types = building_metrics['building_types']
-        years = building_metrics['years']
+        years = np.asarray(building_metrics['years'])
         
         # Get all unique building types
-        all_types = set()
-        for year_data in building_types.values():
-            all_types.update(year_data.keys())
-        
-        all_types = sorted(list(all_types))
-        
-        # Create data for stacked bar chart
-        fig = go.Figure()
-        
-        colors = px.colors.qualitative.Set3
-        
-        for i, building_type in enumerate(all_types):
-            counts = [building_types.get(year, {}).get(building_type, 0) for year in years]
-            
-            fig.add_trace(go.Bar(
-                x=years,
-                y=counts,
-                name=building_type.title(),
-                marker_color=colors[i % len(colors)]
-            ))
+        all_types = sorted(set(chain.from_iterable(building_types.values())))
+        
+        # Tidy (year, type, count) table for a single stacked px.bar call
+        type_names = [building_type.title() for building_type in all_types]
+        counts = _frame(building_types, years, all_types)
+        counts.columns = type_names
+        df = counts.rename_axis('year').reset_index().melt(
+            id_vars='year', var_name='type', value_name='count'
+        )
         
-        # Update layout
-        fig.update_layout(
-            title='Building Type Distribution Over Time',
-            xaxis_title='Year',
-            yaxis_title='Number of Buildings',
+        return px.bar(
+            df, x='year', y='count', color='type',
             barmode='stack',
+            color_discrete_map=dict(zip(type_names, islice(cycle(px.colors.qualitative.Set3), len(type_names)))),
+            category_orders={'type': type_names},
+            labels={'year': 'Year', 'count': 'Number of Buildings', 'type': 'Building Type'},
+            title='Building Type Distribution Over Time',
             template='plotly_white',
             height=500
         )
-        
-        return fig
     
+    @_cached_figure()
     def create_density_metrics_chart(self, density_by_year: Dict[int, Dict[str, Any]]) -> go.Figure:
         """
         Create a chart showing density metrics over time.
         
         Args:
             density_by_year: Density metrics by year
+            render: 'interactive' for a figure, 'png'/'svg' for static image bytes
             
         Returns:
             Plotly figure with density metrics
@@ -249,100 +497,64 @@ class ChartGenerator:
         if not density_by_year:
             return go.Figure()
         
-        years = sorted(density_by_year.keys())
+        years = np.fromiter(sorted(density_by_year.keys()), dtype=np.int32, count=len(density_by_year))
         
         # Extract metrics
-        building_density = [density_by_year[year].get('buildings_per_km2', 0) for year in years]
-        road_density = [density_by_year[year].get('road_length_km_per_km2', 0) for year in years]
-        coverage_ratio = [density_by_year[year].get('building_coverage_ratio', 0) * 100 for year in years]  # Convert to percentage
-        
-        # Create subplot
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=(
-                'Building Density (buildings/km²)',
-                'Road Density (km/km²)',
-                'Building Coverage Ratio (%)',
-                'Average Building Size (m²)'
-            ),
-            vertical_spacing=0.1,
-            horizontal_spacing=0.1
-        )
-        
-        # Building density
-        fig.add_trace(
-            go.Scatter(
-                x=years,
-                y=building_density,
-                mode='lines+markers',
-                name='Building Density',
-                line=dict(color='#2E86AB', width=3),
-                marker=dict(size=8)
-            ),
-            row=1, col=1
-        )
-        
-        # Road density
-        fig.add_trace(
-            go.Scatter(
-                x=years,
-                y=road_density,
-                mode='lines+markers',
-                name='Road Density',
-                line=dict(color='#1B4332', width=3),
-                marker=dict(size=8)
-            ),
-            row=1, col=2
-        )
-        
-        # Coverage ratio
-        fig.add_trace(
-            go.Scatter(
-                x=years,
-                y=coverage_ratio,
-                mode='lines+markers',
-                name='Coverage Ratio',
-                line=dict(color='#A23B72', width=3),
-                marker=dict(size=8)
-            ),
-            row=2, col=1
-        )
-        
-        # Average building size
-        avg_building_size = [density_by_year[year].get('avg_building_area_m2', 0) for year in years]
-        fig.add_trace(
-            go.Scatter(
-                x=years,
-                y=avg_building_size,
-                mode='lines+markers',
-                name='Avg Building Size',
-                line=dict(color='#F18F01', width=3),
-                marker=dict(size=8)
-            ),
-            row=2, col=2
-        )
-        
-        # Update layout
-        fig.update_layout(
+        density = _frame(density_by_year, years, [
+            'buildings_per_km2', 'road_length_km_per_km2',
+            'building_coverage_ratio', 'avg_building_area_m2'
+        ])
+        density['building_coverage_ratio'] *= 100  # Convert to percentage
+        building_density = density['buildings_per_km2'].to_numpy()
+        road_density = density['road_length_km_per_km2'].to_numpy()
+        coverage_ratio = density['building_coverage_ratio'].to_numpy()
+        avg_building_size = density['avg_building_area_m2'].to_numpy()
+        
+        # One tidy frame, one faceted px.line call instead of four subplots
+        import plotly.express as px
+        
+        metric_titles = [
+            'Building Density (buildings/km²)',
+            'Road Density (km/km²)',
+            'Building Coverage Ratio (%)',
+            'Average Building Size (m²)'
+        ]
+        df = pd.DataFrame({
+            'year': np.tile(years, len(metric_titles)),
+            'value': np.concatenate([building_density, road_density, coverage_ratio, avg_building_size]),
+            'metric': np.repeat(metric_titles, len(years))
+        })
+        
+        fig = px.line(
+            df, x='year', y='value',
+            facet_col='metric', facet_col_wrap=2,
+            facet_row_spacing=0.1, facet_col_spacing=0.1,
+            color='metric',
+            color_discrete_sequence=['#2E86AB', '#1B4332', '#A23B72', '#F18F01'],
+            category_orders={'metric': metric_titles},
+            markers=True,
+            labels={'year': 'Year', 'value': ''},
             title='Urban Density Metrics Over Time',
             height=600,
-            showlegend=False,
             template='plotly_white'
         )
         
-        # Update all x-axes
-        for row in range(1, 3):
-            for col in range(1, 3):
-                fig.update_xaxes(title_text="Year", row=row, col=col)
+        # Independent y-axes per metric, plain metric names as facet titles
+        fig.update_traces(line_width=3, marker_size=8)
+        fig.update_yaxes(matches=None, showticklabels=True)
+        fig.for_each_annotation(lambda annotation: annotation.update(text=annotation.text.split('=', 1)[-1]))
+        fig.update_layout(showlegend=False)
         
         return fig
     
+    @_cached_figure()
     def create_sprawl_analysis_chart(self, sprawl_data: Dict[str, Any]) -> go.Figure:
         """
         Create charts analyzing urban sprawl patterns.
         
         Args:
             sprawl_data: Urban sprawl analysis data
+            render: 'interactive' for a figure, 'png'/'svg' for static image bytes
             
         Returns:
             Plotly figure with sprawl analysis
@@ -350,16 +562,15 @@ class ChartGenerator:
         if 'sprawl_indices' not in sprawl_data or 'years' not in sprawl_data:
             return go.Figure()
         
-        years = sprawl_data['years']
+        years = np.asarray(sprawl_data['years'], dtype=np.int32)
         sprawl_indices = sprawl_data['sprawl_indices']
         
         # Extract sprawl metrics
-        mean_distances = [sprawl_indices.get(year, {}).get('mean_distance_from_center', 0) / 1000 
-                         for year in years]  # Convert to km
-        max_distances = [sprawl_indices.get(year, {}).get('max_distance_from_center', 0) / 1000 
-                        for year in years]  # Convert to km
-        urban_extents = [sprawl_data['urban_extent'].get(year, 0) / 1_000_000 
-                        for year in years]  # Convert to km²
+        distances = _frame(sprawl_indices, years, ['mean_distance_from_center', 'max_distance_from_center'])
+        distances *= 1e-3  # Convert to km
+        mean_distances = distances['mean_distance_from_center'].to_numpy()
+        max_distances = distances['max_distance_from_center'].to_numpy()
+        urban_extents = _series(sprawl_data['urban_extent'], years, scale=1e-6)  # Convert to km²
         
         # Create subplot
         fig = make_subplots(
@@ -374,9 +585,9 @@ class ChartGenerator:
             horizontal_spacing=0.1
         )
         
-        # Mean distance from center
-        fig.add_trace(
-            go.Scatter(
+        traces = [
+            # Mean distance from center
+            _scatter(
                 x=years,
                 y=mean_distances,
                 mode='lines+markers',
@@ -384,12 +595,8 @@ class ChartGenerator:
                 line=dict(color='#2E86AB', width=3),
                 marker=dict(size=8)
             ),
-            row=1, col=1
-        )
-        
-        # Maximum distance from center
-        fig.add_trace(
-            go.Scatter(
+            # Maximum distance from center
+            _scatter(
                 x=years,
                 y=max_distances,
                 mode='lines+markers',
@@ -397,40 +604,38 @@ class ChartGenerator:
                 line=dict(color='#A23B72', width=3),
                 marker=dict(size=8)
             ),
-            row=1, col=2
-        )
-        
-        # Urban extent
-        fig.add_trace(
-            go.Scatter(
+            # Urban extent
+            _scatter(
                 x=years,
                 y=urban_extents,
                 mode='lines+markers',
                 name='Urban Extent',
                 line=dict(color='#F18F01', width=3),
                 marker=dict(size=8)
-            ),
-            row=2, col=1
-        )
+            )
+        ]
+        rows, cols = [1, 1, 2], [1, 2, 1]
         
         # Distance band distribution for latest year
-        if 'distance_bands' in sprawl_data and years:
+        if 'distance_bands' in sprawl_data and len(years):
             latest_year = max(years)
             distance_bands = sprawl_data['distance_bands'].get(latest_year, {})
             
             if distance_bands:
                 bands = list(distance_bands.keys())
-                counts = list(distance_bands.values())
+                counts = np.fromiter(distance_bands.values(), dtype=np.float64, count=len(distance_bands))
                 
-                fig.add_trace(
-                    go.Bar(
-                        x=bands,
-                        y=counts,
-                        name='Building Count',
-                        marker_color='#1B4332'
-                    ),
-                    row=2, col=2
-                )
+                traces.append(_bar(
+                    x=bands,
+                    y=counts,
+                    name='Building Count',
+                    marker_color='#1B4332'
+                ))
+                rows.append(2)
+                cols.append(2)
+        
+        # Add all traces in one batch
+        fig.add_traces(traces, rows=rows, cols=cols)
         
         # Update layout
         fig.update_layout(
@@ -451,12 +656,14 @@ class ChartGenerator:
         
         return fig
     
+    @_cached_figure(_comparison_inputs)
     def create_comparison_dashboard(self, analysis_results: Dict[str, Any]) -> go.Figure:
         """
         Create a comprehensive comparison dashboard.
         
         Args:
             analysis_results: Complete analysis results
+            render: 'interactive' for a figure, 'png'/'svg' for static image bytes
             
         Returns:
             Plotly figure with comparison dashboard
@@ -469,7 +676,7 @@ class ChartGenerator:
         if 'years' not in building_metrics:
             return go.Figure()
         
-        years = building_metrics['years']
+        years = np.asarray(building_metrics['years'])
         
         # Create subplot with 2x2 layout
         fig = make_subplots(
@@ -477,97 +684,53 @@ class ChartGenerator:
             subplot_titles=(
                 'Buildings vs Roads Count',
                 'Total Area vs Road Length',
-                'Growth Rates Comparison',
-                'Key Performance Indicators'
+                'Growth Rates Comparison'
             ),
             specs=[[{"secondary_y": True}, {"secondary_y": True}],
-                   [{"type": "bar"}, {"type": "table"}]],
+                   [{"type": "bar", "colspan": 2}, None]],
             vertical_spacing=0.15
         )
         
         # Buildings vs Roads count
-        building_counts = [building_metrics['building_counts'].get(year, 0) for year in years]
-        road_counts = [road_metrics['road_counts'].get(year, 0) for year in years]
-        
-        fig.add_trace(
-            go.Scatter(x=years, y=building_counts, name='Buildings', 
-                      line=dict(color='#2E86AB', width=3), marker=dict(size=8)),
-            row=1, col=1
-        )
-        fig.add_trace(
-            go.Scatter(x=years, y=road_counts, name='Roads',
-                      line=dict(color='#1B4332', width=3), marker=dict(size=8)),
-            row=1, col=1, secondary_y=True
-        )
+        building_counts = _series(building_metrics['building_counts'], years)
+        road_counts = _series(road_metrics['road_counts'], years)
         
         # Total area vs road length
-        building_areas = [building_metrics['total_area_m2'].get(year, 0) / 1_000_000 for year in years]
-        road_lengths = [road_metrics['total_length_km'].get(year, 0) for year in years]
+        building_areas = _series(building_metrics['total_area_m2'], years, scale=1e-6)
+        road_lengths = _series(road_metrics['total_length_km'], years)
+        
+        # Traces with their (row, col, secondary_y) placement, added in one batch
+        traces = [
+            _scatter(x=years, y=building_counts, name='Buildings', 
+                     line=dict(color='#2E86AB', width=3), marker=dict(size=8)),
+            _scatter(x=years, y=road_counts, name='Roads',
+                     line=dict(color='#1B4332', width=3), marker=dict(size=8)),
+            _scatter(x=years, y=building_areas, name='Building Area (km²)',
+                     line=dict(color='#A23B72', width=3), marker=dict(size=8)),
+            _scatter(x=years, y=road_lengths, name='Road Length (km)',
+                     line=dict(color='#52B788', width=3), marker=dict(size=8))
+        ]
+        placements = [(1, 1, False), (1, 1, True), (1, 2, False), (1, 2, True)]
+        
+        # Growth rates comparison (from the per-year counts above)
+        periods = _periods(years.tolist())
         
-        fig.add_trace(
-            go.Scatter(x=years, y=building_areas, name='Building Area (km²)',
-                      line=dict(color='#A23B72', width=3), marker=dict(size=8)),
-            row=1, col=2
-        )
-        fig.add_trace(
-            go.Scatter(x=years, y=road_lengths, name='Road Length (km)',
-                      line=dict(color='#52B788', width=3), marker=dict(size=8)),
-            row=1, col=2, secondary_y=True
-        )
-        
-        # Growth rates comparison
         if 'growth_rates' in building_metrics:
-            growth_rates = building_metrics['growth_rates']
-            periods = list(growth_rates.keys())
-            building_growth = [growth_rates[period].get('count_growth_percent', 0) for period in periods]
+            building_growth = _growth_pct(building_counts)
             
-            fig.add_trace(
-                go.Bar(x=periods, y=building_growth, name='Building Growth (%)',
-                      marker_color='#2E86AB'),
-                row=2, col=1
-            )
+            traces.append(_bar(x=periods, y=building_growth, name='Building Growth (%)',
+                               marker_color='#2E86AB'))
+            placements.append((2, 1, False))
         
         if 'growth_rates' in road_metrics:
-            road_growth_rates = road_metrics['growth_rates']
-            road_growth = [road_growth_rates[period].get('count_growth_percent', 0) for period in periods]
+            road_growth = _growth_pct(road_counts)
             
-            fig.add_trace(
-                go.Bar(x=periods, y=road_growth, name='Road Growth (%)',
-                      marker_color='#1B4332'),
-                row=2, col=1
-            )
+            traces.append(_bar(x=periods, y=road_growth, name='Road Growth (%)',
+                               marker_color='#1B4332'))
+            placements.append((2, 1, False))
         
-        # KPI Table
-        if years:
-            latest_year = max(years)
-            earliest_year = min(years)
-            
-            # Calculate KPIs
-            total_buildings = building_metrics['building_counts'].get(latest_year, 0)
-            total_roads = road_metrics['road_counts'].get(latest_year, 0)
-            
-            building_change = (building_metrics['building_counts'].get(latest_year, 0) - 
-                             building_metrics['building_counts'].get(earliest_year, 0))
-            road_change = (road_metrics['road_counts'].get(latest_year, 0) - 
-                          road_metrics['road_counts'].get(earliest_year, 0))
-            
-            # Create table
-            fig.add_trace(
-                go.Table(
-                    header=dict(values=['Metric', 'Value'],
-                               fill_color='lightblue',
-                               align='left'),
-                    cells=dict(values=[
-                        ['Total Buildings', 'Total Roads', 'Building Growth', 'Road Growth', 'Analysis Period'],
-                        [f'{total_buildings:,}', f'{total_roads:,}', 
-                         f'+{building_change:,}', f'+{road_change:,}',
-                         f'{earliest_year}-{latest_year}']
-                    ],
-                    fill_color='white',
-                    align='left')
-                ),
-                row=2, col=2
-            )
+        rows, cols, secondary_ys = (list(values) for values in zip(*placements))
+        fig.add_traces(traces, rows=rows, cols=cols, secondary_ys=secondary_ys)
         
         # Update layout
         fig.update_layout(
@@ -579,6 +742,44 @@ class ChartGenerator:
         
         return fig
     
+    def create_comparison_kpis(self, analysis_results: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Compute the key performance indicators shown next to the comparison dashboard.
+        
+        Kept out of the figure (instead of a plotly Table trace) so callers can
+        render them with lightweight native widgets.
+        
+        Args:
+            analysis_results: Complete analysis results
+            
+        Returns:
+            Dictionary mapping KPI label to formatted value (empty without data)
+        """
+        building_metrics, road_metrics = _comparison_inputs(analysis_results)
+        years = building_metrics.get('years', [])
+        
+        if not years:
+            return {}
+        
+        latest_year = max(years)
+        earliest_year = min(years)
+        building_counts = building_metrics.get('building_counts', {})
+        road_counts = road_metrics.get('road_counts', {})
+        
+        # Calculate KPIs
+        total_buildings = building_counts.get(latest_year, 0)
+        total_roads = road_counts.get(latest_year, 0)
+        building_change = total_buildings - building_counts.get(earliest_year, 0)
+        road_change = total_roads - road_counts.get(earliest_year, 0)
+        
+        return {
+            'Total Buildings': f'{total_buildings:,}',
+            'Total Roads': f'{total_roads:,}',
+            'Building Growth': f'+{building_change:,}',
+            'Road Growth': f'+{road_change:,}',
+            'Analysis Period': f'{earliest_year}-{latest_year}'
+        }
+    
     def create_summary_statistics_table(self, analysis_results: Dict[str, Any]) -> pd.DataFrame:
         """
         Create a summary statistics table.
@@ -589,42 +790,39 @@ class ChartGenerator:
         Returns:
             DataFrame with summary statistics
         """
-        summary_data = []
+        summary_frames = []
         
         # Extract quantitative data
         quant_data = analysis_results.get('quantitative_analysis', {})
         
         if 'building_metrics' in quant_data:
             building_metrics = quant_data['building_metrics']
-            years = building_metrics.get('years', [])
+            years = np.asarray(building_metrics.get('years', []))
             
-            for year in years:
-                building_count = building_metrics.get('building_counts', {}).get(year, 0)
-                building_area = building_metrics.get('total_area_m2', {}).get(year, 0)
-                avg_building_size = building_metrics.get('average_building_size_m2', {}).get(year, 0)
-                
-                summary_data.append({
-                    'Year': year,
-                    'Metric': 'Buildings',
-                    'Count': building_count,
-                    'Total Area (km²)': building_area / 1_000_000,
-                    'Average Size (m²)': avg_building_size
-                })
+            summary_frames.append(pd.DataFrame({
+                'Year': years,
+                'Metric': 'Buildings',
+                'Count': _series(building_metrics.get('building_counts', {}), years).astype(np.int64),
+                'Total Area (km²)': _series(building_metrics.get('total_area_m2', {}), years, scale=1e-6),
+                'Average Size (m²)': _series(building_metrics.get('average_building_size_m2', {}), years)
+            }))
         
         if 'road_metrics' in quant_data:
             road_metrics = quant_data['road_metrics']
-            years = road_metrics.get('years', [])
+            years = np.asarray(road_metrics.get('years', []))
+            road_counts = _series(road_metrics.get('road_counts', {}), years)
+            road_lengths = _series(road_metrics.get('total_length_km', {}), years)
             
-            for year in years:
-                road_count = road_metrics.get('road_counts', {}).get(year, 0)
-                road_length = road_metrics.get('total_length_km', {}).get(year, 0)
-                
-                summary_data.append({
-                    'Year': year,
-                    'Metric': 'Roads',
-                    'Count': road_count,
-                    'Total Length (km)': road_length,
-                    'Average Length (m)': (road_length * 1000 / road_count) if road_count > 0 else 0
-                })
-        
-        return pd.DataFrame(summary_data)
+            summary_frames.append(pd.DataFrame({
+                'Year': years,
+                'Metric': 'Roads',
+                'Count': road_counts.astype(np.int64),
+                'Total Length (km)': road_lengths,
+                'Average Length (m)': np.divide(road_lengths * 1000, road_counts,
+                                                out=np.zeros_like(road_lengths), where=road_counts > 0)
+            }))
+        
+        if not summary_frames:
+            return pd.DataFrame()
+        
+        return pd.concat(summary_frames, ignore_index=True)
@@ -4,12 +4,19 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import geopandas as gpd
-from typing import Dict, List, Any, Optional
-import plotly.graph_objects as go
-import folium
-from streamlit_folium import st_folium
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple, Callable, Mapping
+import shapely
+from shapely.geometry import box
+import streamlit.components.v1 as components
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import gc
+import json
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
 import time
 import sys
+import hashlib
 from pathlib import Path
 
 # Add src to Python path for direct execution
@@ -17,10 +24,614 @@ current_file = Path(__file__).resolve()
 src_path = current_file.parent.parent.parent
 sys.path.insert(0, str(src_path))
 
-from osmd.utils import ConfigManager, Logger, BoundingBox
-from osmd.analysis import UrbanGrowthAnalyzer
-from osmd.visualization.maps import MapVisualizer
-from osmd.visualization.charts import ChartGenerator
+from osmd.utils import ConfigManager, Logger, BoundingBox, calculate_area
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, exports fall back to the json module
+    orjson = None
+
+try:
+    import diskcache
+except ImportError:  # Optional dependency, rendered maps are only kept in memory
+    diskcache = None
+
+# Analysis (scipy/scikit-learn), map (folium) and chart (plotly) modules are
+# imported when first needed, so the home page renders without loading them
+if TYPE_CHECKING:
+    import folium
+    import pyarrow as pa
+    import plotly.graph_objects as go
+    from osmd.analysis import UrbanGrowthAnalyzer
+    from osmd.visualization.maps import MapVisualizer
+    from osmd.visualization.charts import ChartGenerator
+
+
+# Streamlit reruns the whole script on every widget interaction, so analysis
+# results, maps, figures and tables are memoized across reruns
+CACHE_TTL_SECONDS = 3600
+CACHE_MAX_ENTRIES = 32
+
+# Sections decorated with this rerun on their own when their widgets change
+# (st.fragment on Streamlit >= 1.37, st.experimental_fragment on 1.33-1.36,
+# a no-op on older releases)
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+# Analysis results hold every processed GeoDataFrame, and are also persisted to
+# disk by _run_analysis, so only the latest run is kept in server memory
+ANALYSIS_CACHE_MAX_ENTRIES = 1
+
+# Rendered map HTML can run to tens of MB, so fewer maps are kept than other results
+MAP_CACHE_MAX_ENTRIES = 8
+
+# Size limit of the on-disk rendered map cache, which survives server restarts
+MAP_DISK_CACHE_SIZE_LIMIT = 2 ** 30
+
+# Background threads rendering map HTML, shared by all sessions
+MAP_RENDER_WORKERS = 2
+
+# Cache statistics walk the cache directories, so they are refreshed at most this often
+CACHE_STATS_TTL_SECONDS = 30
+
+# Geometries are simplified to this tolerance (degrees, ~1 m) before being drawn on maps
+MAP_SIMPLIFY_TOLERANCE_DEG = 1e-5
+
+# Heatmaps are fed at most this many points, sampled proportionally over a grid of cells
+HEATMAP_MAX_POINTS = 20_000
+HEATMAP_GRID_CELLS = 100
+
+# Column statistics on larger frames are computed from a random sample of this many rows
+DESCRIBE_SAMPLE_ROWS = 50_000
+
+
+@st.cache_resource
+def _default_config() -> ConfigManager:
+    """Load the default configuration once per Streamlit server process."""
+    return ConfigManager()
+
+
+@st.cache_resource
+def _analyzer(config_path: str) -> 'UrbanGrowthAnalyzer':
+    """Create the urban growth analyzer once per configuration file."""
+    from osmd.analysis import UrbanGrowthAnalyzer
+    return UrbanGrowthAnalyzer(ConfigManager(config_path))
+
+
+@st.cache_resource
+def _map_visualizer(config_path: str) -> 'MapVisualizer':
+    """Create the map visualizer once per configuration file."""
+    from osmd.visualization.maps import MapVisualizer
+    return MapVisualizer(ConfigManager(config_path))
+
+
+@st.cache_resource
+def _chart_generator(config_path: str) -> 'ChartGenerator':
+    """Create the chart generator once per configuration file."""
+    from osmd.visualization.charts import ChartGenerator
+    return ChartGenerator(ConfigManager(config_path))
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=ANALYSIS_CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_analysis(config_path: str,
+                     bbox: Tuple[float, float, float, float],
+                     years: Tuple[int, ...],
+                     features: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Run the urban growth analysis once per (bbox, years, features) combination.
+    
+    Args:
+        config_path: Path to the configuration file
+        bbox: Bounding box as (south, west, north, east)
+        years: Years to analyze
+        features: OSM features to collect
+        
+    Returns:
+        Analysis results dictionary
+    """
+    analyzer = _analyzer(config_path)
+    return analyzer.analyze_urban_growth(BoundingBox(*bbox), list(years), list(features))
+
+
+@st.cache_data(ttl=CACHE_STATS_TTL_SECONDS, show_spinner=False)
+def _cache_statistics(config_path: str) -> Dict[str, Any]:
+    """
+    Cache usage statistics, refreshed every CACHE_STATS_TTL_SECONDS.
+    
+    Args:
+        config_path: Path to the configuration file
+        
+    Returns:
+        Dictionary with cache statistics
+    """
+    return _analyzer(config_path).get_cache_statistics()
+
+
+@st.cache_resource
+def _map_disk_cache(config_path: str) -> Optional['diskcache.Cache']:
+    """
+    Open the on-disk rendered map cache once per configuration file.
+    
+    Maps are stored under the OSM cache directory, in a subdirectory per set of
+    visualization settings, so maps drawn with other settings are never served.
+    
+    Args:
+        config_path: Path to the configuration file
+        
+    Returns:
+        Disk cache, or None when diskcache is not installed or caching is disabled
+    """
+    config = ConfigManager(config_path)
+    if diskcache is None or not config.is_cache_enabled():
+        return None
+    
+    settings = hashlib.blake2b(repr(sorted(config.get_visualization_config().items())).encode(),
+                               digest_size=8).hexdigest()
+    directory = config.get_cache_dir() / "maps" / settings
+    return diskcache.Cache(str(directory), size_limit=MAP_DISK_CACHE_SIZE_LIMIT)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=MAP_CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_map_html(cache_key: tuple, _build: Callable[[], 'folium.Map'],
+                     _disk_cache: Optional['diskcache.Cache'] = None) -> str:
+    """
+    Build a Folium map and render it to standalone HTML once per cache key.
+    
+    Args:
+        cache_key: Identity of the map, including a content hash of its data
+        _build: Builds the Folium map
+        _disk_cache: Persistent cache checked before building, if available
+        
+    Returns:
+        Map HTML
+    """
+    if _disk_cache is None:
+        return _build().get_root().render()
+    
+    disk_key = hashlib.blake2b(repr(cache_key).encode(), digest_size=16).hexdigest()
+    html = _disk_cache.get(disk_key)
+    if html is None:
+        html = _build().get_root().render()
+        _disk_cache.set(disk_key, html)
+    return html
+
+
+@st.cache_resource
+def _map_executor() -> ThreadPoolExecutor:
+    """Create the map rendering thread pool once per Streamlit server process."""
+    return ThreadPoolExecutor(max_workers=MAP_RENDER_WORKERS, thread_name_prefix="map-render")
+
+
+def _render_map_async(cache_key: tuple, build: Callable[[], 'folium.Map'],
+                      disk_cache: Optional['diskcache.Cache'] = None) -> 'Future[str]':
+    """
+    Render a map to HTML (through _cached_map_html) on a background thread.
+    
+    Lets a page draw its other elements while a large map renders; cached
+    maps resolve immediately.
+    
+    Args:
+        cache_key: Identity of the map
+        build: Builds the Folium map
+        disk_cache: Persistent map cache, if available
+        
+    Returns:
+        Future resolving to the map HTML
+    """
+    ctx = get_script_run_ctx()
+    
+    def render() -> str:
+        # Streamlit caches look up the session through the script run context
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return _cached_map_html(cache_key, build, disk_cache)
+    
+    return _map_executor().submit(render)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _content_hash(cache_key: tuple, _load: Callable[[], List[gpd.GeoDataFrame]]) -> str:
+    """
+    Cheap content fingerprint of GeoDataFrames, computed once per cache key.
+    
+    Covers shape, columns, bounds, index and numeric columns, so maps built from
+    identical data in different analysis runs share one rendering.
+    
+    Args:
+        cache_key: Identity of the frames (analysis run and layer selection)
+        _load: Returns the GeoDataFrames to fingerprint; only called on a cache
+            miss, so offloaded layers are not read for a cached hash
+        
+    Returns:
+        BLAKE2b hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    
+    for gdf in _load():
+        digest.update(repr((gdf.shape, tuple(gdf.columns))).encode())
+        if gdf.empty:
+            continue
+        
+        digest.update(np.asarray(gdf.total_bounds).tobytes())
+        digest.update(pd.util.hash_pandas_object(gdf.index).to_numpy().tobytes())
+        numeric = gdf.select_dtypes(include=[np.number])
+        if len(numeric.columns) > 0:
+            digest.update(pd.util.hash_pandas_object(numeric, index=False).to_numpy().tobytes())
+    
+    return digest.hexdigest()
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_chart(cache_key: tuple, _build: Callable[[], 'go.Figure']) -> 'go.Figure':
+    """Build a plotly figure once per cache key."""
+    return _build()
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_comparison(cache_key: tuple, 
+                       _build: Callable[[], Tuple[Dict[str, str], 'go.Figure']]
+                       ) -> Tuple[Dict[str, str], 'go.Figure']:
+    """Build the comparison KPIs and figure once per cache key."""
+    return _build()
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_table(cache_key: tuple, _build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    """Build a summary DataFrame once per cache key."""
+    return _build()
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_text(cache_key: tuple, _build: Callable[[], Any]) -> Any:
+    """Serialize an export (JSON, CSV) to text or bytes once per cache key."""
+    return _build()
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _to_arrow(cache_key: tuple, _df: pd.DataFrame) -> 'pa.Table':
+    """
+    Convert a DataFrame for display to an Arrow table once per cache key.
+    
+    Args:
+        cache_key: Identity of the frame
+        _df: DataFrame to convert
+        
+    Returns:
+        Arrow table, with mixed-type object columns (e.g. OSM tag dicts) as text
+    """
+    import pyarrow as pa
+    
+    try:
+        return pa.Table.from_pandas(_df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        object_columns = _df.select_dtypes(include='object').columns
+        return pa.Table.from_pandas(_df.astype({column: str for column in object_columns}),
+                                    preserve_index=False)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _describe(cache_key: tuple, _numeric_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Column statistics, computed on a fixed-seed sample for large frames.
+    
+    Args:
+        cache_key: Identity of the frame (analysis run, feature type, year)
+        _numeric_df: Numeric columns of the frame
+        
+    Returns:
+        Output of DataFrame.describe()
+    """
+    if len(_numeric_df) > DESCRIBE_SAMPLE_ROWS:
+        _numeric_df = _numeric_df.sample(DESCRIBE_SAMPLE_ROWS, random_state=0)
+    return _numeric_df.describe()
+
+
+def _non_empty_years(feature_data: Mapping[int, gpd.GeoDataFrame]) -> List[int]:
+    """
+    Sorted years with a non-empty GeoDataFrame.
+    
+    Offloaded results (LazyGeoDataFrames) answer from their layout without
+    reading any Parquet layer.
+    
+    Args:
+        feature_data: GeoDataFrames of one feature type by year
+        
+    Returns:
+        Sorted list of years
+    """
+    non_empty_years = getattr(feature_data, 'non_empty_years', None)
+    if non_empty_years is not None:
+        return non_empty_years()
+    return sorted(year for year, gdf in feature_data.items() if not gdf.empty)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _available_data(cache_key: tuple,
+                    _processed_data: Dict[str, Dict[int, gpd.GeoDataFrame]]) -> Dict[str, Any]:
+    """
+    Index which feature types and years have data, once per analysis run.
+    
+    Args:
+        cache_key: Analysis run key from _results_key
+        _processed_data: Processed data by feature type and year
+        
+    Returns:
+        Dictionary with 'features_any' (types with data in any year),
+        'features_multi' (types with data in at least two years) and
+        'years_by_feature' (sorted non-empty years per type)
+    """
+    years_by_feature = {
+        feature_type: _non_empty_years(feature_data)
+        for feature_type, feature_data in _processed_data.items()
+    }
+    return {
+        'features_any': [key for key, years in years_by_feature.items() if years],
+        'features_multi': [key for key, years in years_by_feature.items() if len(years) >= 2],
+        'years_by_feature': years_by_feature
+    }
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _hotspot_statistics(cache_key: tuple,
+                        _hotspots: Dict[str, gpd.GeoDataFrame]) -> pd.DataFrame:
+    """
+    Hotspot count, mean and maximum growth per period in one groupby.
+    
+    Args:
+        cache_key: Analysis run key from _results_key
+        _hotspots: Hotspot GeoDataFrames by period
+        
+    Returns:
+        DataFrame indexed by period with 'count', 'mean' and 'max' columns
+    """
+    frames = [pd.DataFrame({'period': period, 'absolute_growth': gdf['absolute_growth'].to_numpy()})
+              for period, gdf in _hotspots.items() if not gdf.empty]
+    if not frames:
+        return pd.DataFrame(columns=['count', 'mean', 'max'])
+    
+    all_hotspots = pd.concat(frames, ignore_index=True)
+    return all_hotspots.groupby('period', sort=False)['absolute_growth'].agg(['count', 'mean', 'max'])
+
+
+@st.cache_data(show_spinner=False)
+def _bbox_area_km2(bbox: Tuple[float, float, float, float]) -> float:
+    """
+    Area of a bounding box in km², measured in its UTM zone.
+    
+    Args:
+        bbox: Bounding box as (south, west, north, east)
+        
+    Returns:
+        Area in square kilometers
+    """
+    south, west, north, east = bbox
+    return calculate_area(box(west, south, east, north)) / 1_000_000
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _total_area_km2(cache_key: tuple, _areas_m2: pd.Series) -> float:
+    """Sum of feature areas in km², once per (analysis run, feature type, year)."""
+    return float(_areas_m2.sum()) / 1_000_000
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _building_summary(cache_key: tuple, _building_metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Latest building count and growth between the first and last analysis years.
+    
+    Args:
+        cache_key: Analysis run key from _results_key
+        _building_metrics: Building metrics with 'years' and 'building_counts'
+        
+    Returns:
+        Dictionary with 'latest_year', 'latest', 'growth' and 'rate' (percent)
+    """
+    counts = pd.Series(_building_metrics.get('building_counts', {}), dtype='int64')
+    counts = counts.reindex(sorted(_building_metrics['years']), fill_value=0)
+    earliest, latest = int(counts.iloc[0]), int(counts.iloc[-1])
+    return {
+        'latest_year': int(counts.index[-1]),
+        'latest': latest,
+        'growth': latest - earliest,
+        'rate': (latest - earliest) / earliest * 100 if earliest > 0 else 0
+    }
+
+
+def _simplified(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """
+    Copy of a GeoDataFrame with geometries simplified for map display.
+    
+    Args:
+        gdf: GeoDataFrame in geographic coordinates
+        
+    Returns:
+        GeoDataFrame with vertex-reduced geometries
+    """
+    if gdf.empty:
+        return gdf
+    
+    simplified = gdf.copy()
+    simplified[gdf.geometry.name] = gpd.GeoSeries(
+        shapely.simplify(gdf.geometry.values, MAP_SIMPLIFY_TOLERANCE_DEG, preserve_topology=False),
+        index=gdf.index, crs=gdf.crs
+    )
+    return simplified
+
+
+def _heat_points(gdf: gpd.GeoDataFrame) -> np.ndarray:
+    """
+    Building centroids as an (n, 2) [lat, lon] array for the density heatmap.
+    
+    Frames larger than HEATMAP_MAX_POINTS are downsampled with grid-stratified
+    sampling: each grid cell keeps the same share of its points, so the relative
+    density the heatmap shows is preserved.
+    
+    Args:
+        gdf: GeoDataFrame in geographic coordinates
+        
+    Returns:
+        Array of [lat, lon] rows
+    """
+    centroids = shapely.centroid(gdf.geometry.values)
+    coords = np.stack([shapely.get_y(centroids), shapely.get_x(centroids)], axis=1)
+    
+    n_points = len(coords)
+    if n_points <= HEATMAP_MAX_POINTS:
+        return coords
+    
+    # Grid cell of each point
+    low, high = coords.min(axis=0), coords.max(axis=0)
+    bins = ((coords - low) / np.where(high > low, high - low, 1) * (HEATMAP_GRID_CELLS - 1)).astype(np.int64)
+    cells = bins[:, 0] * HEATMAP_GRID_CELLS + bins[:, 1]
+    
+    # Rank points within their cell in random order and keep the first share of each cell
+    order = np.random.default_rng(0).permutation(n_points)
+    sorter = np.argsort(cells[order], kind='stable')
+    sorted_cells = cells[order][sorter]
+    rank = np.arange(n_points) - np.searchsorted(sorted_cells, sorted_cells, side='left')
+    quota = np.ceil(np.bincount(cells)[sorted_cells] * (HEATMAP_MAX_POINTS / n_points))
+    
+    return coords[order[sorter[rank < quota]]]
+
+
+def _json_scalar(value: Any) -> Any:
+    """JSON-encode nested values (dicts, lists) and pass scalars through."""
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, default=str)
+    return value
+
+
+def _write_ogr(gdf: gpd.GeoDataFrame, driver: str, suffix: str) -> bytes:
+    """
+    Encode a GeoDataFrame with an OGR driver through pyogrio.
+    
+    The layer is written in one pass to a temporary file and read back as bytes.
+    
+    Args:
+        gdf: GeoDataFrame to export
+        driver: OGR driver name
+        suffix: File extension of the driver's format
+        
+    Returns:
+        Encoded file contents
+    """
+    # OGR fields must be scalar, so nested values (e.g. OSM tag dicts) are written
+    # as JSON text; scalars, None and NaN are left for the driver to write as-is
+    object_columns = [column for column in gdf.select_dtypes(include='object').columns
+                      if column != gdf.geometry.name]
+    gdf = gdf.assign(**{
+        column: gdf[column].map(_json_scalar) for column in object_columns
+    })
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"export.{suffix}"
+        gdf.to_file(path, driver=driver, engine='pyogrio')
+        return path.read_bytes()
+
+
+def _geojson_seq(gdf: gpd.GeoDataFrame) -> bytes:
+    """
+    Encode a GeoDataFrame as newline-delimited GeoJSON (GeoJSONSeq), one feature per line.
+    
+    Args:
+        gdf: GeoDataFrame to export
+        
+    Returns:
+        Encoded GeoJSONSeq bytes
+    """
+    return _write_ogr(gdf, 'GeoJSONSeq', 'geojsonl')
+
+
+def _flatgeobuf(gdf: gpd.GeoDataFrame) -> bytes:
+    """
+    Encode a GeoDataFrame as binary FlatGeobuf.
+    
+    Args:
+        gdf: GeoDataFrame to export
+        
+    Returns:
+        Encoded FlatGeobuf bytes
+    """
+    return _write_ogr(gdf, 'FlatGeobuf', 'fgb')
+
+
+def _json_bytes(data: Any) -> bytes:
+    """
+    Encode data as indented UTF-8 JSON, with orjson when it is installed.
+    
+    Args:
+        data: JSON-like data; values JSON can't represent are written as text
+        
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # orjson rejects some keys (e.g. tuples) that json also rejects, but
+            # the json module's error is the one users already know
+            pass
+    
+    return json.dumps(data, indent=2, default=str).encode()
+
+
+# Processed-data export formats: name -> (file extension, mime type, encoder)
+EXPORT_FORMATS = {
+    'GeoJSONSeq': ('geojsonl', 'application/geo+json-seq', _geojson_seq),
+    'FlatGeobuf': ('fgb', 'application/octet-stream', _flatgeobuf)
+}
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_export(cache_key: tuple, export_format: str,
+                   _load: Callable[[], gpd.GeoDataFrame]) -> bytes:
+    """
+    Encode a processed layer for download once per cache key and format.
+    
+    Args:
+        cache_key: Identity of the layer
+        export_format: Key of EXPORT_FORMATS
+        _load: Returns the GeoDataFrame to export; only called on a cache miss
+        
+    Returns:
+        Encoded file contents
+    """
+    _, _, encode = EXPORT_FORMATS[export_format]
+    return encode(_load())
+
+
+def _parameters_key(bbox: Tuple[float, float, float, float],
+                    years: List[int],
+                    features: List[str]) -> str:
+    """
+    Stable identifier of a set of analysis parameters, used to persist results.
+    
+    Args:
+        bbox: Bounding box as (south, west, north, east)
+        years: Analysis years
+        features: OSM features
+        
+    Returns:
+        SHA-1 hex digest of the parameters
+    """
+    return hashlib.sha1(repr((tuple(bbox), tuple(years), tuple(features))).encode()).hexdigest()
+
+
+def _results_key(results: Dict[str, Any]) -> tuple:
+    """
+    Hashable identity of an analysis run, used to key the dashboard caches.
+    
+    Args:
+        results: Analysis results dictionary
+        
+    Returns:
+        Tuple of (bbox, years, features, analysis date)
+    """
+    metadata = results.get('metadata', {})
+    return (tuple(metadata.get('bbox', ())), tuple(metadata.get('years', ())),
+            tuple(metadata.get('features', ())), metadata.get('analysis_date'))
 
 
 class DashboardApp:
@@ -33,18 +644,33 @@ class DashboardApp:
         Args:
             config_manager: Configuration manager instance
         """
-        self.config = config_manager or ConfigManager()
+        self.config = config_manager or _default_config()
         self.logger = Logger("DashboardApp")
         
-        # Initialize components
-        self.analyzer = UrbanGrowthAnalyzer(self.config)
-        self.map_visualizer = MapVisualizer(self.config)
-        self.chart_generator = ChartGenerator(self.config)
-        
         # Dashboard configuration
         dashboard_config = self.config.get_visualization_config().get('dashboard', {})
         self.title = dashboard_config.get('title', 'Urban Growth Analysis Dashboard')
     
+    @property
+    def analyzer(self) -> 'UrbanGrowthAnalyzer':
+        """Urban growth analyzer (shared across Streamlit reruns)."""
+        return _analyzer(self.config.config_path)
+    
+    @property
+    def map_visualizer(self) -> 'MapVisualizer':
+        """Map visualizer, created on the first map page visit."""
+        return _map_visualizer(self.config.config_path)
+    
+    @property
+    def map_disk_cache(self) -> Optional['diskcache.Cache']:
+        """Persistent rendered map cache, or None when unavailable."""
+        return _map_disk_cache(self.config.config_path)
+    
+    @property
+    def chart_generator(self) -> 'ChartGenerator':
+        """Chart generator, created on the first chart or data page visit."""
+        return _chart_generator(self.config.config_path)
+    
     def run(self):
         """Run the Streamlit dashboard application."""
         st.set_page_config(
@@ -61,17 +687,20 @@ class DashboardApp:
         # Sidebar configuration
         self._setup_sidebar()
         
+        # Move processed data out of memory whenever the user switches pages
+        page = st.session_state.get('page')
+        if page != st.session_state.get('_previous_page'):
+            self._offload_results()
+            st.session_state['_previous_page'] = page
+        
         # Main content based on selected page
-        if st.session_state.get('page') == 'Analysis':
-            self._show_analysis_page()
-        elif st.session_state.get('page') == 'Maps':
-            self._show_maps_page()
-        elif st.session_state.get('page') == 'Charts':
-            self._show_charts_page()
-        elif st.session_state.get('page') == 'Data':
-            self._show_data_page()
-        else:
-            self._show_home_page()
+        pages = {
+            'Analysis': self._show_analysis_page,
+            'Maps': self._show_maps_page,
+            'Charts': self._show_charts_page,
+            'Data': self._show_data_page
+        }
+        pages.get(page, self._show_home_page)()
     
     def _setup_sidebar(self):
         """Setup sidebar with navigation and configuration options."""
@@ -102,7 +731,11 @@ class DashboardApp:
             north = st.number_input("North", value=default_bbox.north, format="%.4f", key="north")
             east = st.number_input("East", value=default_bbox.east, format="%.4f", key="east")
         
-        st.session_state['bbox'] = BoundingBox(south=south, west=west, north=north, east=east)
+        # Only rebuild session values when the inputs change, keeping them stable across reruns
+        bbox_key = (south, west, north, east)
+        if st.session_state.get('_bbox_key') != bbox_key:
+            st.session_state['bbox'] = BoundingBox(south=south, west=west, north=north, east=east)
+            st.session_state['_bbox_key'] = bbox_key
         
         # Years selection
         st.sidebar.markdown("**Analysis Years**")
@@ -115,8 +748,10 @@ class DashboardApp:
         
         # Generate year list
         year_step = st.sidebar.selectbox("Year Step", [1, 2, 5], index=1)
-        years = list(range(min_year, max_year + 1, year_step))
-        st.session_state['years'] = years
+        years_key = (min_year, max_year, year_step)
+        if st.session_state.get('_years_key') != years_key:
+            st.session_state['years'] = list(range(min_year, max_year + 1, year_step))
+            st.session_state['_years_key'] = years_key
         
         # Feature selection
         st.sidebar.markdown("**Features to Analyze**")
@@ -126,7 +761,8 @@ class DashboardApp:
             feature_options, 
             default=['buildings', 'roads']
         )
-        st.session_state['features'] = selected_features
+        if st.session_state.get('features') != selected_features:
+            st.session_state['features'] = selected_features
         
         st.sidebar.markdown("---")
         
@@ -135,10 +771,17 @@ class DashboardApp:
         
         if st.sidebar.button("Clear Cache"):
             deleted_count = self.analyzer.clear_cache()
+            if st.session_state.pop('_results_offloaded', False):
+                # Offloaded results point at the files that were just deleted
+                st.session_state.pop('analysis_results', None)
+            _cached_analysis.clear()
+            _cache_statistics.clear()
+            if self.map_disk_cache is not None:
+                self.map_disk_cache.clear()
             st.sidebar.success(f"Deleted {deleted_count} cache files")
         
         # Cache statistics
-        cache_stats = self.analyzer.get_cache_statistics()
+        cache_stats = _cache_statistics(self.config.config_path)
         if cache_stats.get('cache_enabled', False):
             st.sidebar.markdown("**Cache Statistics**")
             for cache_type, stats in cache_stats.get('cache_types', {}).items():
@@ -232,19 +875,90 @@ class DashboardApp:
                 st.session_state['run_analysis'] = True
         
         with col3:
-            if st.button("💾 Load Previous"):
-                st.info("Feature coming soon!")
+            load_previous = st.button("💾 Load Previous")
         
         # Run analysis if requested
         if st.session_state.get('run_analysis', False):
             self._run_analysis()
             st.session_state['run_analysis'] = False
+        
+        elif load_previous:
+            if self._load_results(force=True):
+                self._display_analysis_summary(st.session_state['analysis_results'])
+            else:
+                st.warning("⚠️ No saved results for the current configuration.")
     
-    def _run_analysis(self):
-        """Execute the urban growth analysis."""
+    def _feature_list(self, features: List[str]) -> List[str]:
+        """
+        Expand dashboard feature types into the OSM features to collect.
+        
+        Args:
+            features: Selected feature types ('buildings', 'roads', 'landuse')
+            
+        Returns:
+            List of OSM feature keys
+        """
+        osm_features = self.config.get_osm_features()
+        feature_list = []
+        
+        for feature_type in features:
+            if feature_type == 'buildings':
+                feature_list.extend(osm_features.get('buildings', ['building']))
+            elif feature_type == 'roads':
+                feature_list.extend(osm_features.get('roads', ['highway']))
+            elif feature_type == 'landuse':
+                feature_list.extend(osm_features.get('landuse', ['landuse']))
+        
+        return feature_list
+    
+    def _load_results(self, force: bool = False) -> bool:
+        """
+        Make analysis results available in the session, loading them from disk if needed.
+        
+        Results are looked up by the current sidebar configuration, so they
+        survive browser reloads and new sessions.
+        
+        Args:
+            force: Reload from disk even if the session already holds results
+            
+        Returns:
+            True if results are available in the session
+        """
+        if 'analysis_results' in st.session_state and not force:
+            return True
+        
         bbox = st.session_state.get('bbox')
         years = st.session_state.get('years')
         features = st.session_state.get('features')
+        if not (bbox and years and features and self.analyzer.cache):
+            return False
+        
+        key = _parameters_key(bbox.to_tuple(), years, self._feature_list(features))
+        results = self.analyzer.cache.get_results_bundle(key, lazy=True)
+        if results is None:
+            return False
+        
+        st.session_state['analysis_results'] = results
+        st.session_state['_results_key'] = key
+        st.session_state['_results_offloaded'] = True
+        return True
+    
+    def _offload_results(self):
+        """Replace in-memory processed data with GeoDataFrames read back from disk on demand."""
+        key = st.session_state.get('_results_key')
+        if 'analysis_results' not in st.session_state or key is None or not self.analyzer.cache:
+            return
+        
+        results = self.analyzer.cache.get_results_bundle(key, lazy=True)
+        if results is not None:
+            st.session_state['analysis_results'] = results
+            st.session_state['_results_offloaded'] = True
+            gc.collect()
+    
+    def _run_analysis(self):
+        """Execute the urban growth analysis."""
+        state = st.session_state
+        bbox, years, features = state.get('bbox'), state.get('years'), state.get('features')
         
         # Progress tracking
         progress_bar = st.progress(0)
@@ -256,30 +970,27 @@ class DashboardApp:
             progress_bar.progress(10)
             
             # Build feature list
-            osm_features = self.config.get_osm_features()
-            feature_list = []
-            
-            for feature_type in features:
-                if feature_type == 'buildings':
-                    feature_list.extend(osm_features.get('buildings', ['building']))
-                elif feature_type == 'roads':
-                    feature_list.extend(osm_features.get('roads', ['highway']))
-                elif feature_type == 'landuse':
-                    feature_list.extend(osm_features.get('landuse', ['landuse']))
+            feature_list = self._feature_list(features)
             
             progress_bar.progress(20)
             status_text.text("📡 Collecting OSM data...")
             
             # Run analysis
             start_time = time.time()
-            results = self.analyzer.analyze_urban_growth(bbox, years, feature_list)
+            results = _cached_analysis(self.config.config_path, bbox.to_tuple(),
+                                       tuple(years), tuple(feature_list))
             analysis_time = time.time() - start_time
             
             progress_bar.progress(100)
             status_text.text(f"✅ Analysis completed in {analysis_time:.1f} seconds")
             
-            # Store results in session state
+            # Store results in session state and on disk, so reloads do not recompute
             st.session_state['analysis_results'] = results
+            key = _parameters_key(bbox.to_tuple(), years, feature_list)
+            st.session_state['_results_key'] = key
+            st.session_state['_results_offloaded'] = False
+            if self.analyzer.cache:
+                self.analyzer.cache.save_results_bundle(results, key)
             
             # Display results summary
             self._display_analysis_summary(results)
@@ -303,8 +1014,8 @@ class DashboardApp:
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Analysis Years", 
-                     f"{min(metadata.get('years', []))}-{max(metadata.get('years', []))}")
+            start_year, end_year = metadata['year_range']
+            st.metric("Analysis Years", f"{start_year}-{end_year}")
         
         with col2:
             st.metric("Processing Time", 
@@ -315,40 +1026,27 @@ class DashboardApp:
             st.metric("Features Analyzed", features_analyzed)
         
         with col4:
-            # Calculate total data points
-            data_summary = results.get('data_summary', {})
-            total_features = sum(
-                year_data.get('total_features', 0) 
-                for year_data in data_summary.get('data_by_year', {}).values()
-            )
-            st.metric("Total Data Points", f"{total_features:,}")
+            st.metric("Total Data Points", f"{metadata.get('total_features', 0):,}")
         
         # Display key findings
         if 'building_metrics' in quant_data:
             building_metrics = quant_data['building_metrics']
             
             if 'years' in building_metrics and building_metrics['years']:
-                years = building_metrics['years']
-                latest_year = max(years)
-                earliest_year = min(years)
-                
-                latest_count = building_metrics.get('building_counts', {}).get(latest_year, 0)
-                earliest_count = building_metrics.get('building_counts', {}).get(earliest_year, 0)
+                summary = _building_summary(_results_key(results), building_metrics)
                 
                 st.markdown("### 🏢 Building Analysis")
                 
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    st.metric(f"Buildings ({latest_year})", f"{latest_count:,}")
+                    st.metric(f"Buildings ({summary['latest_year']})", f"{summary['latest']:,}")
                 
                 with col2:
-                    growth = latest_count - earliest_count
-                    st.metric("Total Growth", f"{growth:+,}")
+                    st.metric("Total Growth", f"{summary['growth']:+,}")
                 
                 with col3:
-                    growth_rate = ((latest_count - earliest_count) / earliest_count * 100) if earliest_count > 0 else 0
-                    st.metric("Growth Rate", f"{growth_rate:+.1f}%")
+                    st.metric("Growth Rate", f"{summary['rate']:+.1f}%")
         
         # Success message with navigation
         st.success("🎉 Analysis completed successfully! Navigate to Maps or Charts to explore the results.")
@@ -358,7 +1056,7 @@ class DashboardApp:
         st.header("Interactive Maps")
         
         # Check if analysis results are available
-        if 'analysis_results' not in st.session_state:
+        if not self._load_results():
             st.warning("⚠️ Please run an analysis first to view maps.")
             if st.button("Go to Analysis"):
                 st.session_state['page'] = 'Analysis'
@@ -379,26 +1077,28 @@ class DashboardApp:
         
         selected_map = st.selectbox("Select Map Type", map_types)
         
+        cache_key = _results_key(results)
+        
         if selected_map == 'Temporal Comparison':
-            self._show_temporal_comparison_map(processed_data, bbox)
+            self._show_temporal_comparison_map(processed_data, bbox, cache_key)
         
         elif selected_map == 'Growth Hotspots':
-            self._show_growth_hotspots_map(results, bbox)
+            self._show_growth_hotspots_map(results, bbox, cache_key)
         
         elif selected_map == 'Density Heatmap':
-            self._show_density_heatmap(processed_data, bbox)
+            self._show_density_heatmap(processed_data, bbox, cache_key)
         
         elif selected_map == 'Before/After Comparison':
-            self._show_before_after_map(processed_data, bbox)
+            self._show_before_after_map(processed_data, bbox, cache_key)
     
+    @_fragment
     def _show_temporal_comparison_map(self, processed_data: Dict[str, Any], 
-                                    bbox: List[float]):
+                                    bbox: List[float], cache_key: tuple):
         """Display temporal comparison map."""
         st.subheader("Temporal Comparison Map")
         
         # Feature type selection
-        available_features = [key for key in processed_data.keys() 
-                            if any(not gdf.empty for gdf in processed_data[key].values())]
+        available_features = _available_data(cache_key, processed_data)['features_any']
         
         if not available_features:
             st.error("No data available for mapping.")
@@ -408,14 +1108,27 @@ class DashboardApp:
         
         # Create map
         with st.spinner("Creating temporal comparison map..."):
-            map_obj = self.map_visualizer.create_temporal_comparison_map(
-                processed_data, tuple(bbox), feature_type
+            feature_data = processed_data[feature_type]
+            years = _non_empty_years(feature_data)
+            content = _content_hash(cache_key + ('temporal', feature_type),
+                                    lambda: [feature_data[year] for year in years])
+            map_html = _cached_map_html(
+                ('temporal', feature_type, tuple(bbox), content),
+                # Empty years keep their slot so colors stay assigned by year
+                lambda: self.map_visualizer.create_temporal_comparison_map(
+                    {feature_type: {year: _simplified(feature_data[year]) if year in years
+                                    else gpd.GeoDataFrame() for year in feature_data}},
+                    tuple(bbox), feature_type
+                ),
+                self.map_disk_cache
             )
         
         # Display map
-        st_folium(map_obj, width=1200, height=600)
+        components.html(map_html, width=1200, height=600)
     
-    def _show_growth_hotspots_map(self, results: Dict[str, Any], bbox: List[float]):
+    @_fragment
+    def _show_growth_hotspots_map(self, results: Dict[str, Any], bbox: List[float],
+                                  cache_key: tuple):
         """Display growth hotspots map."""
         st.subheader("Growth Hotspots Map")
         
@@ -426,57 +1139,69 @@ class DashboardApp:
             st.error("No hotspots data available. This requires building data.")
             return
         
-        # Create map
-        with st.spinner("Creating growth hotspots map..."):
-            map_obj = self.map_visualizer.create_growth_hotspots_map(
-                hotspots_data, tuple(bbox)
-            )
+        # Create map in the background while the statistics are drawn
+        layers = [hotspots_data['grid']] if 'grid' in hotspots_data else []
+        layers.extend(hotspots_data.get('hotspots', {}).values())
+        content = _content_hash(cache_key + ('hotspots',), lambda: layers)
+        map_html = _render_map_async(
+            ('hotspots', tuple(bbox), content),
+            lambda: self.map_visualizer.create_growth_hotspots_map(hotspots_data, tuple(bbox)),
+            self.map_disk_cache
+        )
         
-        # Display map
-        st_folium(map_obj, width=1200, height=600)
+        map_slot = st.empty()
+        map_slot.info("Creating growth hotspots map...")
         
         # Display hotspots statistics
         if 'hotspots' in hotspots_data:
             st.markdown("### Hotspots Statistics")
             
-            for period, hotspot_gdf in hotspots_data['hotspots'].items():
-                if not hotspot_gdf.empty:
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        st.metric(f"Hotspots ({period})", len(hotspot_gdf))
-                    
-                    with col2:
-                        avg_growth = hotspot_gdf['absolute_growth'].mean()
-                        st.metric("Average Growth", f"{avg_growth:.2f}")
-                    
-                    with col3:
-                        max_growth = hotspot_gdf['absolute_growth'].max()
-                        st.metric("Maximum Growth", f"{max_growth:.2f}")
-    
-    def _show_density_heatmap(self, processed_data: Dict[str, Any], bbox: List[float]):
+            stats = _hotspot_statistics(cache_key, hotspots_data['hotspots'])
+            for period, count, avg_growth, max_growth in stats.itertuples():
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.metric(f"Hotspots ({period})", count)
+                
+                with col2:
+                    st.metric("Average Growth", f"{avg_growth:.2f}")
+                
+                with col3:
+                    st.metric("Maximum Growth", f"{max_growth:.2f}")
+        
+        # Display map
+        with map_slot:
+            components.html(map_html.result(), width=1200, height=600)
+    
+    @_fragment
+    def _show_density_heatmap(self, processed_data: Dict[str, Any], bbox: List[float],
+                              cache_key: tuple):
         """Display density heatmap."""
         st.subheader("Density Heatmap")
         
         # Year selection for heatmap
         buildings_data = processed_data.get('buildings', {})
-        available_years = [year for year, gdf in buildings_data.items() if not gdf.empty]
+        available_years = _available_data(cache_key, processed_data)['years_by_feature'].get('buildings', [])
         
         if not available_years:
             st.error("No building data available for heatmap.")
             return
         
-        selected_year = st.selectbox("Select Year", sorted(available_years))
+        selected_year = st.selectbox("Select Year", available_years)
         buildings_gdf = buildings_data[selected_year]
         
-        # Create heatmap
-        with st.spinner("Creating density heatmap..."):
-            map_obj = self.map_visualizer.create_density_heatmap(
-                buildings_gdf, tuple(bbox)
-            )
+        # Create heatmap in the background while the statistics are drawn
+        content = _content_hash(cache_key + ('density', selected_year), lambda: [buildings_gdf])
+        map_html = _render_map_async(
+            ('density', tuple(bbox), content),
+            lambda: self.map_visualizer.create_density_heatmap(
+                buildings_gdf, tuple(bbox), _heat_points(buildings_gdf).tolist()
+            ),
+            self.map_disk_cache
+        )
         
-        # Display map
-        st_folium(map_obj, width=1200, height=600)
+        map_slot = st.empty()
+        map_slot.info("Creating density heatmap...")
         
         # Display statistics
         col1, col2, col3 = st.columns(3)
@@ -486,25 +1211,28 @@ class DashboardApp:
         
         with col2:
             if 'area_m2' in buildings_gdf.columns:
-                total_area = buildings_gdf['area_m2'].sum() / 1_000_000  # Convert to km²
+                total_area = _total_area_km2(cache_key + ('buildings', selected_year),
+                                             buildings_gdf['area_m2'])
                 st.metric("Total Area", f"{total_area:.2f} km²")
         
         with col3:
-            # Calculate approximate area from bbox
-            lat_diff = bbox[2] - bbox[0]  # north - south
-            lon_diff = bbox[3] - bbox[1]  # east - west
-            area_km2 = lat_diff * lon_diff * 111.32 ** 2  # Rough conversion
-            
+            area_km2 = _bbox_area_km2(tuple(bbox))
             density = len(buildings_gdf) / area_km2 if area_km2 > 0 else 0
             st.metric("Density", f"{density:.1f}/km²")
+        
+        # Display map
+        with map_slot:
+            components.html(map_html.result(), width=1200, height=600)
     
-    def _show_before_after_map(self, processed_data: Dict[str, Any], bbox: List[float]):
+    @_fragment
+    def _show_before_after_map(self, processed_data: Dict[str, Any], bbox: List[float],
+                               cache_key: tuple):
         """Display before/after comparison map."""
         st.subheader("Before/After Comparison")
         
         # Feature and year selection
-        available_features = [key for key in processed_data.keys() 
-                            if len([gdf for gdf in processed_data[key].values() if not gdf.empty]) >= 2]
+        available = _available_data(cache_key, processed_data)
+        available_features = available['features_multi']
         
         if not available_features:
             st.error("Need at least 2 time periods with data for before/after comparison.")
@@ -513,7 +1241,7 @@ class DashboardApp:
         feature_type = st.selectbox("Feature Type", available_features)
         feature_data = processed_data[feature_type]
         
-        available_years = sorted([year for year, gdf in feature_data.items() if not gdf.empty])
+        available_years = available['years_by_feature'][feature_type]
         
         if len(available_years) < 2:
             st.error("Need at least 2 years with data for comparison.")
@@ -530,24 +1258,30 @@ class DashboardApp:
         
         # Create comparison map
         with st.spinner("Creating before/after comparison map..."):
-            map_obj = self.map_visualizer.create_before_after_map(
-                feature_data[before_year],
-                feature_data[after_year],
-                before_year,
-                after_year,
-                tuple(bbox),
-                feature_type
+            content = _content_hash(cache_key + ('before_after', feature_type, before_year, after_year),
+                                    lambda: [feature_data[before_year], feature_data[after_year]])
+            map_html = _cached_map_html(
+                ('before_after', feature_type, before_year, after_year, tuple(bbox), content),
+                lambda: self.map_visualizer.create_before_after_map(
+                    _simplified(feature_data[before_year]),
+                    _simplified(feature_data[after_year]),
+                    before_year,
+                    after_year,
+                    tuple(bbox),
+                    feature_type
+                ),
+                self.map_disk_cache
             )
         
         # Display map
-        st_folium(map_obj, width=1200, height=600)
+        components.html(map_html, width=1200, height=600)
     
     def _show_charts_page(self):
         """Display the charts and analytics page."""
         st.header("Charts & Analytics")
         
         # Check if analysis results are available
-        if 'analysis_results' not in st.session_state:
+        if not self._load_results():
             st.warning("⚠️ Please run an analysis first to view charts.")
             if st.button("Go to Analysis"):
                 st.session_state['page'] = 'Analysis'
@@ -568,26 +1302,28 @@ class DashboardApp:
         ]
         
         selected_chart = st.selectbox("Select Chart Type", chart_types)
+        cache_key = _results_key(results)
         
         if selected_chart == 'Growth Timeline':
-            self._show_growth_timeline_chart(quant_data)
+            self._show_growth_timeline_chart(quant_data, cache_key)
         
         elif selected_chart == 'Growth Rates':
-            self._show_growth_rates_chart(quant_data)
+            self._show_growth_rates_chart(quant_data, cache_key)
         
         elif selected_chart == 'Building Types Distribution':
-            self._show_building_types_chart(quant_data)
+            self._show_building_types_chart(quant_data, cache_key)
         
         elif selected_chart == 'Density Metrics':
-            self._show_density_metrics_chart(quant_data)
+            self._show_density_metrics_chart(quant_data, cache_key)
         
         elif selected_chart == 'Urban Sprawl Analysis':
-            self._show_sprawl_analysis_chart(results)
+            self._show_sprawl_analysis_chart(results, cache_key)
         
         elif selected_chart == 'Comparison Dashboard':
-            self._show_comparison_dashboard(results)
+            self._show_comparison_dashboard(results, cache_key)
     
-    def _show_growth_timeline_chart(self, quant_data: Dict[str, Any]):
+    @_fragment
+    def _show_growth_timeline_chart(self, quant_data: Dict[str, Any], cache_key: tuple):
         """Display growth timeline chart."""
         st.subheader("Growth Timeline")
         
@@ -598,13 +1334,15 @@ class DashboardApp:
             st.error("No growth data available.")
             return
         
-        fig = self.chart_generator.create_growth_timeline_chart(
-            building_metrics, road_metrics
+        fig = _cached_chart(
+            ('growth_timeline',) + cache_key,
+            lambda: self.chart_generator.create_growth_timeline_chart(building_metrics, road_metrics)
         )
         
         st.plotly_chart(fig, use_container_width=True)
     
-    def _show_growth_rates_chart(self, quant_data: Dict[str, Any]):
+    @_fragment
+    def _show_growth_rates_chart(self, quant_data: Dict[str, Any], cache_key: tuple):
         """Display growth rates chart."""
         st.subheader("Growth Rates by Period")
         
@@ -614,10 +1352,12 @@ class DashboardApp:
             st.error("No growth rate data available.")
             return
         
-        fig = self.chart_generator.create_growth_rate_chart(building_metrics)
+        fig = _cached_chart(('growth_rates',) + cache_key,
+                            lambda: self.chart_generator.create_growth_rate_chart(building_metrics))
         st.plotly_chart(fig, use_container_width=True)
     
-    def _show_building_types_chart(self, quant_data: Dict[str, Any]):
+    @_fragment
+    def _show_building_types_chart(self, quant_data: Dict[str, Any], cache_key: tuple):
         """Display building types distribution chart."""
         st.subheader("Building Types Distribution")
         
@@ -627,10 +1367,14 @@ class DashboardApp:
             st.error("No building type data available.")
             return
         
-        fig = self.chart_generator.create_building_type_distribution_chart(building_metrics)
+        fig = _cached_chart(
+            ('building_types',) + cache_key,
+            lambda: self.chart_generator.create_building_type_distribution_chart(building_metrics)
+        )
         st.plotly_chart(fig, use_container_width=True)
     
-    def _show_density_metrics_chart(self, quant_data: Dict[str, Any]):
+    @_fragment
+    def _show_density_metrics_chart(self, quant_data: Dict[str, Any], cache_key: tuple):
         """Display density metrics chart."""
         st.subheader("Urban Density Metrics")
         
@@ -640,10 +1384,12 @@ class DashboardApp:
             st.error("No density data available.")
             return
         
-        fig = self.chart_generator.create_density_metrics_chart(density_by_year)
+        fig = _cached_chart(('density_metrics',) + cache_key,
+                            lambda: self.chart_generator.create_density_metrics_chart(density_by_year))
         st.plotly_chart(fig, use_container_width=True)
     
-    def _show_sprawl_analysis_chart(self, results: Dict[str, Any]):
+    @_fragment
+    def _show_sprawl_analysis_chart(self, results: Dict[str, Any], cache_key: tuple):
         """Display urban sprawl analysis chart."""
         st.subheader("Urban Sprawl Analysis")
         
@@ -654,14 +1400,29 @@ class DashboardApp:
             st.error("No sprawl analysis data available.")
             return
         
-        fig = self.chart_generator.create_sprawl_analysis_chart(sprawl_data)
+        fig = _cached_chart(('sprawl_analysis',) + cache_key,
+                            lambda: self.chart_generator.create_sprawl_analysis_chart(sprawl_data))
         st.plotly_chart(fig, use_container_width=True)
     
-    def _show_comparison_dashboard(self, results: Dict[str, Any]):
+    @_fragment
+    def _show_comparison_dashboard(self, results: Dict[str, Any], cache_key: tuple):
         """Display comprehensive comparison dashboard."""
         st.subheader("Comparison Dashboard")
         
-        fig = self.chart_generator.create_comparison_dashboard(results)
+        def build():
+            # KPIs and the figure are independent, so they are built side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                kpis = executor.submit(self.chart_generator.create_comparison_kpis, results)
+                fig = executor.submit(self.chart_generator.create_comparison_dashboard, results)
+                return kpis.result(), fig.result()
+        
+        kpis, fig = _cached_comparison(('comparison',) + cache_key, build)
+        
+        # Key performance indicators
+        if kpis:
+            for column, (label, value) in zip(st.columns(len(kpis)), kpis.items()):
+                column.metric(label, value)
+        
         st.plotly_chart(fig, use_container_width=True)
     
     def _show_data_page(self):
@@ -669,7 +1430,7 @@ class DashboardApp:
         st.header("Data Exploration & Export")
         
         # Check if analysis results are available
-        if 'analysis_results' not in st.session_state:
+        if not self._load_results():
             st.warning("⚠️ Please run an analysis first to explore data.")
             if st.button("Go to Analysis"):
                 st.session_state['page'] = 'Analysis'
@@ -695,18 +1456,35 @@ class DashboardApp:
         st.subheader("Summary Statistics")
         
         # Create summary table
-        summary_df = self.chart_generator.create_summary_statistics_table(results)
+        summary_df = self._summary_table(results)
         
         if not summary_df.empty:
-            st.dataframe(summary_df, use_container_width=True)
+            st.dataframe(_to_arrow(('summary',) + _results_key(results), summary_df),
+                         use_container_width=True)
         else:
             st.info("No summary statistics available.")
     
+    def _summary_table(self, results: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Summary statistics table for the results, cached per analysis run.
+        
+        Args:
+            results: Analysis results dictionary
+            
+        Returns:
+            Summary statistics DataFrame
+        """
+        return _cached_table(
+            ('summary',) + _results_key(results),
+            lambda: self.chart_generator.create_summary_statistics_table(results)
+        )
+    
     def _show_raw_data_exploration(self, results: Dict[str, Any]):
         """Display raw data exploration interface."""
         st.subheader("Raw Data Exploration")
         
         processed_data = results.get('processed_data', {})
+        available = _available_data(_results_key(results), processed_data)
         
         # Feature type selection
         available_features = list(processed_data.keys())
@@ -719,7 +1497,7 @@ class DashboardApp:
         feature_data = processed_data[feature_type]
         
         # Year selection
-        available_years = sorted([year for year, gdf in feature_data.items() if not gdf.empty])
+        available_years = available['years_by_feature'][feature_type]
         
         if not available_years:
             st.error(f"No data available for {feature_type}.")
@@ -734,16 +1512,23 @@ class DashboardApp:
         
         # Show sample of data
         if not gdf.empty:
-            # Convert to regular DataFrame for display (drop geometry for readability)
-            display_df = gdf.drop('geometry', axis=1) if 'geometry' in gdf.columns else gdf
-            
-            # Show first few rows
-            st.dataframe(display_df.head(100), use_container_width=True)
+            # Show first few rows as a regular DataFrame (geometry left out for readability);
+            # slicing before selecting avoids copying the whole frame
+            columns = [column for column in gdf.columns if column != 'geometry']
+            sample_key = _results_key(results) + (feature_type, selected_year)
+            st.dataframe(_to_arrow(sample_key, pd.DataFrame(gdf.head(100)[columns])),
+                         use_container_width=True)
             
-            # Basic statistics
-            if len(display_df.select_dtypes(include=[np.number]).columns) > 0:
-                st.markdown("**Numeric Column Statistics**")
-                st.dataframe(display_df.describe(), use_container_width=True)
+            # Basic statistics (select_dtypes already skips the geometry column)
+            numeric_df = gdf.select_dtypes(include=[np.number])
+            if len(numeric_df.columns) > 0:
+                if len(numeric_df) > DESCRIBE_SAMPLE_ROWS:
+                    st.markdown(f"**Numeric Column Statistics** (approximate, "
+                                f"{DESCRIBE_SAMPLE_ROWS:,}-row sample)")
+                else:
+                    st.markdown("**Numeric Column Statistics**")
+                stats = _describe(sample_key, numeric_df)
+                st.dataframe(stats, use_container_width=True)
     
     def _show_export_options(self, results: Dict[str, Any]):
         """Display data export options."""
@@ -770,9 +1555,9 @@ class DashboardApp:
         with col2:
             st.markdown("**Processed Data:**")
             
-            # Processed data (GeoJSON)
-            if st.button("🗺️ Export Processed Data (GeoJSON)"):
-                self._export_processed_data(results)
+            # Processed data (GeoJSONSeq / FlatGeobuf); its selectboxes rerun the
+            # script, so it is always rendered rather than behind a button
+            self._export_processed_data(results)
             
             # Maps (HTML)
             if st.button("🌍 Export Interactive Maps (HTML)"):
@@ -780,25 +1565,27 @@ class DashboardApp:
     
     def _export_analysis_results(self, results: Dict[str, Any]):
         """Export analysis results as JSON."""
-        # Remove processed_data from export (too large)
-        export_data = {k: v for k, v in results.items() if k != 'processed_data'}
+        def build() -> bytes:
+            # Remove processed_data from export (too large)
+            export_data = {k: v for k, v in results.items() if k != 'processed_data'}
+            return _json_bytes(export_data)
         
-        import json
-        json_str = json.dumps(export_data, indent=2, default=str)
+        json_bytes = _cached_text(('results_json',) + _results_key(results), build)
         
         st.download_button(
             label="Download Analysis Results",
-            data=json_str,
+            data=json_bytes,
             file_name="urban_growth_analysis_results.json",
             mime="application/json"
         )
     
     def _export_summary_statistics(self, results: Dict[str, Any]):
         """Export summary statistics as CSV."""
-        summary_df = self.chart_generator.create_summary_statistics_table(results)
+        summary_df = self._summary_table(results)
         
         if not summary_df.empty:
-            csv = summary_df.to_csv(index=False)
+            csv = _cached_text(('summary_csv',) + _results_key(results),
+                               lambda: summary_df.to_csv(index=False))
             st.download_button(
                 label="Download Summary Statistics",
                 data=csv,
@@ -809,24 +1596,36 @@ class DashboardApp:
             st.error("No summary statistics to export.")
     
     def _export_processed_data(self, results: Dict[str, Any]):
-        """Export processed data as GeoJSON."""
-        st.info("Select specific dataset to export:")
-        
+        """Export processed data as GeoJSONSeq or FlatGeobuf."""
         processed_data = results.get('processed_data', {})
         
-        for feature_type, feature_data in processed_data.items():
-            for year, gdf in feature_data.items():
-                if not gdf.empty:
-                    if st.button(f"Export {feature_type.title()} {year}"):
-                        geojson_str = gdf.to_json()
-                        
-                        st.download_button(
-                            label=f"Download {feature_type.title()} {year}",
-                            data=geojson_str,
-                            file_name=f"{feature_type}_{year}.geojson",
-                            mime="application/json",
-                            key=f"export_{feature_type}_{year}"
-                        )
+        # Only offer layers that have features to export
+        exportable = {
+            feature_type: _non_empty_years(feature_data)
+            for feature_type, feature_data in processed_data.items()
+        }
+        exportable = {feature_type: years for feature_type, years in exportable.items() if years}
+        
+        if not exportable:
+            st.error("No processed data to export.")
+            return
+        
+        feature_type = st.selectbox("Feature Type", list(exportable), key="export_feature_type",
+                                    format_func=str.title)
+        year = st.selectbox("Year", sorted(exportable[feature_type]), key="export_year")
+        export_format = st.selectbox("Export Format", list(EXPORT_FORMATS), key="export_format",
+                                     help="FlatGeobuf is a compact binary format that GIS tools "
+                                          "can read partially; GeoJSONSeq is plain text.")
+        
+        extension, mime, _ = EXPORT_FORMATS[export_format]
+        st.download_button(
+            label=f"Download {feature_type.title()} {year}",
+            data=_cached_export(_results_key(results) + (feature_type, year), export_format,
+                                lambda: processed_data[feature_type][year]),
+            file_name=f"{feature_type}_{year}.{extension}",
+            mime=mime,
+            key="export_processed_data"
+        )
 
 
 def run_dashboard():
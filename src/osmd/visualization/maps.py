@@ -1,15 +1,144 @@
 """Interactive map visualization module for urban growth analysis."""
 
+import functools
 import folium
 from folium import plugins
 import geopandas as gpd
 import pandas as pd
-from typing import Dict, List, Tuple, Any, Optional
+import shapely
+from typing import Dict, List, Tuple, Any, Optional, Union, Callable
 import numpy as np
 from branca.colormap import LinearColormap
+from branca.element import MacroElement
+from jinja2 import Template
 import json
 
-from ..utils import ConfigManager, Logger, format_large_number
+from ..utils import ConfigManager, Logger, format_large_number_vec
+
+
+# Line weight by OSM highway type
+ROAD_WEIGHTS = {
+    'motorway': 6,
+    'trunk': 5,
+    'primary': 4,
+    'secondary': 3,
+    'tertiary': 2,
+    'residential': 2,
+    'service': 1,
+    'track': 1
+}
+DEFAULT_ROAD_WEIGHT = 2
+
+# Building layers larger than this are drawn as clustered centroid markers
+DEFAULT_MAX_FEATURES_PER_LAYER = 5000
+
+# Popup columns shown as abbreviated numbers (e.g. 1.2K)
+FORMATTED_POPUP_COLUMNS = ('area_m2', 'length_m')
+
+
+# Colormaps kept per MapVisualizer before the colormap cache is reset
+COLORMAP_CACHE_SIZE = 16
+
+
+@functools.lru_cache(maxsize=64)
+def _center(bbox: Tuple[float, float, float, float]) -> Tuple[float, float]:
+    """Center (lat, lon) of a (south, west, north, east) bounding box."""
+    return (bbox[0] + bbox[2]) / 2, (bbox[1] + bbox[3]) / 2
+
+
+# Two-digit hex strings for 0-255, used to format colors without a per-value loop
+_HEX_BYTES = np.array([f'{i:02x}' for i in range(256)])
+
+
+def _colormap_hex(colormap: LinearColormap, values: np.ndarray) -> np.ndarray:
+    """
+    Vectorized equivalent of calling a LinearColormap on each value.
+    
+    Interpolates each RGB channel between the colormap's stops with np.interp.
+    
+    Args:
+        colormap: Branca linear colormap
+        values: Values to color
+        
+    Returns:
+        Array of '#rrggbb' strings
+    """
+    stops = np.asarray(colormap.index, dtype=float)
+    rgb = np.asarray(colormap.colors, dtype=float)[:, :3]
+    
+    channels = [
+        (np.interp(values, stops, rgb[:, i]) * 255.9999).astype(np.intp)
+        for i in range(3)
+    ]
+    hex_channels = [_HEX_BYTES[channel] for channel in channels]
+    return np.char.add(np.char.add(np.char.add('#', hex_channels[0]), hex_channels[1]), hex_channels[2])
+
+
+class _StaticStyleGeoJson(MacroElement):
+    """
+    GeoJSON layer with one style for all features, styled by Leaflet in the browser.
+    
+    folium.GeoJson calls its style function once per feature while rendering;
+    here the style is serialized once. Features' '_popup' property is bound as
+    their popup.
+    """
+    
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        var {{ this.get_name() }} = L.geoJson({{ this.data }}, {
+            style: {{ this.style|tojson }},
+            onEachFeature: function(feature, layer) {
+                if (feature.properties._popup) {
+                    layer.bindPopup(feature.properties._popup);
+                }
+            }
+        }).addTo({{ this._parent.get_name() }});
+        {% endmacro %}
+    """)
+    
+    def __init__(self, data: str, style: Dict[str, Any]):
+        """
+        Initialize the layer.
+        
+        Args:
+            data: GeoJSON FeatureCollection text
+            style: Leaflet path options
+        """
+        super().__init__()
+        self._name = 'StaticStyleGeoJson'
+        self.data = data
+        self.style = style
+
+
+class _TemporalLegend(MacroElement):
+    """Fixed-position legend of colored markers, one per year."""
+    
+    _template = Template("""
+        {% macro html(this, kwargs) %}
+        <div style="position: fixed; 
+                    bottom: 50px; left: 50px; width: 150px; height: auto; 
+                    background-color: white; border: 2px solid grey; z-index: 9999; 
+                    font-size: 14px; padding: 10px">
+        <h4>{{ this.title }}</h4>
+        {%- for color, year in this.entries %}
+        <p><span style="color: {{ color }}; font-size: 20px;">●</span> {{ year }}</p>
+        {%- endfor %}
+        </div>
+        {% endmacro %}
+    """)
+    
+    def __init__(self, title: str, entries: List[Tuple[str, Any]]):
+        """
+        Initialize the legend.
+        
+        Args:
+            title: Legend heading
+            entries: (color, year) pairs
+        """
+        super().__init__()
+        self._name = 'TemporalLegend'
+        self.title = title
+        self.entries = entries
 
 
 class MapVisualizer:
@@ -29,6 +158,11 @@ class MapVisualizer:
         viz_config = self.config.get_visualization_config()
         self.map_style = viz_config.get('map_style', 'OpenStreetMap')
         self.color_schemes = viz_config.get('color_schemes', {})
+        self.max_features_per_layer = viz_config.get('max_features_per_layer',
+                                                     DEFAULT_MAX_FEATURES_PER_LAYER)
+        
+        # Colormaps by (vmin, vmax, palette), reused across maps for coloring features
+        self._colormap_cache: Dict[tuple, LinearColormap] = {}
     
     def create_temporal_comparison_map(self, 
                                      processed_data: Dict[str, Dict[int, gpd.GeoDataFrame]],
@@ -46,14 +180,14 @@ class MapVisualizer:
             Folium map with temporal layers
         """
         # Calculate map center
-        center_lat = (bbox[0] + bbox[2]) / 2
-        center_lon = (bbox[1] + bbox[3]) / 2
+        center_lat, center_lon = _center(tuple(bbox))
         
         # Create base map
         m = folium.Map(
             location=[center_lat, center_lon],
             zoom_start=12,
-            tiles=self.map_style
+            tiles=self.map_style,
+            prefer_canvas=True
         )
         
         # Add bounding box rectangle
@@ -124,14 +258,14 @@ class MapVisualizer:
             Folium map with growth hotspots
         """
         # Calculate map center
-        center_lat = (bbox[0] + bbox[2]) / 2
-        center_lon = (bbox[1] + bbox[3]) / 2
+        center_lat, center_lon = _center(tuple(bbox))
         
         # Create base map
         m = folium.Map(
             location=[center_lat, center_lon],
             zoom_start=12,
-            tiles=self.map_style
+            tiles=self.map_style,
+            prefer_canvas=True
         )
         
         # Add analysis grid
@@ -164,38 +298,39 @@ class MapVisualizer:
                 # Create colormap based on growth values
                 growth_values = hotspot_gdf['absolute_growth'].values
                 if len(growth_values) > 0:
-                    colormap = LinearColormap(
-                        colors=['yellow', 'orange', 'red'],
-                        vmin=growth_values.min(),
-                        vmax=growth_values.max()
-                    )
+                    colormap = self._colormap(growth_values.min(), growth_values.max(),
+                                              ('yellow', 'orange', 'red'))
+                    
+                    # Add hotspots to map as one layer, colored per feature
+                    layer = gpd.GeoDataFrame({
+                        'period': period,
+                        'absolute_growth': hotspot_gdf['absolute_growth'].round(2),
+                        'relative_growth': hotspot_gdf['relative_growth'].round(1),
+                        '_color': _colormap_hex(colormap, growth_values)
+                    }, geometry=hotspot_gdf.geometry, crs=hotspot_gdf.crs)
                     
-                    # Add hotspots to map
-                    for idx, row in hotspot_gdf.iterrows():
-                        color = colormap(row['absolute_growth'])
-                        
-                        folium.GeoJson(
-                            row['geometry'].__geo_interface__,
-                            style_function=lambda x, color=color: {
-                                'fillColor': color,
-                                'color': 'black',
-                                'weight': 1,
-                                'fillOpacity': 0.7
-                            },
-                            popup=folium.Popup(
-                                f"""
-                                <b>Growth Hotspot</b><br>
-                                Period: {period}<br>
-                                Absolute Growth: {row['absolute_growth']:.2f}<br>
-                                Relative Growth: {row['relative_growth']:.1f}%
-                                """,
-                                max_width=200
-                            )
-                        ).add_to(fg)
+                    folium.GeoJson(
+                        layer.to_json(),
+                        style_function=lambda x: {
+                            'fillColor': x['properties']['_color'],
+                            'color': 'black',
+                            'weight': 1,
+                            'fillOpacity': 0.7
+                        },
+                        popup=folium.GeoJsonPopup(
+                            fields=['period', 'absolute_growth', 'relative_growth'],
+                            aliases=['Growth Hotspot', 'Absolute Growth', 'Relative Growth (%)']
+                        )
+                    ).add_to(fg)
                     
-                    # Add colormap to map
-                    colormap.caption = f'Growth Intensity ({period})'
-                    colormap.add_to(m)
+                    # Add colormap legend to map
+                    LinearColormap(
+                        colors=colormap.colors,
+                        index=colormap.index,
+                        vmin=colormap.vmin,
+                        vmax=colormap.vmax,
+                        caption=f'Growth Intensity ({period})'
+                    ).add_to(m)
                 
                 fg.add_to(m)
         
@@ -206,34 +341,37 @@ class MapVisualizer:
     
     def create_density_heatmap(self, 
                              buildings_gdf: gpd.GeoDataFrame,
-                             bbox: Tuple[float, float, float, float]) -> folium.Map:
+                             bbox: Tuple[float, float, float, float],
+                             heat_data: Optional[List[List[float]]] = None) -> folium.Map:
         """
         Create a density heatmap of urban features.
         
         Args:
             buildings_gdf: GeoDataFrame with building data
             bbox: Bounding box (south, west, north, east)
+            heat_data: Precomputed [lat, lon] heatmap points (building centroids if None)
             
         Returns:
             Folium map with density heatmap
         """
         # Calculate map center
-        center_lat = (bbox[0] + bbox[2]) / 2
-        center_lon = (bbox[1] + bbox[3]) / 2
+        center_lat, center_lon = _center(tuple(bbox))
         
         # Create base map
         m = folium.Map(
             location=[center_lat, center_lon],
             zoom_start=12,
-            tiles=self.map_style
+            tiles=self.map_style,
+            prefer_canvas=True
         )
         
         if buildings_gdf.empty:
             return m
         
         # Get building centroids for heatmap
-        centroids = buildings_gdf.geometry.centroid
-        heat_data = [[point.y, point.x] for point in centroids]
+        if heat_data is None:
+            centroids = shapely.centroid(buildings_gdf.geometry.values)
+            heat_data = shapely.get_coordinates(centroids)[:, ::-1].tolist()
         
         # Add heatmap
         plugins.HeatMap(
@@ -282,14 +420,14 @@ class MapVisualizer:
             Folium map with before/after comparison
         """
         # Calculate map center
-        center_lat = (bbox[0] + bbox[2]) / 2
-        center_lon = (bbox[1] + bbox[3]) / 2
+        center_lat, center_lon = _center(tuple(bbox))
         
         # Create base map
         m = folium.Map(
             location=[center_lat, center_lon],
             zoom_start=12,
-            tiles=self.map_style
+            tiles=self.map_style,
+            prefer_canvas=True
         )
         
         # Create feature groups
@@ -315,7 +453,7 @@ class MapVisualizer:
         if not before_data.empty and not after_data.empty:
             # This is a simplified approach - in practice, you'd want more sophisticated
             # spatial matching to identify truly new vs. modified features
-            new_features = after_data[~after_data.index.isin(before_data.index)]
+            new_features = after_data.loc[after_data.index.difference(before_data.index, sort=False)]
             
             if not new_features.empty:
                 if feature_type == 'buildings':
@@ -347,124 +485,154 @@ class MapVisualizer:
         
         return m
     
+    def _colormap(self, vmin: float, vmax: float, palette: Tuple[str, ...]) -> LinearColormap:
+        """
+        Get a linear colormap over a value range, reusing one built before.
+        
+        Cached colormaps are only used to compute colors. A branca element
+        belongs to the map it was last added to, so legends are added as
+        fresh copies.
+        
+        Args:
+            vmin: Lowest value of the range
+            vmax: Highest value of the range
+            palette: Color names or hex codes from vmin to vmax
+            
+        Returns:
+            Colormap over the range
+        """
+        key = (float(vmin), float(vmax), palette)
+        colormap = self._colormap_cache.get(key)
+        if colormap is None:
+            if len(self._colormap_cache) >= COLORMAP_CACHE_SIZE:
+                self._colormap_cache.clear()
+            colormap = LinearColormap(colors=list(palette), vmin=vmin, vmax=vmax)
+            self._colormap_cache[key] = colormap
+        return colormap
+    
     def _add_buildings_to_map(self, buildings_gdf: gpd.GeoDataFrame, 
                             feature_group: folium.FeatureGroup,
                             color: str, year: int) -> None:
-        """Add building polygons to a feature group."""
-        for idx, building in buildings_gdf.iterrows():
-            # Create popup with building information
-            popup_text = f"""
-            <b>Building ({year})</b><br>
-            Type: {building.get('building_type', 'Unknown')}<br>
-            """
-            
-            if 'area_m2' in building:
-                popup_text += f"Area: {format_large_number(building['area_m2'])} m²<br>"
-            
-            if 'levels' in building:
-                popup_text += f"Levels: {building['levels']}<br>"
-            
-            folium.GeoJson(
-                building['geometry'].__geo_interface__,
-                style_function=lambda x, color=color: {
-                    'fillColor': color,
-                    'color': 'black',
-                    'weight': 1,
-                    'fillOpacity': 0.6
-                },
-                popup=folium.Popup(popup_text, max_width=200)
+        """
+        Add building polygons to a feature group.
+        
+        Layers above max_features_per_layer are drawn as a FastMarkerCluster of
+        building centroids instead, since browsers struggle to paint tens of
+        thousands of polygons.
+        """
+        if len(buildings_gdf) > self.max_features_per_layer:
+            centroids = shapely.centroid(buildings_gdf.geometry.values)
+            plugins.FastMarkerCluster(
+                shapely.get_coordinates(centroids)[:, ::-1].tolist()
             ).add_to(feature_group)
+            self.logger.info(f"Clustered {len(buildings_gdf)} buildings ({year}) into centroid markers")
+            return
+        
+        self._add_geojson_layer(
+            buildings_gdf, feature_group,
+            {
+                'fillColor': color,
+                'color': 'black',
+                'weight': 1,
+                'fillOpacity': 0.6
+            },
+            f'Building ({year})',
+            {'building_type': 'Type', 'area_m2': 'Area (m²)', 'levels': 'Levels'}
+        )
     
     def _add_roads_to_map(self, roads_gdf: gpd.GeoDataFrame,
                         feature_group: folium.FeatureGroup,
                         color: str, year: int) -> None:
         """Add road linestrings to a feature group."""
-        for idx, road in roads_gdf.iterrows():
-            # Determine line weight based on road type
-            highway_type = road.get('highway', 'unknown')
-            weight = self._get_road_weight(highway_type)
-            
-            # Create popup with road information
-            popup_text = f"""
-            <b>Road ({year})</b><br>
-            Type: {highway_type}<br>
-            """
-            
-            if 'length_m' in road:
-                popup_text += f"Length: {format_large_number(road['length_m'])} m<br>"
-            
-            folium.GeoJson(
-                road['geometry'].__geo_interface__,
-                style_function=lambda x, color=color, weight=weight: {
-                    'color': color,
-                    'weight': weight,
-                    'opacity': 0.8
-                },
-                popup=folium.Popup(popup_text, max_width=200)
-            ).add_to(feature_group)
+        # Line weight based on road type
+        if 'highway' in roads_gdf.columns:
+            # highway is categorical after processing; map plain values so the
+            # default weight need not be one of the categories
+            weights = roads_gdf['highway'].astype(object).map(ROAD_WEIGHTS).fillna(DEFAULT_ROAD_WEIGHT)
+        else:
+            weights = DEFAULT_ROAD_WEIGHT
+        
+        self._add_geojson_layer(
+            roads_gdf, feature_group,
+            lambda x, color=color: {
+                'color': color,
+                'weight': x['properties']['_weight'],
+                'opacity': 0.8
+            },
+            f'Road ({year})',
+            {'highway': 'Type', 'length_m': 'Length (m)'},
+            _weight=weights
+        )
     
     def _add_landuse_to_map(self, landuse_gdf: gpd.GeoDataFrame,
                           feature_group: folium.FeatureGroup,
                           color: str, year: int) -> None:
         """Add landuse polygons to a feature group."""
-        for idx, landuse in landuse_gdf.iterrows():
-            # Get landuse type for coloring
-            landuse_type = landuse.get('landuse_category', landuse.get('landuse', 'unknown'))
-            
-            # Create popup with landuse information
-            popup_text = f"""
-            <b>Landuse ({year})</b><br>
-            Type: {landuse_type}<br>
-            """
-            
-            if 'area_m2' in landuse:
-                popup_text += f"Area: {format_large_number(landuse['area_m2'])} m²<br>"
+        type_column = 'landuse_category' if 'landuse_category' in landuse_gdf.columns else 'landuse'
+        
+        self._add_geojson_layer(
+            landuse_gdf, feature_group,
+            {
+                'fillColor': color,
+                'color': 'black',
+                'weight': 1,
+                'fillOpacity': 0.4
+            },
+            f'Landuse ({year})',
+            {type_column: 'Type', 'area_m2': 'Area (m²)'}
+        )
+    
+    def _add_geojson_layer(self, gdf: gpd.GeoDataFrame,
+                           feature_group: folium.FeatureGroup,
+                           style: Union[Dict[str, Any], Callable[[dict], Dict[str, Any]]],
+                           title: str,
+                           popup_fields: Dict[str, str],
+                           **properties) -> None:
+        """
+        Add a layer as a single GeoJson element instead of one element per feature.
+        
+        The popup HTML is built for all features at once with pandas string
+        concatenation and shipped as one '_popup' property.
+        
+        Args:
+            gdf: GeoDataFrame with the features
+            feature_group: Feature group to add the layer to
+            style: Leaflet path options shared by all features, or a folium
+                style function for styles that vary per feature
+            title: Popup heading
+            popup_fields: Popup label by attribute column (missing columns are skipped)
+            **properties: Extra per-feature properties, e.g. precomputed style values
+        """
+        popup = pd.Series(f'<b>{title}</b>', index=gdf.index)
+        
+        for column, label in popup_fields.items():
+            if column not in gdf.columns:
+                continue
             
+            values = gdf[column]
+            if column in FORMATTED_POPUP_COLUMNS:
+                numbers = pd.to_numeric(values, errors='coerce')
+                text = pd.Series(format_large_number_vec(numbers), index=values.index).where(numbers.notna())
+            else:
+                text = values.astype(str).where(values.notna())
+            popup = popup + f'<br>{label}: ' + text.fillna('Unknown')
+        
+        layer = gdf[[gdf.geometry.name]].assign(_popup=popup, **properties)
+        
+        if isinstance(style, dict):
+            _StaticStyleGeoJson(layer.to_json(), style).add_to(feature_group)
+        else:
             folium.GeoJson(
-                landuse['geometry'].__geo_interface__,
-                style_function=lambda x, color=color: {
-                    'fillColor': color,
-                    'color': 'black',
-                    'weight': 1,
-                    'fillOpacity': 0.4
-                },
-                popup=folium.Popup(popup_text, max_width=200)
+                layer.to_json(),
+                style_function=style,
+                popup=folium.GeoJsonPopup(fields=['_popup'], labels=False)
             ).add_to(feature_group)
     
-    def _get_road_weight(self, highway_type: str) -> int:
-        """Get line weight based on highway type."""
-        weight_map = {
-            'motorway': 6,
-            'trunk': 5,
-            'primary': 4,
-            'secondary': 3,
-            'tertiary': 2,
-            'residential': 2,
-            'service': 1,
-            'track': 1
-        }
-        return weight_map.get(highway_type, 2)
-    
     def _add_temporal_legend(self, m: folium.Map, years: List[int], 
                            colors: List[str], feature_type: str) -> None:
         """Add a legend for temporal comparison."""
-        legend_html = f"""
-        <div style="position: fixed; 
-                    bottom: 50px; left: 50px; width: 150px; height: auto; 
-                    background-color: white; border: 2px solid grey; z-index: 9999; 
-                    font-size: 14px; padding: 10px">
-        <h4>{feature_type.title()} by Year</h4>
-        """
-        
-        for i, year in enumerate(years):
-            color = colors[i % len(colors)]
-            legend_html += f"""
-            <p><span style="color: {color}; font-size: 20px;">●</span> {year}</p>
-            """
-        
-        legend_html += "</div>"
-        
-        m.get_root().html.add_child(folium.Element(legend_html))
+        entries = [(colors[i % len(colors)], year) for i, year in enumerate(years)]
+        _TemporalLegend(f'{feature_type.title()} by Year', entries).add_to(m)
     
     def create_analysis_summary_map(self, 
                                   analysis_results: Dict[str, Any]) -> folium.Map:
@@ -481,14 +649,14 @@ class MapVisualizer:
         bbox = analysis_results['metadata']['bbox']
         
         # Calculate map center
-        center_lat = (bbox[0] + bbox[2]) / 2
-        center_lon = (bbox[1] + bbox[3]) / 2
+        center_lat, center_lon = _center(tuple(bbox))
         
         # Create base map
         m = folium.Map(
             location=[center_lat, center_lon],
             zoom_start=11,
-            tiles=self.map_style
+            tiles=self.map_style,
+            prefer_canvas=True
         )
         
         # Add analysis area boundary
@@ -532,12 +700,14 @@ class MapVisualizer:
                 if growth_rates:
                     latest_period = list(growth_rates.keys())[-1]
                     latest_growth = growth_rates[latest_period]
-                    summary_html += f"""
+                    growth_html = f"""
                     <p><b>Recent Growth ({latest_period}):</b></p>
                     <p>Buildings: {latest_growth.get('count_growth_percent', 0):+.1f}%</p>
                     """
+                else:
+                    growth_html = ""
                 
-                summary_html += "</div>"
+                summary_html = "".join([summary_html, growth_html, "</div>"])
                 
                 folium.Marker(
                     [center_lat, center_lon],
@@ -0,0 +1,60 @@
+"""Tests for the chart generator's figure cache."""
+
+import pytest
+
+pytest.importorskip('plotly')
+
+from osmd.visualization import charts
+from osmd.visualization.charts import ChartGenerator
+
+
+GROWTH_METRICS = {
+    'growth_rates': {
+        '2018-2020': {'count_growth_percent': 12.5, 'area_growth_percent': 8.0},
+        '2020-2022': {'count_growth_percent': 4.0, 'area_growth_percent': 6.5},
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_figure_cache():
+    """Start every test from an empty process-global figure cache."""
+    charts._figure_cache.clear()
+    yield
+    charts._figure_cache.clear()
+
+
+@pytest.fixture
+def generator() -> ChartGenerator:
+    return ChartGenerator()
+
+
+def test_keyword_and_positional_calls_share_an_entry(generator):
+    positional = generator.create_growth_rate_chart(GROWTH_METRICS)
+    keyword = generator.create_growth_rate_chart(growth_metrics=GROWTH_METRICS)
+    
+    assert len(charts._figure_cache) == 1
+    assert keyword.to_dict() == positional.to_dict()
+
+
+def test_changed_metrics_miss_the_cache(generator):
+    generator.create_growth_rate_chart(GROWTH_METRICS)
+    
+    changed = {'growth_rates': dict(GROWTH_METRICS['growth_rates'])}
+    changed['growth_rates']['2020-2022'] = {'count_growth_percent': 9.0, 'area_growth_percent': 6.5}
+    figure = generator.create_growth_rate_chart(changed)
+    
+    assert len(charts._figure_cache) == 2
+    assert list(figure.data[0].y) == [12.5, 9.0]
+
+
+def test_cached_figure_is_not_shared_between_callers(generator):
+    first = generator.create_growth_rate_chart(GROWTH_METRICS)
+    first.update_layout(title='Changed by the first caller')
+    first.data[0].name = 'Changed trace'
+    
+    second = generator.create_growth_rate_chart(GROWTH_METRICS)
+    
+    assert second is not first
+    assert second.layout.title.text == 'Growth Rates by Period'
+    assert second.data[0].name == 'Count Growth (%)'
@@ -0,0 +1,46 @@
+"""Round-trip tests for the dashboard's processed-data exports."""
+
+import json
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import Point
+
+pytest.importorskip('pyogrio')
+
+from osmd.visualization.dashboard import _flatgeobuf, _geojson_seq
+
+
+@pytest.fixture
+def layer() -> gpd.GeoDataFrame:
+    """Two features, one with a missing name, both with OSM tag dicts."""
+    return gpd.GeoDataFrame(
+        {
+            'name': [None, 'Praça da Sé'],
+            'tags': [{'building': 'yes', 'levels': '3'}, {}],
+        },
+        geometry=[Point(-46.63, -23.55), Point(-46.64, -23.56)],
+        crs='EPSG:4326'
+    )
+
+
+def test_geojson_seq_round_trip(layer):
+    features = [json.loads(line) for line in _geojson_seq(layer).decode().splitlines() if line]
+    
+    assert len(features) == len(layer)
+    
+    properties = [feature['properties'] for feature in features]
+    assert properties[0]['name'] is None
+    assert properties[1]['name'] == 'Praça da Sé'
+    assert [json.loads(p['tags']) for p in properties] == list(layer['tags'])
+
+
+def test_flatgeobuf_round_trip(layer, tmp_path):
+    path = tmp_path / 'layer.fgb'
+    path.write_bytes(_flatgeobuf(layer))
+    
+    result = gpd.read_file(path, engine='pyogrio')
+    
+    assert result['name'].isna().tolist() == [True, False]
+    assert result.loc[1, 'name'] == 'Praça da Sé'
+    assert [json.loads(tags) for tags in result['tags']] == list(layer['tags'])
@@ -0,0 +1,104 @@
+"""Tests for the helper functions."""
+
+import math
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+import shapely
+from shapely.geometry import Point, box
+
+from osmd.utils import (
+    classify_building_types, create_analysis_grid,
+    normalize_osm_tags, normalize_osm_tags_series
+)
+
+
+def _buildings(**columns) -> gpd.GeoDataFrame:
+    """Point 'buildings' carrying the given attribute columns."""
+    n = len(next(iter(columns.values())))
+    return gpd.GeoDataFrame(columns, geometry=[Point(i, 0) for i in range(n)], crs='EPSG:4326')
+
+
+def test_classify_building_types_from_tags_dicts():
+    buildings = _buildings(tags=[{'building': 'house'}, {'building': 'office'},
+                                 {'building': 'warehouse'}, {'building': 'school'},
+                                 {'building': 'yes'}, {}, None])
+    
+    classified = classify_building_types(buildings)
+    
+    assert classified['building_type'].tolist() == [
+        'residential', 'commercial', 'industrial', 'public', 'generic', 'other', 'other'
+    ]
+    assert 'building_type' not in buildings.columns
+
+
+def test_classify_building_types_from_flat_column():
+    buildings = _buildings(building=['apartments', 'retail', 'manufacture', 'hospital', 'true', None])
+    
+    classified = classify_building_types(buildings)
+    
+    assert classified['building_type'].tolist() == [
+        'residential', 'commercial', 'industrial', 'public', 'generic', 'other'
+    ]
+
+
+def test_classify_building_types_unknown_values():
+    buildings = _buildings(building=pd.Categorical(['castle', 'bunker', 'house']))
+    
+    assert classify_building_types(buildings)['building_type'].tolist() == ['other', 'other', 'residential']
+    assert classify_building_types(_buildings(name=['a', 'b']))['building_type'].tolist() == ['other', 'other']
+
+
+def test_classify_building_types_in_place():
+    buildings = _buildings(building=['house'])
+    
+    result = classify_building_types(buildings, copy=False)
+    
+    assert result is buildings
+    assert buildings['building_type'].tolist() == ['residential']
+
+
+@pytest.mark.parametrize('cells_x, cells_y', [(3.4, 2.7), (2.0, 2.0)])
+def test_create_analysis_grid_counts_and_coverage(cells_x, cells_y):
+    grid_size_km = 1.0
+    cell_deg = grid_size_km / 111.32
+    south, west = -23.6, -46.7
+    bbox = (south, west, south + cells_y * cell_deg, west + cells_x * cell_deg)
+    
+    grid = create_analysis_grid(bbox, grid_size_km)
+    
+    nx, ny = math.ceil(cells_x), math.ceil(cells_y)
+    assert len(grid) == nx * ny
+    assert grid['grid_id'].is_unique
+    
+    # Cells tile the bbox without gaps, overhanging it by less than one cell
+    assert shapely.union_all(grid.geometry.values).covers(box(west, south, bbox[3], bbox[2]))
+    grid_west, grid_south, grid_east, grid_north = grid.total_bounds
+    assert grid_west == pytest.approx(west) and grid_south == pytest.approx(south)
+    assert bbox[3] <= grid_east < bbox[3] + cell_deg
+    assert bbox[2] <= grid_north < bbox[2] + cell_deg
+    assert grid.geometry.area.to_numpy() == pytest.approx(cell_deg ** 2)
+
+
+def test_normalize_osm_tags_series_matches_scalar_version():
+    tags = pd.Series([
+        {'Building': ' YES ', 'name': 'Casa Azul', 'building:levels': 3},
+        {'highway': 'Street', 'oneway': None, 'width': float('nan')},
+        {'building': 'true', 'highway': 'road '},
+        {},
+        None,
+        {'building': '1', 'amenity': 'School'},
+    ], index=[10, 11, 12, 13, 14, 15])
+    
+    normalized = normalize_osm_tags_series(tags)
+    
+    assert normalized.index.equals(tags.index)
+    for original, result in zip(tags, normalized):
+        assert result == normalize_osm_tags(original or {})
+
+
+def test_normalize_osm_tags_series_without_tags():
+    tags = pd.Series([None, {}], dtype=object)
+    
+    assert normalize_osm_tags_series(tags).tolist() == [{}, {}]